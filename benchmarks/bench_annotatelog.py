@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+""" Peak memory and time of annotatelog against the former deep-copying annotation on a large game log. """
+
+# Standard library imports
+import os, sys
+import copy
+import json
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.gamelog as GAMELOG
+import pressgloss.helpers as helpers
+
+def deepcopyannotatelog(inlog, index): # type: ({}, []) -> {}
+  """
+  The annotatelog that deep-copied the whole game before rewriting messages, kept here as the baseline.
+
+  :param inlog: the parsed-from-JSON representation of a Diplomacy game log
+  :type inlog: {}
+  :param index: the game's message index from indexgame
+  :type index: []
+
+  :return: the annotated game log
+  :rtype: {}
+
+  """
+
+  retdict = copy.deepcopy(inlog)
+  retdict['id'] += '_gloss'
+  for curphase, phaseindex in zip(retdict['phases'], index):
+    if 'messages' in curphase:
+      for curmessage, curindexed in zip(curphase['messages'], phaseindex):
+        if curindexed is not None:
+          curmessage['message'] = GAMELOG.glossmessagetext(curmessage['message'], curindexed['gloss'])
+        else:
+          curmessage['message'] += ':\nGlobal messages not glossed.'
+
+  return retdict
+
+def main(): # type: () -> None
+  """ Annotates a game log made large by repeating the phases of a bundled log. """
+
+  repeats = 20
+  if len(sys.argv) > 1:
+    repeats = int(sys.argv[1])
+  with open(os.path.join(helpers.getresourcefolder(), 'umd_jata_cynn_4.json'), 'r', encoding='UTF-8') as jf:
+    game = json.load(jf)
+  index = GAMELOG.indexgame(game)
+  game['phases'] = [copy.deepcopy(curphase) for curphase in game['phases'] * repeats]
+  index = index * repeats
+  print('{} phases, {:.1f} MB of JSON'.format(len(game['phases']), len(json.dumps(game)) / 1e6))
+
+  for curname, curannotate in [('deep copy', deepcopyannotatelog), ('copy-free', GAMELOG.annotatelog)]:
+    tracemalloc.start()
+    started = time.perf_counter()
+    annotated = curannotate(game, index)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del annotated
+    print('{:<10} peak {:8.1f} MB {:8.2f} s'.format(curname, peak / 1e6, elapsed))
+
+if __name__ == '__main__':
+  main()
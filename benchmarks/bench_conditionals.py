@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+""" Rendering time for ever deeper conditionals and conjunctions, with the per-pass render context and as formenglish rendered before it. """
+
+# Standard library imports
+import os, sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+
+def oldformenglish(utterance): # type: (PressUtterance) -> str
+  """
+  PressUtterance.formenglish as it was before the render context, kept here as the baseline: every message is formed
+  as often as it is asked for, and the tree is walked again afterwards to let go of the text.
+
+  :param utterance: a seeded utterance
+  :type utterance: PressUtterance
+
+  :return: the English expression
+  :rtype: str
+  """
+
+  utterance.rng.seed(utterance.seed)
+  try:
+    english = utterance.content.formenglish()
+  except Exception:
+    english = 'Ahem.'
+  utterance.content.releasetext()
+
+  return english
+
+def nested(depth): # type: (int) -> str
+  """
+  Nests conjunctions, disjunctions and conditionals within each other.
+
+  :param depth: how many levels to nest
+  :type depth: int
+
+  :return: the arrangement, without its press operator
+  :rtype: str
+  """
+
+  if depth == 0:
+    return 'PCE (ENG FRA)'
+  inner = nested(depth - 1)
+  if depth % 2 == 1:
+    return 'AND (ORR (' + inner + ') (DRW)) (NOT (SLO (ENG)))'
+
+  return 'IFF (' + inner + ') (PRP (AND (DMZ (ENG) (BEL)) (' + inner + ')))'
+
+def main(): # type: () -> None
+  """ Renders conditionals nested deeper and deeper, each way, and reports the time for each render. """
+
+  rounds = 2000
+  if len(sys.argv) > 1:
+    rounds = int(sys.argv[1])
+
+  for curdepth in range(1, 7):
+    for curtemplate in ['IFF ({}) (PRP (DRW))', 'YES (IFF ({}) (PRP (DRW)))']:
+      utterance = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (' + curtemplate.format(nested(curdepth)) + ')', ['Objective'], seed=curdepth)
+      utterance.formenglish()
+      if oldformenglish(utterance) != utterance.english:
+        raise ValueError('The render context changed the English for depth ' + str(curdepth))
+      messages = 0
+      pending = [utterance.content]
+      while len(pending) > 0:
+        messages += 1
+        pending.extend(pending.pop().children())
+      timings = []
+      for curname, curform in [('before', oldformenglish), ('render context', lambda curutterance: curutterance.formenglish())]:
+        started = time.perf_counter()
+        for curround in range(rounds):
+          curform(utterance)
+        timings.append('{} {:7.1f} us'.format(curname, (time.perf_counter() - started) / rounds * 1e6))
+      print('depth {} {:<5} {:4} messages  {}'.format(curdepth, curtemplate[:3], messages, '  '.join(timings)))
+
+if __name__ == '__main__':
+  main()
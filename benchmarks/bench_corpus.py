@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+""" Throughput and peak memory of corpus.writecorpus against building the training list in memory first. """
+
+# Standard library imports
+import os, sys
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+import pressgloss.helpers as helpers
+
+def listcorpus(outpath, count): # type: (str, int) -> None
+  """
+  The way fine_tuned_model.add_to_training_list made a corpus, kept here as the baseline: every pair
+  is held in a list which is written out at the end.
+
+  :param outpath: the location on disk to write the corpus
+  :type outpath: str
+  :param count: how many pairs to write
+  :type count: int
+
+  """
+
+  training_list = []
+  for curiter in range(count):
+    tones = random.sample(helpers.tonelist, random.randint(1, 3))
+    utterance = PRESSGLOSS.PressUtterance(None, tones)
+    english = ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english
+    training_list.append({'prompt': english, "completion": utterance.daide})
+  helpers.dicts_to_jsonl(training_list, outpath)
+
+def main(): # type: () -> None
+  """ Writes a corpus each way and reports pairs per second and peak memory. """
+
+  count = 20000
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+  workers = 1
+  if len(sys.argv) > 2:
+    workers = int(sys.argv[2])
+
+  workfolder = tempfile.mkdtemp()
+  try:
+    for curname, curwrite in [('in memory', lambda outpath: listcorpus(outpath, count)),
+                              ('streaming', lambda outpath: CORPUS.writecorpus(outpath, count, seed=1, workers=workers))]:
+      tracemalloc.start()
+      started = time.perf_counter()
+      curwrite(os.path.join(workfolder, curname.replace(' ', '') + '.jsonl'))
+      elapsed = time.perf_counter() - started
+      peak = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+      print('{:<10} {:10.0f} pairs/s peak {:8.1f} MB'.format(curname, count / elapsed, peak / 1e6))
+  finally:
+    shutil.rmtree(workfolder)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+""" Micro-benchmark of helpers.daide2lists against the former regex-chain implementation. """
+
+# Standard library imports
+import os, sys
+import json
+import re
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.helpers as helpers
+from tests.test_basic import parsetests, dmzexprs
+
+def regexdaide2lists(daide): # type: (str) -> []
+  """
+  The regex-chain parser that daide2lists used before the single-pass tokenizer,
+  kept here as the baseline.
+
+  :param daide: a press utterance in DAIDE syntax
+  :type daide: str
+
+  :return: a nested list representation
+  :rtype: []
+
+  """
+
+  metamorphosis = '(' + daide.strip().upper() + ')'
+  metamorphosis = re.sub(r'\( +', r'(', metamorphosis)
+  metamorphosis = re.sub(r' +\)', r')', metamorphosis)
+  metamorphosis = re.sub(r'\)([A-Z])', r') \1', metamorphosis)
+  metamorphosis = re.sub(r'([A-Z])\(', r'\1 (', metamorphosis)
+  metamorphosis = re.sub(r' +', r' ', metamorphosis)
+  metamorphosis = re.sub(r'\(([A-Z]+) ([ENS])CS\)', r'\1\2CS', metamorphosis)
+  metamorphosis = re.sub(r'([A-Z]+)/([ENS])CS?', r'\1\2CS', metamorphosis)
+  metamorphosis = re.sub(r'([A-Z]+)', r'"\1"', metamorphosis)
+  metamorphosis = re.sub(r' ', r', ', metamorphosis)
+  metamorphosis = re.sub(r'\(', r'[', metamorphosis)
+  metamorphosis = re.sub(r'\)', r']', metamorphosis)
+
+  try:
+    return json.loads(metamorphosis)
+  except ValueError:
+    return []
+
+def main(): # type: () -> None
+  """ Times both parsers over the parse and DMZ test corpora. """
+
+  corpus = parsetests + dmzexprs
+  for curdaide in corpus:
+    assert helpers.daide2lists(curdaide) == regexdaide2lists(curdaide), curdaide
+
+  repeats = 2000
+  for curname, curparser in [('regex chain', regexdaide2lists), ('tokenizer', helpers.daide2lists)]:
+    elapsed = min(timeit.repeat(lambda: [curparser(curdaide) for curdaide in corpus], number=repeats, repeat=5))
+    permsg = elapsed / (repeats * len(corpus)) * 1e6
+    print('{:<12} {:8.2f} us/expression'.format(curname, permsg))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+""" Node construction throughput of messageFactory: operator registry versus the former if/elif chain. """
+
+# Standard library imports
+import os, sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.helpers as helpers
+from tests import test_basic
+
+def chainmessageFactory(utterance, container, daidelists): # type: (PRESSGLOSS.PressUtterance, PRESSGLOSS.PressMessage, []) -> PRESSGLOSS.PressMessage
+  """
+  The if/elif messageFactory that preceded the operator registry, kept here as the baseline.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: PRESSGLOSS.PressUtterance
+  :param container: the DAIDE message that contains this one
+  :type container: PRESSGLOSS.PressMessage
+  :param daidelists: the parsed nested DAIDE expression
+  :type daidelists: []
+
+  :return: a DAIDE message
+  :rtype: PRESSGLOSS.PressMessage
+
+  """
+
+  if daidelists is None or len(daidelists) == 0:
+    return PRESSGLOSS.PressMessage(utterance, container)
+
+  if daidelists[0] == 'FCT':
+    return PRESSGLOSS.PressFact(utterance, container, daidelists)
+  elif daidelists[0] == 'PRP':
+    return PRESSGLOSS.PressProposal(utterance, container, daidelists)
+  elif daidelists[0] == 'YES':
+    return PRESSGLOSS.PressAccept(utterance, container, daidelists)
+  elif daidelists[0] == 'REJ':
+    return PRESSGLOSS.PressReject(utterance, container, daidelists)
+  elif daidelists[0] == 'CCL':
+    return PRESSGLOSS.PressCancel(utterance, container, daidelists)
+  elif daidelists[0] == 'HUH':
+    return PRESSGLOSS.PressHuh(utterance, container, daidelists)
+  elif daidelists[0] == 'BWX':
+    return PRESSGLOSS.PressIgnore(utterance, container, daidelists)
+  elif daidelists[0] == 'PCE':
+    return PRESSGLOSS.PressPeace(utterance, container, daidelists)
+  elif daidelists[0] == 'ALY':
+    return PRESSGLOSS.PressAlliance(utterance, container, daidelists)
+  elif daidelists[0] == 'DMZ':
+    return PRESSGLOSS.PressDMZ(utterance, container, daidelists)
+  elif daidelists[0] == 'DRW':
+    return PRESSGLOSS.PressDraw(utterance, container, daidelists)
+  elif daidelists[0] == 'SLO':
+    return PRESSGLOSS.PressSolo(utterance, container, daidelists)
+  elif daidelists[0] == 'ORR':
+    return PRESSGLOSS.PressOr(utterance, container, daidelists)
+  elif daidelists[0] == 'AND':
+    return PRESSGLOSS.PressAnd(utterance, container, daidelists)
+  elif daidelists[0] == 'IFF':
+    return PRESSGLOSS.PressIf(utterance, container, daidelists)
+  elif daidelists[0] == 'NOT':
+    return PRESSGLOSS.PressNot(utterance, container, daidelists)
+  elif daidelists[0] == 'NAR':
+    return PRESSGLOSS.PressNar(utterance, container, daidelists)
+  elif daidelists[0] == 'XDO':
+    return PRESSGLOSS.PressMoveExecute(utterance, container, daidelists)
+  elif len(daidelists) == 2 and daidelists[1] == 'HLD':
+    return PRESSGLOSS.PressHold(utterance, container, daidelists)
+  elif len(daidelists) == 3 and daidelists[1] == 'MTO':
+    return PRESSGLOSS.PressMoveInto(utterance, container, daidelists)
+  elif len(daidelists) == 3 and daidelists[1] == 'SUP':
+    return PRESSGLOSS.PressSupportHold(utterance, container, daidelists)
+  elif len(daidelists) == 5 and daidelists[1] == 'SUP' and daidelists[3] == 'MTO':
+    return PRESSGLOSS.PressSupportMove(utterance, container, daidelists)
+  elif len(daidelists) == 5 and daidelists[1] == 'CVY' and daidelists[3] == 'CTO':
+    return PRESSGLOSS.PressConvoy(utterance, container, daidelists)
+  elif len(daidelists) == 5 and daidelists[1] == 'CTO' and daidelists[3] == 'VIA':
+    return PRESSGLOSS.PressConvoyVia(utterance, container, daidelists)
+  elif len(daidelists) == 3 and daidelists[1] == 'RTO':
+    return PRESSGLOSS.PressRetreat(utterance, container, daidelists)
+  elif len(daidelists) == 2 and daidelists[1] == 'DSB':
+    return PRESSGLOSS.PressDisband(utterance, container, daidelists)
+  elif len(daidelists) == 2 and daidelists[1] == 'BLD':
+    return PRESSGLOSS.PressBuild(utterance, container, daidelists)
+  elif len(daidelists) == 2 and daidelists[1] == 'REM':
+    return PRESSGLOSS.PressRemove(utterance, container, daidelists)
+  elif len(daidelists) == 2 and daidelists[1] == 'WVE':
+    return PRESSGLOSS.PressWaive(utterance, container, daidelists)
+  else:
+    return PRESSGLOSS.PressMessage(utterance, container)
+
+def main(): # type: () -> None
+  """ Builds the message trees of every test expression with each factory. """
+
+  corpus = test_basic.parsetests + test_basic.dmzexprs + test_basic.peaceexprs + test_basic.allianceexprs + \
+           test_basic.drawexprs + test_basic.soloexprs + test_basic.moveexprs + test_basic.compositions
+  utterance = PRESSGLOSS.PressUtterance(corpus[0], [], glossing=False)
+  contents = [helpers.daide2lists(curdaide)[3] for curdaide in corpus]
+  registryfactory = PRESSGLOSS.messageFactory
+
+  repeats = 200
+  for curname, curfactory in [('if/elif chain', chainmessageFactory), ('registry', registryfactory)]:
+    PRESSGLOSS.messageFactory = curfactory
+    elapsed = min(timeit.repeat(lambda: [PRESSGLOSS.messageFactory(utterance, None, curcontent) for curcontent in contents], number=repeats, repeat=5))
+    print('{:<14} {:10.0f} trees/s'.format(curname, repeats * len(contents) / elapsed))
+  PRESSGLOSS.messageFactory = registryfactory
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+""" Time to build few-shot prompts from random utterances against selecting them from the saved pool, and how many distinct prompt prefixes each makes. """
+
+# Standard library imports
+import os, sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+import pressgloss.translator as TRANSLATOR
+
+def randomgloss(tones): # type: ([]) -> []
+  """
+  The way gloss2daide padded its prompt, kept here as the baseline: four fresh random utterances per call.
+
+  :param tones: the tones of the utterances
+  :type tones: []
+
+  :return: the few-shot chat messages
+  :rtype: []
+  """
+
+  gloss = []
+  while len(gloss) < 8:
+    utterance = PRESSGLOSS.PressUtterance(None, tones)
+    english = ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english
+    gloss.extend([{'role': 'user', 'content': english},
+                  {'role': 'assistant', 'content': utterance.daide}])
+
+  return gloss
+
+def main(): # type: () -> None
+  """ Builds prompts for the same inputs both ways and reports microseconds per prompt and distinct prefixes. """
+
+  count = 400
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  englishes = [curexample['prompt'] for curexample in CORPUS.generatechunk(0, count, seed=11)]
+  pool = TRANSLATOR.getfewshotpool()
+  for curname, curbuild, curclear in [('random', lambda curenglish: randomgloss(['Objective']), lambda: None),
+                                      ('pool', pool.select, pool.familycache.clear),
+                                      ('repeated', pool.select, lambda: None)]:
+    elapsed = min(timeit.repeat(lambda: [curbuild(curenglish) for curenglish in englishes], setup=curclear, number=1, repeat=3))
+    prefixes = set([tuple([curmessage['content'] for curmessage in curbuild(curenglish)]) for curenglish in englishes])
+    print('{:<9} {:10.1f} us/prompt {:6} distinct prefixes in {} prompts'.format(curname, elapsed / count * 1e6, len(prefixes), count))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+""" Cold-start time of python -m pressgloss --operation translate, with the heaviest imports from -X importtime. """
+
+# Standard library imports
+import os, sys
+import statistics
+import subprocess
+import time
+
+repofolder = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+translateargs = ['-m', 'pressgloss', '--operation', 'translate', '--daide', 'FRM (ENG) (FRA ITA) (PRP (PCE (FRA ITA)))', '--tones', 'Objective']
+
+def importtimes(stderr): # type: (str) -> []
+  """
+  Reads the output of -X importtime.
+
+  :param stderr: what the interpreter wrote to stderr
+  :type stderr: str
+
+  :return: (cumulative microseconds, module name) for each import, slowest first
+  :rtype: []
+
+  """
+
+  rettimes = []
+  for curline in stderr.splitlines():
+    if curline.startswith('import time:') and '|' in curline:
+      selftime, cumulative, modulename = curline[len('import time:'):].split('|')
+      if cumulative.strip().isdigit():
+        rettimes.append((int(cumulative), modulename.rstrip()))
+  rettimes.sort(reverse=True)
+
+  return rettimes
+
+def main(): # type: () -> None
+  """ Runs the translate operation in fresh interpreters and reports wall-clock and import times. """
+
+  runs = 10
+  if len(sys.argv) > 1:
+    runs = int(sys.argv[1])
+
+  walltimes = []
+  for currun in range(runs):
+    started = time.perf_counter()
+    subprocess.run([sys.executable] + translateargs, cwd=repofolder, capture_output=True, check=True)
+    walltimes.append(time.perf_counter() - started)
+  print('translate cold start: median {:.3f} s, best {:.3f} s over {} runs'.format(statistics.median(walltimes), min(walltimes), runs))
+
+  profiled = subprocess.run([sys.executable, '-X', 'importtime'] + translateargs, cwd=repofolder, capture_output=True, text=True, check=True)
+  for cumulative, modulename in [curtime for curtime in importtimes(profiled.stderr) if not curtime[1].startswith('    ')][:10]:
+    print('{:10.1f} ms {}'.format(cumulative / 1000, modulename.strip()))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+""" Memory held by a million parsed utterances, and by glossed utterances with and without the English kept on every message. """
+
+# Standard library imports
+import os, sys
+import gc
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+
+def measure(name, daides, count, build): # type: (str, [], int, callable) -> None
+  """
+  Builds and holds count utterances from the DAIDE, round robin, and reports the memory they hold.
+
+  :param name: what is being measured
+  :type name: str
+  :param daides: the distinct DAIDE to build from
+  :type daides: []
+  :param count: how many utterances to hold
+  :type count: int
+  :param build: makes an utterance from DAIDE
+  :type build: callable
+  """
+
+  gc.collect()
+  tracemalloc.start()
+  started = time.perf_counter()
+  held = [build(daides[curindex % len(daides)]) for curindex in range(count)]
+  elapsed = time.perf_counter() - started
+  current, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  print('{:<24} {:9} utterances {:9.1f} MB {:7.0f} bytes/utterance {:6.1f} s'.format(name, len(held), current / 2**20, current / len(held), elapsed))
+
+def main(): # type: () -> None
+  """ Parses a corpus of distinct DAIDE over and over, as a tournament's worth of press, and reports the memory held. """
+
+  count = 1000000
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  # few enough distinct DAIDE to stay in the parse cache, as repeated press does, so what is measured is the message trees
+  daides = [curexample['completion'] for curexample in CORPUS.iteratecorpus(min(count, 4000), seed=7)]
+  # warm the parse cache, which is shared and bounded, so it is not counted against the utterances
+  for curdaide in daides:
+    PRESSGLOSS.PressUtterance(curdaide, glossing=False)
+
+  measure('parsed', daides, count, lambda curdaide: PRESSGLOSS.PressUtterance(curdaide, glossing=False))
+  glossedcount = max(count // 10, 1)
+  for curname, curretain in [('glossed, text released', False), ('glossed, text retained', True)]:
+    def glossed(curdaide, curretain=curretain):
+      utterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective'], retaintext=curretain)
+      utterance.formenglish()
+      return utterance
+    measure(curname, daides, glossedcount, glossed)
+
+if __name__ == '__main__':
+  main()
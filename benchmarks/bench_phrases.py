@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+""" The cost of choosing a wording from a phrase bank against the inline lists core.py built on every choice, and glossing throughput with the banks. """
+
+# Standard library imports
+import os, sys
+import time
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+import pressgloss.helpers as helpers
+
+def inlinechoice(rng): # type: (random.Random) -> str
+  """
+  A choice as core.py made them before the phrase banks, kept here as the baseline: a new list every call.
+
+  :param rng: the random number generator to draw from
+  :type rng: random.Random
+
+  :return: the wording
+  :rtype: str
+  """
+
+  return rng.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition'])
+
+def bankchoice(rng): # type: (random.Random) -> str
+  """
+  The same choice from its phrase bank, as core.py makes it now.
+
+  :param rng: the random number generator to draw from
+  :type rng: random.Random
+
+  :return: the wording
+  :rtype: str
+  """
+
+  return rng.choice(helpers.phrasebanks['alliance'])
+
+def main(): # type: () -> None
+  """ Times a million choices each way, then glosses a corpus. """
+
+  count = 1000000
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  print('{} phrase banks, {} wordings'.format(len(helpers.phrasebanks), sum([len(curbank) for curbank in helpers.phrasebanks.values()])))
+  for curname, curchoose in [('inline list', inlinechoice), ('phrase bank', bankchoice)]:
+    rng = random.Random(0)
+    started = time.perf_counter()
+    for curindex in range(count):
+      curchoose(rng)
+    elapsed = time.perf_counter() - started
+    print('{:<12} {:7.1f} ns/choice'.format(curname, elapsed / count * 1e9))
+
+  daides = [curexample['completion'] for curexample in CORPUS.iteratecorpus(2000, seed=3)]
+  started = time.perf_counter()
+  for curindex, curdaide in enumerate(daides):
+    PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=curindex).formenglish()
+  print('{:<12} {:7.1f} us/gloss'.format('glossing', (time.perf_counter() - started) / len(daides) * 1e6))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+""" Peak memory and time of the streaming prettifygamefile against loading the whole game log on a large log file. """
+
+# Standard library imports
+import os, sys
+import json
+import shutil
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.gamelog as GAMELOG
+import pressgloss.helpers as helpers
+
+def loadprettifygamefile(inpath, outpath): # type: (str, str) -> None
+  """
+  The prettifygamefile that loaded the whole game log before writing it, kept here as the baseline.
+
+  :param inpath: the location on disk of the JSON game log
+  :type inpath: str
+  :param outpath: the location on disk to write the pretty JSON game log
+  :type outpath: str
+
+  """
+
+  with open(inpath, 'r', encoding='UTF-8') as jf:
+    curgame = json.load(jf)
+  with open(outpath, 'w', encoding='UTF-8') as of:
+    json.dump(curgame, of, indent=2)
+
+def main(): # type: () -> None
+  """ Prettifies a game log file made large by repeating the phases of a bundled log. """
+
+  repeats = 20
+  if len(sys.argv) > 1:
+    repeats = int(sys.argv[1])
+  with open(os.path.join(helpers.getresourcefolder(), 'umd_jata_cynn_4.json'), 'r', encoding='UTF-8') as jf:
+    game = json.load(jf)
+  game['phases'] = game['phases'] * repeats
+
+  workfolder = tempfile.mkdtemp()
+  try:
+    inpath = os.path.join(workfolder, 'game.json')
+    with open(inpath, 'w', encoding='UTF-8') as of:
+      json.dump(game, of)
+    print('{} phases, {:.1f} MB of JSON'.format(len(game['phases']), os.path.getsize(inpath) / 1e6))
+    del game
+
+    outputs = []
+    for curname, curprettify in [('load all', loadprettifygamefile), ('streaming', GAMELOG.prettifygamefile)]:
+      outpath = os.path.join(workfolder, curname.replace(' ', '') + '.json')
+      tracemalloc.start()
+      started = time.perf_counter()
+      curprettify(inpath, outpath)
+      elapsed = time.perf_counter() - started
+      peak = tracemalloc.get_traced_memory()[1]
+      tracemalloc.stop()
+      print('{:<10} peak {:8.1f} MB {:8.2f} s'.format(curname, peak / 1e6, elapsed))
+      with open(outpath, 'r', encoding='UTF-8') as of:
+        outputs.append(of.read())
+    assert outputs[0] == outputs[1]
+  finally:
+    shutil.rmtree(workfolder)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+""" Time to load the reference data and to test membership in the reference tables, before and after freezing them. """
+
+# Standard library imports
+import os, sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.helpers as helpers
+
+def main(): # type: () -> None
+  """ Times CSV parsing against the snapshot, and list against frozenset membership. """
+
+  repeats = 2000
+  for curname, curload in [('parse CSV', helpers.readreference), ('snapshot', helpers.loadreference)]:
+    elapsed = min(timeit.repeat(curload, number=repeats, repeat=5))
+    print('{:<10} {:8.1f} us/load'.format(curname, elapsed / repeats * 1e6))
+
+  tokens = ['LON', 'NTH', 'ENG', 'AMY', 'XXX', 'VEN', 'BLA', 'TUR'] * 10
+  for curname, curtable in [('sea list', list(helpers.sealist)), ('sea set', helpers.seaset),
+                            ('power list', list(helpers.powerlist)), ('power set', helpers.powerset)]:
+    elapsed = min(timeit.repeat(lambda: [curtoken in curtable for curtoken in tokens], number=repeats * 10, repeat=5))
+    print('{:<10} {:8.1f} ns/test'.format(curname, elapsed / (repeats * 10 * len(tokens)) * 1e9))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,238 @@
+# -*- coding: utf-8 -*-
+""" Time, parses and success of repair.RepairEngine against the loop grammar_cleaner used to run, over a corpus of malformed model outputs. """
+
+# Standard library imports
+import os, sys
+import re
+import time
+import random
+import importlib.util
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.corpus as CORPUS
+import pressgloss.helpers as helpers
+import pressgloss.repair as REPAIR
+
+# Used only when daidepp is not installed: the part of the DAIDE press grammar the corpus below uses, with daidepp's rule names
+standingrammar = r'''
+message = "FRM" ws lpar powers rpar ws lpar powers rpar ws lpar press_message rpar
+press_message = prp / yes / rej / ccl / fct / huh
+prp = "PRP" ws lpar arrangement rpar
+yes = "YES" ws lpar press_message rpar
+rej = "REJ" ws lpar press_message rpar
+ccl = "CCL" ws lpar press_message rpar
+huh = "HUH" ws lpar press_message rpar
+fct = "FCT" ws lpar arrangement rpar
+arrangement = pce / aly / dmz / drw / slo / xdo / and / orr / not / nar
+pce = "PCE" ws lpar powers rpar
+aly = "ALY" ws lpar powers rpar ws "VSS" ws lpar powers rpar
+dmz = "DMZ" ws lpar powers rpar ws lpar provinces rpar
+drw = "DRW" (ws lpar powers rpar)?
+slo = "SLO" ws lpar power rpar
+xdo = "XDO" ws lpar order rpar
+and = "AND" (ws lpar arrangement rpar)+
+orr = "ORR" (ws lpar arrangement rpar)+
+not = "NOT" ws lpar arrangement rpar
+nar = "NAR" ws lpar arrangement rpar
+order = lpar unit rpar ws (mto / sup / hld / rto / dsb / bld / rem / cvy / cto)
+unit = power ws unit_type ws province
+mto = "MTO" ws province
+rto = "RTO" ws province
+sup = "SUP" ws lpar unit rpar (ws "MTO" ws province)?
+cvy = "CVY" ws lpar unit rpar ws "CTO" ws province
+cto = "CTO" ws province (ws "VIA" ws lpar provinces rpar)?
+hld = "HLD"
+dsb = "DSB"
+bld = "BLD"
+rem = "REM"
+unit_type = "AMY" / "FLT"
+provinces = province (ws province)*
+province = ~"[A-Z]{3}([NESW]CS)?"
+powers = power (ws power)*
+power = "AUS" / "ENG" / "FRA" / "GER" / "ITA" / "RUS" / "TUR"
+ws = ~" *"
+lpar = "(" ws
+rpar = ws ")"
+'''
+
+def olderrorfetch(string, grammar): # type: (str, object) -> ()
+  """ error_fetch as it was, parsing every time. """
+
+  try:
+    grammar.parse(string)
+    return 'No Error', None
+  except Exception as e:
+    error = str(e)
+    error_types = re.findall(r"\s'(.*?)'\s", error)
+    if len(error_types) == 0:
+      return error, None
+    return error, error_types[0]
+
+def oldgrammarcleaner(daide_attempt, grammar): # type: (str, object) -> str
+  """ grammar_cleaner as it was, kept here as the baseline, without its prints. """
+
+  i = 0
+  daide_attempt = daide_attempt.upper()
+  daide_attempt = re.sub(r'\n\n###\n\n', '', daide_attempt)
+  if not daide_attempt.startswith('FRM ('):
+    daide_attempt = 'FRM (' + daide_attempt
+  error, error_type = olderrorfetch(daide_attempt, grammar)
+  string = daide_attempt
+  while error != 'No Error' and i < 10:
+    string = re.sub(r'\sBNC\([A-Z]*\)', '', string)
+    string = re.sub(r'\sA\s', ' AMY ', string)
+    string = re.sub(r'\sF\s', ' FLT ', string)
+    string = re.sub(r'\sFLE\s', ' FLT ', string)
+    if string.count('(') > string.count(')'):
+      string = string + ')'
+    elif string.count('(') < string.count(')'):
+      string = string[:-1]
+    error, error_type = olderrorfetch(string, grammar)
+    tokens = re.findall(r'[\s\(\)]*([A-Z]{3})[\s\(\)]*', string)
+    arrangements = []
+    error_bits = re.findall(r"\s'(.*?)'[\s]*", error)
+    if len(error_bits) > 1:
+      message_mismatch = re.findall(r"\s'(.*?)'[\s]*", error)[1]
+      message_mismatch = re.sub(r'\(', r'\(', message_mismatch)
+      message_mismatch = re.sub(r'\)', r'\)', message_mismatch)
+    else:
+      message_mismatch = None
+    for token in tokens:
+      if token in helpers.arrangement_list:
+        arrangements.append(token)
+    if 'AND' and 'PRP' in tokens:
+      string = re.sub(r'(?<=PRP\()(.*?)(?=AND)', '', string)
+    if error_type == 'message':
+      if string[:3] in helpers.arrangement_list:
+        string = 'PRP(' + string + ')'
+      if error[:38] == "Rule 'message' matched in its entirety":
+        try:
+          string = re.sub(r'\s' + message_mismatch, '', string)
+        except re.error:
+          pass
+      error, error_type = olderrorfetch(string, grammar)
+    elif error_type == 'rpar' or error_type == 'lpar':
+      if len(arrangements) > 1 and 'AND' not in tokens:
+        string = re.sub(r'PRP\(', 'PRP(AND ', string)
+      if 'AND' in tokens:
+        string = helpers.add_paranthesis(r'PCE\(.*?\)(?=\s)', string)
+        string = helpers.add_paranthesis(r'(?<=\s)DMZ[\s]*\(.*?\)[\s]*\(.*?\)', string)
+        string = helpers.add_paranthesis(r'ALY\(.*?\)[\s]*VSS[\s]*\(.*?\)(?=\s)', string)
+        string = helpers.add_paranthesis(r'XDO\(.*?\).*?\)(?<=\s)', string)
+      error, error_type = olderrorfetch(string, grammar)
+    elif error_type == 'arrangement':
+      if message_mismatch is None:
+        return string
+      message_mismatch = message_mismatch[:3]
+      if 'VSS' in tokens:
+        string = re.sub(message_mismatch, 'ALY', string)
+        string = re.sub(r'(?<=ALY\(.{7}?\))(.*?)(?=VSS)', '', string)
+      else:
+        string = re.sub(message_mismatch, 'PCE', string)
+      error, error_type = olderrorfetch(string, grammar)
+    elif error_type == 'press_message':
+      if string[:3] == 'YES' and 'PRP' not in tokens:
+        string = string[:3] + '(PRP' + string[3:] + ')'
+      error, error_type = olderrorfetch(string, grammar)
+    i += 1
+
+  if error != 'No Error':
+    return daide_attempt
+  return string
+
+def corrupt(daide, rng): # type: (str, random.Random) -> str
+  """
+  Damages DAIDE the ways models do.
+
+  :param daide: valid DAIDE
+  :type daide: str
+  :param rng: the random number generator to draw from
+  :type rng: random.Random
+
+  :return: the damaged DAIDE
+  :rtype: str
+  """
+
+  kind = rng.choice(['lowercase', 'unclosed', 'prose', 'chatter', 'bare', 'unit', 'bnc', 'junk', 'extra', 'fence'])
+  if kind == 'lowercase':
+    return daide.lower()
+  if kind == 'unclosed':
+    return daide[:len(daide) - rng.randint(1, 3)]
+  if kind == 'prose':
+    return 'Sure, here is the DAIDE: ' + daide
+  if kind == 'chatter':
+    return daide + ' Let me know if you need anything else.'
+  if kind == 'bare':
+    return re.sub(r'\(PRP \((.*)\)\)$', r'(\1)', daide)
+  if kind == 'unit':
+    return daide.replace(' AMY ', ' A ').replace(' FLT ', ' F ')
+  if kind == 'bnc':
+    return daide.replace(') (', ') BNC(XXX) (', 1)
+  if kind == 'junk':
+    words = daide.split(' ')
+    words.insert(rng.randint(3, len(words) - 1), 'THE')
+    return ' '.join(words)
+  if kind == 'extra':
+    return daide + ')'
+
+  return '```\n' + daide + '\n```'
+
+def main(): # type: () -> None
+  """ Repairs the same malformed outputs both ways, cold and then repeated, and reports time, parses and successes. """
+
+  count = 1000
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  if importlib.util.find_spec('daidepp') is not None:
+    grammar = helpers.getgrammar()
+    print('grammar: daidepp')
+  else:
+    import parsimonious
+    grammar = parsimonious.Grammar(standingrammar)
+    print('grammar: stand-in for daidepp, which is not installed')
+
+  rng = random.Random(0)
+  valid = [curexample['completion'] for curexample in CORPUS.iteratecorpus(count * 4, seed=2, operators={'PRP': 3, 'YES': 1, 'REJ': 1, 'FCT': 1})
+           if olderrorfetch(curexample['completion'], grammar)[0] == 'No Error'][:count]
+  malformed = [corrupt(curdaide, rng) for curdaide in valid]
+
+  parses = [0]
+  def countingparse(daide):
+    parses[0] += 1
+    return grammar.parse(daide)
+  class CountingGrammar:
+    parse = staticmethod(countingparse)
+
+  crashes = [0]
+  def oldrepair(curattempt):
+    try:
+      return oldgrammarcleaner(curattempt, CountingGrammar)
+    except re.error:
+      # the old cleaner made regular expressions out of parse errors, which do not always compile
+      crashes[0] += 1
+      return curattempt
+
+  started = time.perf_counter()
+  oldresults = [oldrepair(curattempt) for curattempt in malformed]
+  elapsed = time.perf_counter() - started
+  oldrepaired = sum([olderrorfetch(curresult, grammar)[0] == 'No Error' for curresult in oldresults])
+  print('{:<16} {:8.1f} us/output {:6.2f} parses/output {:5} of {} repaired'.format('grammar_cleaner', elapsed / len(malformed) * 1e6, parses[0] / len(malformed), oldrepaired, len(malformed)))
+  print('grammar_cleaner raised re.error on {} outputs'.format(crashes[0]))
+
+  engine = REPAIR.RepairEngine(grammar.parse)
+  for curname in ['engine', 'engine, repeated']:
+    started = time.perf_counter()
+    newresults = [engine.repair(curattempt) for curattempt in malformed]
+    elapsed = time.perf_counter() - started
+    newrepaired = sum([curresult['error'] is None for curresult in newresults])
+    newparses = sum([curresult['parses'] for curresult in newresults])
+    print('{:<16} {:8.1f} us/output {:6.2f} parses/output {:5} of {} repaired'.format(curname, elapsed / len(malformed) * 1e6, newparses / len(malformed), newrepaired, len(malformed)))
+  restored = sum([curresult['daide'] == curdaide for curresult, curdaide in zip(newresults, valid)])
+  print('engine restored the original DAIDE exactly for {} of {}'.format(restored, len(malformed)))
+  print({curkey: curvalue for curkey, curvalue in engine.report().items() if curkey.startswith('repair ')})
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+""" Garbage collections, their pauses and memory in use over a long run of glossing requests, as the Flask service makes them. """
+
+# Standard library imports
+import os, sys
+import gc
+import time
+import collections
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+
+def main(): # type: () -> None
+  """ Glosses DAIDE request after request, reporting memory in use as it goes and then the collections made by each generation. """
+
+  count = 200000
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  daides = [curexample['completion'] for curexample in CORPUS.iteratecorpus(min(count, 20000), seed=9)]
+  tones = [['Objective'], ['Friendly', 'Urgent'], ['Haughty'], ['Hostile', 'Expert']]
+
+  counts = collections.Counter()
+  pauses = collections.defaultdict(list)
+  started = [0.0]
+  def timecollection(phase, info):
+    if phase == 'start':
+      started[0] = time.perf_counter()
+    else:
+      pauses[info['generation']].append(time.perf_counter() - started[0])
+      counts[info['generation']] += 1
+  gc.collect()
+  gc.callbacks.append(timecollection)
+  try:
+    runstarted = time.perf_counter()
+    for curindex in range(count):
+      PRESSGLOSS.daide2gloss(daides[curindex % len(daides)], tones[curindex % len(tones)])
+      if (curindex + 1) % (count // 10) == 0:
+        print('{:9} requests {:10} blocks allocated'.format(curindex + 1, sys.getallocatedblocks()))
+    elapsed = time.perf_counter() - runstarted
+  finally:
+    gc.callbacks.remove(timecollection)
+
+  print('{:.1f} us/request'.format(elapsed / count * 1e6))
+  for curgeneration in range(3):
+    curpauses = pauses[curgeneration]
+    print('generation {}: {:6} collections, {:8.1f} ms in all, longest {:6.2f} ms'.format(curgeneration, counts[curgeneration], sum(curpauses) * 1e3,
+                                                                                       max(curpauses) * 1e3 if len(curpauses) > 0 else 0.0))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+""" Scaling of PressUtterance construction on deeply nested expressions, with and without per-node channel swims. """
+
+# Standard library imports
+import os, sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+
+def nestedexpression(depth): # type: (int) -> str
+  """
+  Builds a proposal whose content alternates AND and NOT down to the given depth,
+  with a move through the English Channel at every leaf.
+
+  :param depth: the number of nested AND/NOT levels
+  :type depth: int
+
+  :return: the DAIDE utterance
+  :rtype: str
+
+  """
+
+  content = 'XDO ((ENG FLT LON) MTO ENG)'
+  for clevel in range(depth):
+    if clevel % 2 == 0:
+      content = 'AND (' + content + ') (XDO ((FRA AMY PAR) MTO BUR))'
+    else:
+      content = 'NOT (' + content + ')'
+
+  return 'FRM (ENG) (FRA) (PRP (' + content + '))'
+
+def countswims(): # type: () -> []
+  """ Wraps every swimthechannel implementation with a call counter. """
+
+  counter = [0]
+  for curclass in [PRESSGLOSS.PressMessage] + PRESSGLOSS.PressMessage.__subclasses__():
+    if 'swimthechannel' in vars(curclass):
+      def counted(self, swim=vars(curclass)['swimthechannel']):
+        counter[0] += 1
+        swim(self)
+      curclass.swimthechannel = counted
+
+  return counter
+
+def main(): # type: () -> None
+  """ Times construction of 6 to 10 level expressions in linear and legacy per-node modes. """
+
+  counter = countswims()
+  linearfactory = PRESSGLOSS.messageFactory
+
+  def legacyfactory(utterance, container, daidelists):
+    message = linearfactory(utterance, container, daidelists)
+    message.swimthechannel()
+    return message
+
+  print('{:>5} {:>14} {:>14} {:>12} {:>12}'.format('depth', 'linear swims', 'legacy swims', 'linear us', 'legacy us'))
+  for curdepth in range(6, 11):
+    daide = nestedexpression(curdepth)
+    results = []
+    for curfactory in [linearfactory, legacyfactory]:
+      PRESSGLOSS.messageFactory = curfactory
+      counter[0] = 0
+      PRESSGLOSS.PressUtterance(daide, [])
+      swims = counter[0]
+      elapsed = min(timeit.repeat(lambda: PRESSGLOSS.PressUtterance(daide, []), number=200, repeat=3)) / 200 * 1e6
+      results.append((swims, elapsed))
+    PRESSGLOSS.messageFactory = linearfactory
+    print('{:>5} {:>14} {:>14} {:>12.1f} {:>12.1f}'.format(curdepth, results[0][0], results[1][0], results[0][1], results[1][1]))
+
+if __name__ == '__main__':
+  main()
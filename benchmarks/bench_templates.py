@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+""" Rendering throughput over every DAIDE the tests gloss, and the cost of choosing a template against the chain of tests formenglish used to make. """
+
+# Standard library imports
+import os, sys
+import re
+import time
+import collections
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+
+def chaintemplatename(message): # type: (PressMessage) -> str
+  """
+  The tests formenglish made of its containers before templates, kept here as the baseline, naming the branch they reached.
+
+  :param message: the message to form English for
+  :type message: PressMessage
+
+  :return: the name of the branch, or None if no branch was reached
+  :rtype: str
+  """
+
+  if message.container.operator == 'PRP':
+    if message.container.container is None or message.container.container.operator == 'IFF':
+      return 'prpenglish'
+    elif message.container.container.operator in ('YES', 'REJ', 'CCL', 'HUH'):
+      return message.container.container.operator.lower() + 'prpenglish'
+  elif message.container.operator in ('NOT', 'NAR'):
+    negation = message.container.operator.lower()
+    if message.container.container.operator == 'PRP':
+      if message.container.container.container is None or message.container.container.container.operator == 'IFF':
+        return 'prp' + negation + 'english'
+      elif message.container.container.container.operator in ('YES', 'REJ', 'CCL', 'HUH'):
+        return message.container.container.container.operator.lower() + 'prp' + negation + 'english'
+    elif message.container.container.operator == 'FCT':
+      if message.container.container.container is None:
+        return 'fct' + negation + 'english'
+      elif message.container.container.container.operator == 'HUH':
+        return 'huhfct' + negation + 'english'
+  elif message.container.operator == 'FCT':
+    if message.container.container is None:
+      return 'fctenglish'
+    elif message.container.container.operator == 'HUH':
+      return 'huhfctenglish'
+  else:
+    return 'listenglish'
+
+  return None
+
+def testdaides(): # type: () -> []
+  """
+  Collects the DAIDE glossed by tests/test_basic.py.
+
+  :return: the distinct DAIDE, in the order they appear
+  :rtype: []
+  """
+
+  with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tests', 'test_basic.py'), 'r', encoding='utf-8') as testfile:
+    found = re.findall(r"'(FRM \([A-Z ]+\) \([A-Z ]+\) \(.*?)'", testfile.read())
+
+  return list(dict.fromkeys(found))
+
+def main(): # type: () -> None
+  """ Glosses every DAIDE the tests do, reporting renders per second by template, then times choosing templates each way. """
+
+  rounds = 200
+  if len(sys.argv) > 1:
+    rounds = int(sys.argv[1])
+
+  utterances = []
+  for curdaide in testdaides():
+    curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective'])
+    if curutterance.glosserror is None:
+      utterances.append(curutterance)
+  messages = []
+  for curutterance in utterances:
+    pending = [curutterance.content] if curutterance.content is not None else []
+    while len(pending) > 0:
+      curmessage = pending.pop()
+      pending.extend([curchild for curchild in curmessage.children() if curchild is not None])
+      if curmessage.container is not None and hasattr(curmessage, 'prpenglish'):
+        messages.append(curmessage)
+
+  bytemplate = collections.defaultdict(list)
+  for curutterance in utterances:
+    templates = [curmessage.container.template for curmessage in messages if curmessage.utterance is curutterance]
+    bytemplate[(templates[0] or 'no template') if len(templates) > 0 else 'other'].append(curutterance.daide)
+  print('{} DAIDE from the tests, {} messages formed by template'.format(len(utterances), len(messages)))
+
+  total = 0
+  elapsedall = 0.0
+  for curtemplate in sorted(bytemplate):
+    daides = bytemplate[curtemplate]
+    started = time.perf_counter()
+    for curround in range(rounds):
+      for curdaide in daides:
+        PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=curround).formenglish()
+    elapsed = time.perf_counter() - started
+    total += rounds * len(daides)
+    elapsedall += elapsed
+    print('{:<20} {:4} DAIDE {:10.0f} renders/s'.format(curtemplate, len(daides), rounds * len(daides) / elapsed))
+  print('{:<20} {:4} DAIDE {:10.0f} renders/s'.format('all', len(utterances), total / elapsedall))
+
+  for curname, curchoose in [('chain of tests', chaintemplatename), ('template table', PRESSGLOSS.englishtemplate)]:
+    started = time.perf_counter()
+    for curround in range(rounds * 10):
+      for curmessage in messages:
+        curchoose(curmessage)
+    elapsed = time.perf_counter() - started
+    print('{:<20} {:8.1f} ns/choice'.format(curname, elapsed / (rounds * 10 * len(messages)) * 1e9))
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+""" Time of helpers.tonetize, and of whole glosses, for each tone in helpers.tonelist. """
+
+# Standard library imports
+import os, sys
+import random
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.helpers as helpers
+
+# One utterance of each kind of top-level press
+toneddaide = ['FRM (ENG) (FRA) (PRP (XDO ((ENG AMY LVP) MTO YOR)))',
+              'FRM (ENG) (FRA ITA) (PRP (PCE (FRA ITA)))',
+              'FRM (FRA) (ENG) (YES (PRP (XDO ((ENG AMY LVP) MTO YOR))))',
+              'FRM (FRA) (ENG) (REJ (PRP (ALY (ENG FRA) VSS (GER))))',
+              'FRM (ENG) (FRA) (CCL (PRP (DMZ (ENG FRA) (ECH))))',
+              'FRM (ENG) (FRA) (FCT (XDO ((ENG FLT LON) HLD)))',
+              'FRM (ENG) (FRA) (HUH (PRP (PCE (ENG FRA))))']
+
+def main(): # type: () -> None
+  """ Times toning a finished gloss, and glossing from DAIDE, once per tone. """
+
+  repeats = 2000
+  utterances = [PRESSGLOSS.PressUtterance(curdaide, ['Objective']) for curdaide in toneddaide]
+  glosses = [curutterance.english for curutterance in utterances]
+  print('{:<12} {:>14} {:>14}'.format('tone', 'tonetize us', 'daide2gloss us'))
+  for curtone in helpers.tonelist:
+    for curutterance in utterances:
+      curutterance.tones = [curtone]
+      curutterance.formenglish()
+    random.seed(0)
+    elapsed = min(timeit.repeat(lambda: [helpers.tonetize(curutterance, curgloss) for curutterance, curgloss in zip(utterances, glosses)], number=repeats, repeat=5))
+    toneus = elapsed / (repeats * len(utterances)) * 1e6
+    elapsed = min(timeit.repeat(lambda: [PRESSGLOSS.daide2gloss(curdaide, [curtone]) for curdaide in toneddaide], number=repeats // 10, repeat=3))
+    glossus = elapsed / (repeats // 10 * len(toneddaide)) * 1e6
+    print('{:<12} {:14.2f} {:14.1f}'.format(curtone, toneus, glossus))
+
+if __name__ == '__main__':
+  main()
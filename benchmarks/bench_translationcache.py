@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+""" Time to translate a set of English twice through a model with fixed latency, with and without the translation cache. """
+
+# Standard library imports
+import os, sys
+import time
+import shutil
+import asyncio
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.corpus as CORPUS
+import pressgloss.translator as TRANSLATOR
+
+latency = 0.25
+
+async def slowtransport(route, payload, timeout): # type: (str, {}, float) -> {}
+  """
+  Answers like a model would, after a delay.
+
+  :param route: the API route
+  :type route: str
+  :param payload: the body of the request
+  :type payload: {}
+  :param timeout: the seconds to wait
+  :type timeout: float
+
+  :return: the body of the response
+  :rtype: {}
+  """
+
+  await asyncio.sleep(latency)
+
+  return {'choices': [{'message': {'role': 'assistant', 'content': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))'}}]}
+
+def main(): # type: () -> None
+  """ Translates the same examples in two runs, as a validation rerun would, and reports the time of each run and the cache's hit rate. """
+
+  count = 500
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  examples = CORPUS.generatechunk(0, count, seed=3)
+  englishes = [curexample['prompt'] for curexample in examples]
+  cachefolder = tempfile.mkdtemp()
+  try:
+    for curname, curcache in [('no cache', None), ('cache', TRANSLATOR.TranslationCache(os.path.join(cachefolder, 'translations.sqlite')))]:
+      for currun in range(2):
+        translator = TRANSLATOR.AsyncTranslator(transport=slowtransport, concurrency=16, repair=lambda content: (content, None),
+                                                pool=TRANSLATOR.getfewshotpool(), cache=curcache)
+        started = time.perf_counter()
+        asyncio.run(translator.translatemany(englishes))
+        elapsed = time.perf_counter() - started
+        print('{:<9} run {}: {:6.2f} s, {:5} requests to the model'.format(curname, currun + 1, elapsed, translator.stats['requests']))
+      if curcache is not None:
+        print('cache stats: ' + str(curcache.stats()))
+        started = time.perf_counter()
+        for curexample in examples:
+          curcache.get(TRANSLATOR.translationkey(curexample['prompt'], None, 'gpt-3.5-turbo', TRANSLATOR.promptversion()))
+        print('lookup: {:.1f} us'.format((time.perf_counter() - started) / count * 1e6))
+        curcache.close()
+  finally:
+    shutil.rmtree(cachefolder)
+
+if __name__ == '__main__':
+  main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+""" Wall-clock time to translate a validation set through translator.AsyncTranslator against a local stub model with fixed latency. """
+
+# Standard library imports
+import os, sys
+import json
+import time
+import asyncio
+import threading
+import http.server
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.translator as TRANSLATOR
+
+latency = 0.25
+
+class StubModelHandler(http.server.BaseHTTPRequestHandler):
+  """ Answers every chat completion with the same DAIDE after a delay, like a slow model would. """
+
+  def do_POST(self): # type: () -> None
+    """ Answers a request. """
+
+    self.rfile.read(int(self.headers['Content-Length']))
+    time.sleep(latency)
+    body = json.dumps({'choices': [{'message': {'role': 'assistant', 'content': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))'}}]}).encode('utf-8')
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args): # type: (...) -> None
+    """ Keeps the output quiet. """
+
+def main(): # type: () -> None
+  """ Translates the same examples one at a time and with growing concurrency, and reports examples per second. """
+
+  count = 200
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubModelHandler)
+  server.request_queue_size = 256
+  threading.Thread(target=server.serve_forever, daemon=True).start()
+  baseurl = 'http://127.0.0.1:' + str(server.server_address[1])
+  englishes = ['(ENG) (FRA) I offer you peace ' + str(curiter) for curiter in range(count)]
+  try:
+    for curconcurrency in [1, 8, 32, 64]:
+      translator = TRANSLATOR.AsyncTranslator(transport=TRANSLATOR.HTTPTransport(baseurl, apikey='bench', connections=curconcurrency),
+                                              concurrency=curconcurrency, repair=lambda content: (content, None))
+      started = time.perf_counter()
+      asyncio.run(translator.translatemany(englishes))
+      elapsed = time.perf_counter() - started
+      translator.close()
+      print('concurrency {:>3}: {:7.2f} s, {:7.1f} examples/s, 1000 examples in {:6.1f} s'.format(curconcurrency, elapsed, count / elapsed, 1000 * elapsed / count))
+  finally:
+    server.shutdown()
+    server.server_close()
+
+if __name__ == '__main__':
+  main()
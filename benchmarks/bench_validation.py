@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+""" Throughput of the validation harness against a mock model, serially as validate_model used to run and at rising concurrency. """
+
+# Standard library imports
+import os, sys
+import time
+import shutil
+import asyncio
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pressgloss imports
+import pressgloss.corpus as CORPUS
+import pressgloss.helpers as helpers
+import pressgloss.translator as TRANSLATOR
+import pressgloss.validation as VALIDATION
+
+latency = 0.05
+
+def serialvalidate(count, transport): # type: (int, callable) -> float
+  """
+  The loop validate_model ran before the harness, kept here as the baseline: translate one example, compare, count.
+
+  :param count: how many examples
+  :type count: int
+  :param transport: the mock model
+  :type transport: callable
+
+  :return: the accuracy as a percentage
+  :rtype: float
+  """
+
+  matches = 0
+  translator = TRANSLATOR.AsyncTranslator(transport=transport, repair=VALIDATION.pressglossrepair, pool=TRANSLATOR.getfewshotpool())
+  for curexample in CORPUS.iteratecorpus(count, 0):
+    translation = asyncio.run(translator.translate(curexample['prompt']))
+    if helpers.normalizedaide(translation) == helpers.normalizedaide(curexample['completion']):
+      matches += 1
+
+  return 100.0 * matches / count
+
+def main(): # type: () -> None
+  """ Validates the same examples against the same mock model each way and reports examples per second and latency percentiles. """
+
+  count = 400
+  if len(sys.argv) > 1:
+    count = int(sys.argv[1])
+
+  started = time.perf_counter()
+  accuracy = serialvalidate(min(count, 100), VALIDATION.mockmodel(count, 0, latency=latency))
+  elapsed = time.perf_counter() - started
+  print('{:<16} {:8.1f} examples/s accuracy {:5.1f}%'.format('serial', min(count, 100) / elapsed, accuracy))
+
+  outfolder = tempfile.mkdtemp()
+  try:
+    for curconcurrency in [1, 8, 32, 128]:
+      outpath = os.path.join(outfolder, 'validation' + str(curconcurrency) + '.jsonl')
+      summary = VALIDATION.validate(outpath, count, concurrency=curconcurrency, transport=VALIDATION.mockmodel(count, 0, latency=latency),
+                                    repair=VALIDATION.pressglossrepair)
+      print('{:<16} {:8.1f} examples/s accuracy {:5.1f}% p50 {:.3f}s p99 {:.3f}s'.format('concurrency ' + str(curconcurrency), summary['rate'], summary['accuracy'],
+                                                                                         summary['latency']['p50'], summary['latency']['p99']))
+    started = time.perf_counter()
+    summary = VALIDATION.validate(outpath, count, concurrency=128, transport=VALIDATION.mockmodel(count, 0, latency=latency), repair=VALIDATION.pressglossrepair)
+    print('{:<16} {:8.1f} ms to read back {} finished examples'.format('resume', (time.perf_counter() - started) * 1e3, summary['resumed']))
+  finally:
+    shutil.rmtree(outfolder)
+
+if __name__ == '__main__':
+  main()
@@ -3,9 +3,6 @@
 
 """
 
-# Third-party imports
-import flask
-
 __version__ = "0.0.1"
 
 def create_app(): # type: () -> flask.Flask
@@ -17,6 +14,8 @@ def create_app(): # type: () -> flask.Flask
   :rtype: flask.Flask
   """
 
+  import flask
+
   app = flask.Flask(__name__, instance_relative_config=False)
   with app.app_context():
     from . import daideapp
@@ -19,8 +19,6 @@ import os
 import pressgloss.core as PRESSGLOSS
 import pressgloss.helpers as helpers
 import pressgloss.gamelog as GAMELOG
-import pressgloss.daideapp as DAIDEAPP
-import pressgloss.daide_translate as DAIDE
 from . import create_app
 
 # python -m pressgloss --operation translate --daide "FRM (ENG) (FRA ITA) (PRP (PCE (FRA ITA)))" --tones "Haughty,Urgent"
@@ -28,12 +26,17 @@ from . import create_app
 # python -m pressgloss --operation translate --daide "FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO (SPA NCS))))" --tones "Objective"
 # python -m pressgloss --operation translate --daide "FRM (ENG) (FRA ITA) (PRP (AND (PCE (FRA ITA)) (XDO ((ENG AMY LVP) RTO YOR))))" --tones "Objective"
 # python -m pressgloss --operation translate --daide "FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO YOR)))" --tones "Objective,Expert"
+# python -m pressgloss --operation translate --daide "FRM (ENG) (FRA ITA) (PRP (PCE (FRA ITA)))" --tones "Friendly" --seed 42
 # python -m pressgloss --operation test --daide "FRM ( ENG) (FRA  ITA) (PRP (PCE (FRA ITA) ))"
 # python -m pressgloss --operation expound --number 100 --daide "FRM (ENG) (FRA) (PRP (PCE (FRA ENG)))"
 # python -m pressgloss --operation random --number 10
+# python -m pressgloss --operation corpus --number 1000000 --workers 8 --seed 1 --operators PRP:3,FCT:1,YES,REJ --output c:\data\shade\corpus.jsonl
+# python -m pressgloss --operation validate --model gpt-3.5-turbo --scale 1000 --concurrency 32
+# python -m pressgloss --operation validate --scale 10000 --concurrency 64 --mock 0.8 --output c:\data\shade\validation.jsonl
 # python -m pressgloss --operation prettifygamefile --input c:\data\shade\data\games\OliveJunglefowlRosalyn25_1651251697467.json --output c:\data\shade\data\games\OliveJunglefowlRosalyn25_1651251697467.html
 # python -m pressgloss --operation analyzelogs --input c:\data\shade\data_20220526\games
 # python -m pressgloss --operation analyzegym --input c:\data\shade\botgamelogs > c:\data\shade\botgamelogs\analysis.txt
+# python -m pressgloss --operation analyzegym --workers 8 --input c:\data\shade\botgamelogs > c:\data\shade\botgamelogs\analysis.txt
 
 # aws s3 --profile=shade ls s3://jataware-diplomacy/
 # aws s3 --profile=shade cp s3://jataware-diplomacy/data-2022-05-21T16:00:01.zip c:\data\shade\data_2.zip
@@ -41,7 +44,7 @@ from . import create_app
 def main(): # type: () -> None
   logging.basicConfig(format='%(asctime)-15s %(message)s', level=logging.DEBUG)
   leParser = argparse.ArgumentParser()
-  leParser.add_argument('--operation', help='What do you want to do? (translate|random|app|test|analyzelogs|analyzegym|encode|finetune)')
+  leParser.add_argument('--operation', help='What do you want to do? (translate|random|corpus|app|test|analyzelogs|analyzegym|encode|finetune)')
   leParser.add_argument('--number', help='How many expressions to create.')
   leParser.add_argument('--daide', help='The DAIDE format press to use.')
   leParser.add_argument('--english', help='The English message to translate.')
@@ -53,6 +56,11 @@ def main(): # type: () -> None
   leParser.add_argument('--config', help='A configuration file with various settings.')
   leParser.add_argument('--scale', help='A scaling factor for the data the model is trained/validated on.')
   leParser.add_argument('--verbose', help='Whether to print out more information.')
+  leParser.add_argument('--workers', help='How many processes to work in.')
+  leParser.add_argument('--seed', help='A seed that makes glosses reproducible.')
+  leParser.add_argument('--concurrency', help='How many requests to a model to have in flight at once.')
+  leParser.add_argument('--operators', help='The kinds of press to generate and their weights, like PRP:3,FCT:1.')
+  leParser.add_argument('--mock', help='Validate against a local mock model that is right this fraction of the time, like 0.8.')
   helpers.blockPrint()
   
   
@@ -69,12 +77,15 @@ def main(): # type: () -> None
   iterations = 1
   if hasattr(lesArgs, 'number') and lesArgs.number is not None:
     iterations = int(lesArgs.number)
+  workers = 1
+  if hasattr(lesArgs, 'workers') and lesArgs.workers is not None:
+    workers = int(lesArgs.workers)
   if lesArgs.operation == 'translate':
     tones = []
     if hasattr(lesArgs, 'tones') and lesArgs.tones is not None:
       tones = [curtone for curtone in lesArgs.tones.split(',')]
     for citer in range(0, iterations):
-      english = PRESSGLOSS.daide2gloss(lesArgs.daide, tones)
+      english = PRESSGLOSS.daide2gloss(lesArgs.daide, tones, lesArgs.seed)
       result = english
   elif lesArgs.operation == 'random':
     legaltones = [tone for tone in helpers.tonelist if tone not in ['Urgent', 'Expert', 'Obsequious', 'Haughty', 'PigLatin']]
@@ -87,6 +98,17 @@ def main(): # type: () -> None
         curtones.append('Expert')
       utterance = PRESSGLOSS.PressUtterance(None, curtones)
       result = '"' + utterance.daide + '","' + ';'.join(curtones) + '","' + utterance.english + '"'
+  elif lesArgs.operation == 'corpus':
+    import pressgloss.corpus as CORPUS
+    operators = None
+    if hasattr(lesArgs, 'operators') and lesArgs.operators is not None:
+      operators = CORPUS.parseoperators(lesArgs.operators)
+    seed = 0
+    if hasattr(lesArgs, 'seed') and lesArgs.seed is not None:
+      seed = lesArgs.seed
+    stats = CORPUS.writecorpus(lesArgs.output, iterations, seed, workers, operators=operators)
+    result = 'Wrote ' + str(stats['written']) + ' examples (' + str(stats['duplicates']) + ' duplicates skipped) in ' + \
+             '{:.1f} seconds, {:.0f} examples/second.'.format(stats['seconds'], stats['rate'])
   elif lesArgs.operation == 'expound':
     print('DAIDE,Tones,Gloss')
     legaltones = [tone for tone in helpers.tonelist if tone not in ['Urgent', 'Expert', 'Obsequious', 'Haughty', 'PigLatin']]
@@ -108,7 +130,7 @@ def main(): # type: () -> None
     for curgame in interestinggames:
       GAMELOG.prettifygamefile(curgame, curgame)
   elif lesArgs.operation == 'analyzegym':
-    interestinggames = GAMELOG.analyzegym(lesArgs.input)
+    interestinggames = GAMELOG.analyzegym(lesArgs.input, workers)
     result = 'There were ' + str(len(interestinggames)) + ' game files found.'
   elif lesArgs.operation == 'test':
     result = 'testing'
@@ -116,26 +138,48 @@ def main(): # type: () -> None
     tones = []
     if hasattr(lesArgs, 'tones') and lesArgs.tones is not None:
       tones = [curtone for curtone in lesArgs.tones.split(',')]
-    encoding = DAIDE.gloss2daide(lesArgs.english, tones, lesArgs.model)
+    import pressgloss.daide_translate as DAIDE
+    encoding = DAIDE.gloss2daide(lesArgs.english, model=lesArgs.model, tones=tones)
     result = encoding.daide
   elif lesArgs.operation == 'finetune':
     if hasattr(lesArgs, 'scale') and lesArgs.scale is not None:
       lesArgs.scale = int(lesArgs.scale)
     else:
       lesArgs.scale = 100000
+    import pressgloss.daide_translate as DAIDE
     finetune = DAIDE.fine_tuned_model(data_size = lesArgs.scale)
     result = f'Fine tune job created, you can track it with the id: {finetune.tracking_number}'
   elif lesArgs.operation == 'validate':
     print('validating')
-    tones = []
+    tones = None
     if hasattr(lesArgs, 'tones') and lesArgs.tones is not None:
       tones = [curtone for curtone in lesArgs.tones.split(',')]
     if hasattr(lesArgs, 'scale') and lesArgs.scale:
       scale = float(lesArgs.scale)
     else:
       scale = None
-    validation = DAIDE.validate_model(lesArgs.model, scale, tones)
+    import pressgloss.daide_translate as DAIDE
+    concurrency = 16
+    if hasattr(lesArgs, 'concurrency') and lesArgs.concurrency is not None:
+      concurrency = int(lesArgs.concurrency)
+    seed = None
+    if hasattr(lesArgs, 'seed') and lesArgs.seed is not None:
+      seed = lesArgs.seed
+    transport = None
+    if hasattr(lesArgs, 'mock') and lesArgs.mock is not None:
+      import pressgloss.validation as VALIDATION
+      if seed is None:
+        seed = 0
+      transport = VALIDATION.mockmodel(100 if scale is None else int(scale), seed, tones, float(lesArgs.mock))
+    validation = DAIDE.validate_model(lesArgs.model, scale, tones, concurrency, transport, transport is None, lesArgs.output, seed)
     result = 'Validation accuracy: ' + str(validation.accuracy) + '% with ' + str(validation.parse_accuracy) + '% parsible'
+    if validation.summary['latency']['p50'] is not None:
+      result += ', latency p50 {:.2f}s p90 {:.2f}s p99 {:.2f}s'.format(validation.summary['latency']['p50'], validation.summary['latency']['p90'], validation.summary['latency']['p99'])
+    result += ', {:.1f} examples/second'.format(validation.summary['rate'])
+    if validation.summary['resumed'] > 0:
+      result += ', ' + str(validation.summary['resumed']) + ' examples resumed'
+    if validation.cache_stats is not None:
+      result += ', ' + str(validation.cache_stats['hits']) + ' translations from the cache'
   helpers.enablePrint()
   print(result)
 if __name__ == '__main__':
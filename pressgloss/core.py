@@ -5,49 +5,122 @@
 import logging
 import random
 import json
+import weakref
+import functools
+import itertools
+import concurrent.futures
 
 # pressgloss imports
 from . import helpers
 
+# The kinds of press that a random utterance can be
+randompress = ('PRP', 'FCT', 'YES', 'REJ', 'HUH', 'BWX', 'CCL', 'IFF')
+# The operators a random message draws the messages or orders within it from
+randomarrangements = ('PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR', 'AND', 'ORR')
+randomterms = ('PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR')
+randompropositions = ('PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO')
+randomstatements = ('PRP', 'FCT', 'IFF')
+randomqueried = ('PRP', 'IFF', 'YES')
+randomorders = ('HLD', 'MTO', 'SUP', 'SUPMTO', 'CVYCTO', 'CVYVIA', 'RTO', 'DSB', 'BLD', 'REM', 'WVE')
+
 class PressUtterance:
   """ A statement by a Diplomacy Power addressed to other Powers and regarding some in-game topic with a tone """
 
-  def __init__(self, daide='', tones=None): # type: (str, []) -> None
+  __slots__ = ('daide', 'frompower', 'topowers', 'content', 'tones', 'rng', 'seed', 'glossing', 'retaintext', '_english', 'toneplan', 'parseerror', 'glosserror', 'renders', '__weakref__')
+
+  def __init__(self, daide='', tones=None, glossing=True, seed=None, rng=None, operator=None, retaintext=False): # type: (str, [], bool, object, random.Random, str, bool) -> None
     """
-    Initialize the utterance with a DAIDE expression
+    Initialize the utterance with a DAIDE expression.  The message tree is built right away,
+    but English is only formed on first access of the english attribute or a call to formenglish.
+    Every random choice, of a random message or of the wording of English, is drawn from rng.  With a
+    seed, rng is reseeded before each of them, so the same DAIDE, tones and seed always give the same gloss.
 
     :param daide: the press utterance in DAIDE syntax
     :type daide: str
     :param tones: the tones to use when forming English
     :type tones: []
-    """
-
+    :param glossing: whether reading the english attribute forms English on demand.  Callers that only need the message structure can pass False; english is then None until formenglish is called.
+    :type glossing: bool
+    :param seed: a seed that makes random messages and English reproducible
+    :type seed: object
+    :param rng: the random number generator to draw from, by default a new one if seeded and otherwise the random module's
+    :type rng: random.Random
+    :param operator: for a random utterance, the kind of press to make (one of randompress), rather than a random kind
+    :type operator: str
+    :param retaintext: whether each message in the tree keeps the English it formed, in its english and simpleenglish attributes.  By default only the utterance keeps its English.
+    :type retaintext: bool
+    """
+
+    if rng is None:
+      rng = random if seed is None else random.Random()
+    self.rng = rng
+    self.seed = seed
+    if seed is not None:
+      self.rng.seed(seed)
+    self.glossing = glossing
+    self.retaintext = retaintext
+    self.renders = None
+    self._english = None
+    self.toneplan = None
+    self.parseerror = None
+    self.glosserror = None
     if tones is None:
       self.tones = []
     else:
       self.tones = tones
 
     if daide is None or daide == '':
-      self.frompower = random.choice(helpers.powerlist)
+      self.frompower = self.rng.choice(helpers.powerlist)
       self.topowers = []
       tolist = [curpower for curpower in helpers.powerlist if curpower != self.frompower]
-      self.topowers = random.sample(tolist, random.randint(1, 4))
-      contentword = random.choice(['PRP', 'FCT', 'YES', 'REJ', 'HUH', 'BWX', 'CCL', 'IFF'])
+      self.topowers = self.rng.sample(tolist, self.rng.randint(1, 4))
+      if operator is None:
+        contentword = self.rng.choice(randompress)
+      else:
+        contentword = operator
       self.content = randomFactory(self, None, contentword)
       self.daide = self.formDAIDE()
     else:
       self.daide = daide
-      thelists = helpers.daide2lists(daide)
+      try:
+        thelists = parsetemplate(daide)
+      except helpers.DAIDEParseError as e:
+        self.parseerror = e.with_traceback(None)
+        thelists = ()
       if len(thelists) == 4 and thelists[0] == 'FRM':
         self.frompower = thelists[1][0]
-        self.topowers = thelists[2]
+        self.topowers = list(thelists[2])
         self.content = messageFactory(self, None, thelists[3])
+        self.content.swimthechannel()
       else:
         self.frompower = ''
         self.topowers = []
         self.content = None
 
-    self.formenglish()
+  @property
+  def english(self): # type: () -> str
+    """
+    The English gloss of this utterance, formed on first access
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self._english is None and self.glossing:
+      self.formenglish()
+
+    return self._english
+
+  @english.setter
+  def english(self, value): # type: (str) -> None
+    """
+    Stores an English gloss of this utterance
+
+    :param value: the English expression
+    :type value: str
+    """
+
+    self._english = value
 
   def __eq__(self, other): # type: (PressUtterance) -> bool
     """
@@ -85,13 +158,26 @@ class PressUtterance:
     if tones is not None and len(tones) > 0:
       self.tones = tones
 
+    self.toneplan = None
+    self.glosserror = None
+    if self.seed is not None:
+      self.rng.seed(self.seed)
     if self.content is None:
       self.english = 'Ahem.'
     else:
+      # the render context: each message's English, formed once for this pass and let go of when it is done
+      self.renders = {}
       try:
         self.english = self.content.formenglish()
       except Exception as e:
+        self.glosserror = repr(e)
         self.english = 'Ahem.'
+      finally:
+        if not self.retaintext:
+          for curmessage, curtext in self.renders.values():
+            curmessage.english = 'Ahem.'
+            curmessage.simpleenglish = None
+        self.renders = None
 
   def formDAIDE(self): # type () -> str
     """
@@ -103,8 +189,163 @@ class PressUtterance:
 
     return 'FRM (' + self.frompower + ') (' + ' '.join(self.topowers) + ') (' + self.content.formDAIDE() + ')'
 
+def noreference(): # type: () -> None
+  """ Stands in for a weak reference to nothing, so a message without an utterance or container needs no test for it. """
+
+  return None
+
+class Ancestry:
+  """
+  The operators of the messages containing a message, innermost first, which is all a message needs to know of them
+  to form English.  The most recently used ancestries are interned, so messages with the same ancestors share one,
+  and the name of the template that forms English in that context is worked out when the ancestry is made.
+  """
+
+  __slots__ = ('operator', 'container', 'path', 'template')
+
+  def __init__(self, operator, container): # type: (str, Ancestry) -> None
+    """
+    Initialize the ancestry
+
+    :param operator: the operator of the containing message
+    :type operator: str
+    :param container: the ancestry of the containing message, or None if it is the utterance's content
+    :type container: Ancestry
+    """
+
+    self.operator = operator
+    self.container = container
+    self.path = (operator,) + (() if container is None else container.path)
+    self.template = templatename(self.path)
+
+ancestries = helpers.LRUCache(4096) # type: helpers.LRUCache
+
+def ancestryof(container): # type: (PressMessage) -> Ancestry
+  """
+  Returns the shared ancestry of the messages within a message.
+
+  :param container: the containing message, or its ancestry, or None
+  :type container: PressMessage
+
+  :return: the ancestry, or None if there is no containing message
+  :rtype: Ancestry
+  """
+
+  if container is None or isinstance(container, Ancestry):
+    return container
+  key = (container.operator, container.container)
+  retancestry = ancestries.get(key)
+  if retancestry is None:
+    retancestry = Ancestry(container.operator, container.container)
+    ancestries.put(key, retancestry)
+
+  return retancestry
+
+def templatename(path): # type: (()) -> str
+  """
+  Names the method that forms a message's English, given the operators of the messages containing it.
+  A proposal or fact, negated or not, within a reply or as it is, has a template of its own; any other
+  container gets the simple list English.  A name like yesprpnotenglish is read outwards from the message:
+  NOT, within PRP, within YES.
+
+  :param path: the operators containing the message, innermost first
+  :type path: ()
+
+  :return: the name of the template, or None if the message forms no English in this context
+  :rtype: str
+  """
+
+  if len(path) == 0:
+    return 'invalidenglish'
+  negation = ''
+  if path[0] in ('NOT', 'NAR'):
+    negation = path[0].lower()
+    path = path[1:]
+    if len(path) == 0:
+      return 'invalidenglish'
+  outer = path[1] if len(path) > 1 else None
+  if path[0] == 'PRP':
+    if outer is None or outer == 'IFF':
+      return 'prp' + negation + 'english'
+    if outer in ('YES', 'REJ', 'CCL', 'HUH'):
+      return outer.lower() + 'prp' + negation + 'english'
+    return None
+  if path[0] == 'FCT':
+    if outer is None:
+      return 'fct' + negation + 'english'
+    if outer == 'HUH':
+      return 'huhfct' + negation + 'english'
+    return None
+  if negation != '':
+    return None
+
+  return 'listenglish'
+
+englishtemplates = helpers.LRUCache(4096) # type: helpers.LRUCache
+
+def englishtemplate(message): # type: (PressMessage) -> callable
+  """
+  Returns the method that forms a message's English in the context of its ancestry, kept for the most recently used
+  message classes and ancestries, so forming English costs one cache lookup instead of a chain of tests.
+
+  :param message: the message to form English for
+  :type message: PressMessage
+
+  :return: the unbound template, or None if the message forms no English in this context
+  :rtype: callable
+  """
+
+  key = (type(message), message.container)
+  rettemplate = englishtemplates.get(key)
+  if rettemplate is None:
+    name = 'invalidenglish' if message.container is None else message.container.template
+    if name is None:
+      return None
+    rettemplate = getattr(type(message), name)
+    englishtemplates.put(key, rettemplate)
+
+  return rettemplate
+
+renderforms = ('formenglish', 'formlistenglish', 'formclauseenglish')
+
+def rendered(form): # type: (callable) -> callable
+  """
+  Wraps a message's way of forming English so that, within one pass of its utterance's formenglish, it is formed
+  at most once: asked again, as a conditional or conjunction may ask of the messages within it, the message
+  answers from the utterance's render context instead of forming it again and drawing new random choices.
+
+  :param form: formenglish, formlistenglish or formclauseenglish as a message class defines it
+  :type form: callable
+
+  :return: the wrapped method
+  :rtype: callable
+  """
+
+  @functools.wraps(form)
+  def formonce(self):
+    utterance = self.utteranceref()
+    renders = None if utterance is None else utterance.renders
+    if renders is None:
+      return form(self)
+    key = (id(self), form)
+    rendering = renders.get(key)
+    if rendering is None:
+      # the message is kept with its English, so its id is not reused while the context lasts
+      rendering = (self, form(self))
+      renders[key] = rendering
+
+    return rendering[1]
+
+  return formonce
+
 class PressMessage:
-  """ The game-related content of an utterance. Top-level DAIDE class that should never be used directly. """
+  """
+  The game-related content of an utterance. Top-level DAIDE class that should never be used directly.
+  A message refers to its utterance weakly and to its container only by the container's ancestry, so a tree has
+  no reference cycles and is freed as soon as its utterance is no longer used, without the cyclic garbage collector.
+  """
+
+  __slots__ = ('utteranceref', 'container', 'operator', 'details', 'english', 'simpleenglish')
 
   def __init__(self, utterance, container): # type: (PressUtterance, PressMessage) -> None
     """
@@ -117,10 +358,46 @@ class PressMessage:
     """
 
     self.utterance = utterance
-    self.container = container
+    self.container = ancestryof(container)
     self.operator = ''
     self.details = None
     self.english = 'Ahem.'
+    self.simpleenglish = None
+
+  def __init_subclass__(cls, **kwargs): # type: (dict) -> None
+    """
+    Forms each message class's English once per rendering pass, whichever of the ways of forming it the class defines
+
+    :param kwargs: keyword arguments for the class
+    :type kwargs: dict
+    """
+
+    super().__init_subclass__(**kwargs)
+    for curform in renderforms:
+      if curform in cls.__dict__:
+        setattr(cls, curform, rendered(cls.__dict__[curform]))
+
+  @property
+  def utterance(self): # type: () -> PressUtterance
+    """
+    The press utterance that this message is within the content for
+
+    :return: the utterance, or None if there is none or it has been freed
+    :rtype: PressUtterance
+    """
+
+    return self.utteranceref()
+
+  @utterance.setter
+  def utterance(self, value): # type: (PressUtterance) -> None
+    """
+    Refers to the utterance this message is within, without keeping it alive
+
+    :param value: the utterance
+    :type value: PressUtterance
+    """
+
+    self.utteranceref = noreference if value is None else weakref.ref(value)
 
   def __eq__(self, other): # type: (PressMessage) -> bool
     """
@@ -172,6 +449,32 @@ class PressMessage:
 
     return self.simpleenglish
 
+  def listenglish(self, *glosses): # type: (*str) -> str
+    """
+    The template for a message outside of any proposal or fact: its simple list English.
+
+    :param glosses: whatever the message has glossed already, which the list English does not need
+    :type glosses: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = self.formlistenglish()
+
+    return self.english
+
+  def invalidenglish(self, *glosses): # type: (*str) -> str
+    """
+    The template for a message that cannot stand where it is, like a treaty with no proposal around it.
+
+    :param glosses: whatever the message has glossed already
+    :type glosses: str
+    :raises ValueError: always
+    """
+
+    path = () if self.container is None else self.container.path
+    raise ValueError('Cannot form English for ' + (self.operator or type(self).__name__) + ' within ' + (' within '.join(path) or 'nothing'))
+
   def formclauseenglish(self): # type: () -> str
     """
     Creates a simple English clause, without any context like proposals, negations, etc.
@@ -209,16 +512,79 @@ class PressMessage:
 
   def swimthechannel(self): # type: () -> None
     """
-    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power
+    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power.
+    Walks the whole subtree, so it is run once on a finished tree (see PressUtterance) rather than per node.
 
     """
 
     if self.details is not None:
       self.details.swimthechannel()
 
+  def children(self): # type: () -> []
+    """
+    Lists the messages directly within this one: its details, conjuncts, antecedent and so on.
+
+    :return: the messages
+    :rtype: []
+    """
+
+    retlist = []
+    names = slotnames(type(self))
+    if hasattr(self, '__dict__'):
+      # a class registered from outside core, without slots of its own
+      names = names + tuple(self.__dict__)
+    for curname in names:
+      curvalue = getattr(self, curname, None)
+      if isinstance(curvalue, PressMessage):
+        retlist.append(curvalue)
+      elif isinstance(curvalue, list):
+        retlist.extend([curitem for curitem in curvalue if isinstance(curitem, PressMessage)])
+
+    return retlist
+
+  def releasetext(self): # type: () -> None
+    """ Lets go of the English formed by this message and every message within it, as for a tree glossed with its text retained. """
+
+    # back to the placeholder every message starts with
+    self.english = 'Ahem.'
+    self.simpleenglish = None
+    for curchild in self.children():
+      curchild.releasetext()
+
+for curform in renderforms:
+  setattr(PressMessage, curform, rendered(PressMessage.__dict__[curform]))
+
+classslots = {} # type: {type: ()}
+
+def slotnames(messageclass): # type: (type) -> ()
+  """
+  Returns the attributes of a message class that may hold other messages: the slots it and its bases declare, other
+  than those that point back up the tree or hold text.
+
+  :param messageclass: the message class
+  :type messageclass: type
+
+  :return: the attribute names
+  :rtype: ()
+  """
+
+  names = classslots.get(messageclass)
+  if names is None:
+    names = []
+    for curclass in messageclass.__mro__:
+      for curname in curclass.__dict__.get('__slots__', ()):
+        if curname not in ('utteranceref', 'container', 'operator', 'english', 'simpleenglish') and curname not in names:
+          names.append(curname)
+    names = tuple(names)
+    classslots[messageclass] = names
+
+  return names
+
 class PressFact(PressMessage):
   """ The game-related content of a fact. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -234,12 +600,11 @@ class PressFact(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'FCT'
-      contentword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR', 'AND', 'ORR'])
+      contentword = self.utterance.rng.choice(randomarrangements)
       self.details = randomFactory(utterance, self, contentword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -299,6 +664,8 @@ class PressFact(PressMessage):
 class PressProposal(PressMessage):
   """ The game-related content of a proposal. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -314,12 +681,11 @@ class PressProposal(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'PRP'
-      contentword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR', 'AND', 'ORR'])
+      contentword = self.utterance.rng.choice(randomarrangements)
       self.details = randomFactory(utterance, self, contentword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -379,6 +745,8 @@ class PressProposal(PressMessage):
 class PressAccept(PressMessage):
   """ The game-related content of an acceptance. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -398,7 +766,6 @@ class PressAccept(PressMessage):
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -458,6 +825,8 @@ class PressAccept(PressMessage):
 class PressReject(PressMessage):
   """ The game-related content of a rejection. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -477,7 +846,6 @@ class PressReject(PressMessage):
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -537,6 +905,8 @@ class PressReject(PressMessage):
 class PressCancel(PressMessage):
   """ The game-related content of a cancellation. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -552,12 +922,11 @@ class PressCancel(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'CCL'
-      contentword = random.choice(['PRP', 'IFF', 'YES'])
+      contentword = self.utterance.rng.choice(randomqueried)
       self.details = randomFactory(utterance, self, contentword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -617,6 +986,8 @@ class PressCancel(PressMessage):
 class PressHuh(PressMessage):
   """ The game-related content of a confusion. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -632,11 +1003,10 @@ class PressHuh(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'HUH'
-      self.details = randomFactory(utterance, self, random.choice(['PRP', 'FCT', 'IFF']))
+      self.details = randomFactory(utterance, self, self.utterance.rng.choice(randomstatements))
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -694,6 +1064,8 @@ class PressHuh(PressMessage):
 class PressIgnore(PressMessage):
   """ The game-related content of an ignoring. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -709,11 +1081,10 @@ class PressIgnore(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'BWX'
-      self.details = randomFactory(utterance, self, random.choice(['PRP', 'FCT', 'IFF']))
+      self.details = randomFactory(utterance, self, self.utterance.rng.choice(randomstatements))
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -723,7 +1094,7 @@ class PressIgnore(PressMessage):
     :rtype: str
     """
 
-    if random.choice([True,False]):
+    if self.utterance.rng.choice((True, False)):
       self.english = ''
     else:
       self.english = helpers.powerdict[self.utterance.frompower]['Objective'] + ' ignores you.'
@@ -771,6 +1142,8 @@ class PressIgnore(PressMessage):
 class PressPeace(PressMessage):
   """ The game-related content of a peace treaty. """
 
+  __slots__ = ('allies',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -786,14 +1159,13 @@ class PressPeace(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'PCE'
-      if random.choice([True, True, False]):
+      if self.utterance.rng.choice((True, True, False)):
         self.allies = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
       else:
-        self.allies = random.sample(helpers.powerlist, random.randint(2, 4))
+        self.allies = self.utterance.rng.sample(helpers.powerlist, self.utterance.rng.randint(2, 4))
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.allies = thelists[1]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -803,1026 +1175,353 @@ class PressPeace(PressMessage):
     :rtype: str
     """
 
-    if self.container.operator == 'PRP':
-      # (PRP (PCE
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        if random.choice([True, False]):
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + \
-                         ' a ' + random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + \
-                         ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + '.'
-        else:
-          self.english = 'I ' + random.choice(['propose', 'request']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-      # (YES (PRP (PCE
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with', 'would appreciate']) + ' a ' + \
-                       random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (REJ (PRP (PCE
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of']) + ' a ' + \
-                       random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (CCL (PRP (PCE
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of a ' + \
-                       random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (HUH (PRP (PCE
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your peace proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (PCE
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['propose', 'request']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['break', 'cancel', 'annul']) + ' ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive') + ' ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (YES (PRP (NOT (PCE
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['break', 'cancel', 'annul']) + ' ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive') + ' ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (REJ (PRP (NOT (PCE
-        elif self.container.container.container.operator == 'REJ':
-          if random.choice([True, False]):
-            self.english = 'I ' + random.choice(['disagree', 'reject']) + ' that ' + \
-                           helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + \
-                           ' should ' + random.choice(['break', 'cancel', 'annul']) + ' ' + \
-                           helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive') + ' ' + \
-                           random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-          else:
-            self.english = 'No, ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                           random.choice(['should not', 'cannot', 'ought not']) + ' ' + random.choice(['break', 'cancel', 'annul']) + ' ' + \
-                           helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive') + ' ' + \
-                           random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (CCL (PRP (NOT (PCE
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['break', 'cancel', 'annul']) + ' ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive') + ' ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (HUH (PRP (NOT (PCE
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a peace treaty.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (PCE
-        if self.container.container.container is None:
-          self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['are not in a current', 'do not have a current', 'are not in an active', 'do not have an active', 'are not in a', 'do not have a']) + ' ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (HUH (FCT (NOT (PCE
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a peace treaty.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (PCE
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['propose', 'request']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' not ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (YES (PRP (NAR (PCE
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' not ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (REJ (PRP (NAR (PCE
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + \
-                         ' should in fact ' + random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (CCL (PRP (NAR (PCE
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + \
-                         ' avoid ' + random.choice(['forming', 'signing', 'agreeing to', 'establishing']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (HUH (PRP (NAR (PCE
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a peace treaty.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (PCE
-        if self.container.container.container is None:
-          self.english = 'It is unclear if ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['are in a', 'have a']) + ' ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-        # (HUH (FCT (NAR (PCE
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a peace treaty.'
-    elif self.container.operator == 'FCT':
-      # (FCT (PCE
-      if self.container.container is None:
-        self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                       random.choice(['are in a', 'have a']) + ' ' + \
-                       random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
-      # (HUH (FCT (PCE
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about a peace treaty.'
-    else:
-      self.english = self.formlistenglish()
+    template = englishtemplate(self)
+    if template is not None:
+      template(self)
 
     return self.english
 
-  def formlistenglish(self): # type: () -> str
+  def prpenglish(self): # type: () -> str
     """
-    Creates a simple English statement about this peace deal, without any context like proposals, negations, etc.
-    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+    Forms the English for PRP (PCE ...) sent as it is or as the consequence of a conditional.
 
-    :return: the simple English statement
+    :return: the English expression
     :rtype: str
-
     """
 
-    self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']) + '.'
+    if self.utterance.rng.choice((True, False)):
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + \
+                     ' a ' + self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + \
+                     ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['propose']) + ' that ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formclauseenglish(self): # type: () -> str
+  def yesprpenglish(self): # type: () -> str
     """
-    Creates a simple English statement about this peace deal, without any context like proposals, negations, etc.
-    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+    Forms the English for YES (PRP (PCE ...)).
 
-    :return: the simple English statement
+    :return: the English expression
     :rtype: str
-
     """
 
-    if self.container.operator == "NOT":
-      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers,
-                                                case='Subjective') + ' ' + \
-                           random.choice(['will not form', 'refuses', 'disagree to', 'will not establish']) + ' a ' + \
-                           random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire'])
-    else:
-      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire'])
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreetoappreciate']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formDAIDE(self): # type () -> str
+  def rejprpenglish(self): # type: () -> str
     """
-    Create a DAIDE representation of this Message
+    Forms the English for REJ (PRP (PCE ...)).
 
-    :return: the DAIDE message
+    :return: the English expression
     :rtype: str
     """
 
-    return 'PCE (' + ' '.join(self.allies) + ')'
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['reject']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-class PressAlliance(PressMessage):
-  """ The game-related content of an alliance. """
+    return self.english
 
-  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+  def cclprpenglish(self): # type: () -> str
     """
-    Initialize the message with an utterance
+    Forms the English for CCL (PRP (PCE ...)).
 
-    :param utterance: the press utterance that this message is within the content for
-    :type utterance: PressUtterance
-    :param container: the press message that contains this one
-    :type container: PressMessage
-    :param thelists: the parsed, nested DAIDE statement
-    :type thelists: []
+    :return: the English expression
+    :rtype: str
     """
 
-    super().__init__(utterance, container)
-    if thelists is None or len(thelists) == 0:
-      self.operator = 'ALY'
-      if random.choice([True, True, False]):
-        self.allies = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
-        opplist = [curpower for curpower in helpers.powerlist if curpower not in self.allies]
-        self.opponents = random.sample(opplist, random.randint(1, min(3, len(opplist))))
-      else:
-        self.allies = random.sample(helpers.powerlist, random.randint(2, 3))
-        opplist = [curpower for curpower in helpers.powerlist if curpower not in self.allies and curpower != utterance.frompower]
-        self.opponents = random.sample(opplist, random.randint(1, min(3, len(opplist))))
-    elif len(thelists) == 4:
-      self.operator = thelists[0]
-      self.allies = thelists[1]
-      self.opponents = thelists[3]
-      self.swimthechannel()
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-  def formenglish(self): # type () -> str
+    return self.english
+
+  def huhprpenglish(self): # type: () -> str
     """
-    Creates an English expression about the alliance in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (PRP (PCE ...)).
 
     :return: the English expression
     :rtype: str
     """
 
-    if self.container is None:
-      self.english = 'Ahem.'
-      return self.english
-
-    if self.container.operator == 'PRP':
-      # (PRP (ALY
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        if random.choice([True, False]):
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + \
-                         ' ' + random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + \
-                         ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + \
-                         ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        else:
-          self.english = 'I ' + random.choice(['propose', 'request']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + \
-                         ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (YES (PRP (ALY
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with', 'would appreciate']) + ' ' + \
-                       random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + \
-                       ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (REJ (PRP (ALY
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of']) + ' ' + \
-                       random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + \
-                       ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (CCL (PRP (ALY
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of ' + \
-                       random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + \
-                       ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers) + \
-                       ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (HUH (PRP (ALY
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your alliance proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (ALY
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['propose', 'request', 'ask']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (YES (PRP (NOT (ALY
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (REJ (PRP (NOT (ALY
-        elif self.container.container.container.operator == 'REJ':
-          if random.choice([True, False]):
-            self.english = 'I ' + random.choice(['disagree', 'reject']) + ' that ' + \
-                           helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                           random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                           random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                           helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-          else:
-            self.english = 'No, ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                           random.choice(['should be free to', 'should not be stopped from', 'should not be prevented from']) + ' ' + \
-                           random.choice(['forming', 'signing', 'agreeing to']) + ' ' + \
-                           random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                           helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (CCL (PRP (NOT (ALY
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (HUH (PRP (NOT (ALY
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about an alliance.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (ALY
-        if self.container.container.container is None:
-          self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['are not in', 'do not have']) + ' ' + \
-                         random.choice(['a current', 'an active', 'a']) + ' ' + \
-                         random.choice(['alliance', 'joint military operation', 'military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-          self.english = self.english.replace(' a alliance', ' an alliance')
-        # (HUH (FCT (NOT (ALY
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about an alliance.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (ALY
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['doubt', 'don\'t think', 'do not think']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (YES (PRP (NAR (ALY
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (REJ (PRP (NAR (ALY
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + \
-                         ' should in fact be able to ' + random.choice(['form', 'sign', 'agree to', 'establish']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (CCL (PRP (NAR (ALY
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (HUH (PRP (NAR (ALY
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about an alliance.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (ALY
-        if self.container.container.container is None:
-          self.english = 'It is unclear if ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['are in', 'have']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-        # (HUH (FCT (NAR (ALY
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about an alliance.'
-    elif self.container.operator == 'FCT':
-      # (FCT (ALY
-      if self.container.container is None:
-        self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                       random.choice(['are in', 'have']) + ' ' + \
-                       random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                       helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
-      # (HUH (FCT (ALY
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about an alliance.'
-    else:
-      self.english = self.formlistenglish()
+    self.english = 'I do not understand your peace proposal.'
 
     return self.english
 
-  def formlistenglish(self): # type: () -> str
+  def prpnotenglish(self): # type: () -> str
     """
-    Creates a simple English statement about this alliance, without any context like proposals, negations, etc.
-    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+    Forms the English for PRP (NOT (PCE ...)) sent as it is or as the consequence of a conditional.
 
-    :return: the simple English statement
+    :return: the English expression
     :rtype: str
-
     """
 
-    self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers) + '.'
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['propose']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['annul']) + ' ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formclauseenglish(self): # type: () -> str
+  def yesprpnotenglish(self): # type: () -> str
     """
-    Creates a simple English statement about this alliance, without any context like proposals, negations, etc.
-    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+    Forms the English for YES (PRP (NOT (PCE ...))).
 
-    :return: the simple English statement
+    :return: the English expression
     :rtype: str
-
     """
-    if self.container.operator == "NOT":  #For example, NOT ( PRP ( ALY
-      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers,
-                                                case='Subjective') + ' ' + \
-                           random.choice(['will not form', 'will not sign', 'will not establish']) + ' ' + \
-                           random.choice(['an alliance', 'a joint military operation', 'military cooperation',
-                                          'a military coalition']) + ' against ' + \
-                           helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers)
-    else:
-      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['form', 'sign', 'agree to', 'establish']) + ' ' + \
-                         random.choice(['an alliance', 'a joint military operation', 'military cooperation', 'a military coalition']) + ' against ' + \
-                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers)
 
-    return self.simpleenglish
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['annul']) + ' ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-  def formDAIDE(self): # type () -> str
+    return self.english
+
+  def rejprpnotenglish(self): # type: () -> str
     """
-    Create a DAIDE representation of this Message
+    Forms the English for REJ (PRP (NOT (PCE ...))).
 
-    :return: the DAIDE message
+    :return: the English expression
     :rtype: str
     """
 
-    return 'ALY (' + ' '.join(self.allies) + ') VSS (' + ' '.join(self.opponents) + ')'
+    if self.utterance.rng.choice((True, False)):
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagree']) + ' that ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + \
+                     ' should ' + self.utterance.rng.choice(helpers.phrasebanks['annul']) + ' ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
+    else:
+      self.english = 'No, ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['shouldnot']) + ' ' + self.utterance.rng.choice(helpers.phrasebanks['annul']) + ' ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-class PressDMZ(PressMessage):
-  """ The game-related content of a DMZ. """
+    return self.english
 
-  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+  def cclprpnotenglish(self): # type: () -> str
     """
-    Initialize the message with an utterance
+    Forms the English for CCL (PRP (NOT (PCE ...))).
 
-    :param utterance: the press utterance that this message is within the content for
-    :type utterance: PressUtterance
-    :param container: the press message that contains this one
-    :type container: PressMessage
-    :param thelists: the parsed, nested DAIDE statement
-    :type thelists: []
+    :return: the English expression
+    :rtype: str
     """
 
-    super().__init__(utterance, container)
-    if thelists is None or len(thelists) == 0:
-      self.operator = 'DMZ'
-      if random.choice([True, True, False]):
-        self.powers = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
-      else:
-        self.powers = random.sample(helpers.powerlist, random.randint(1, 3))
-      self.provinces = random.sample(helpers.provincelist, random.randint(1, 3))
-    elif len(thelists) == 3:
-      self.operator = thelists[0]
-      self.powers = thelists[1]
-      self.provinces = thelists[2]
-      self.swimthechannel()
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['annul']) + ' ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Possessive', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-  def formenglish(self): # type () -> str
+    return self.english
+
+  def huhprpnotenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (PRP (NOT (PCE ...))).
 
     :return: the English expression
     :rtype: str
     """
 
-    powersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective')
-    provincesgloss = helpers.listOfProvinces(self.provinces)
-    if self.container.operator == 'PRP':
-      # (PRP (DMZ
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        if 'you ' in powersgloss.lower() and 'and me' in powersgloss.lower():
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + \
-                         ' we ' + random.choice(['stay out of', 'create a DMZ in', 'create a demilitarized zone in', 'keep out of']) + ' ' + \
-                         provincesgloss + '.'
-        else:
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + ' that ' + \
-                         powersgloss + ' ' + random.choice(['stay out of', 'create a DMZ in', 'create a demilitarized zone', 'keep out of']) + ' ' + \
-                         provincesgloss + '.'
-      # (YES (PRP (DMZ
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with']) + ' ' + \
-                       random.choice(['a DMZ in', 'a demilitarized zone in', 'keeping out of', 'staying out of']) + ' ' + \
-                       provincesgloss + ', covering ' + powersgloss + '.'
-      # (REJ (PRP (DMZ
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of']) + ' ' + \
-                       random.choice(['a DMZ in', 'a demilitarized zone in', 'keeping out of', 'staying out of']) + ' ' + \
-                       provincesgloss + '.'
-      # (CCL (PRP (DMZ
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of ' + \
-                       random.choice(['a DMZ in', 'a demilitarized zone in']) + ' ' + \
-                       provincesgloss + '.'
-      # (HUH (PRP (DMZ
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your DMZ proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (DMZ
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          if random.choice([True, False]):
-            self.english = 'I ' + random.choice(['propose', 'request', 'ask']) + ' that ' + \
-                           powersgloss + ' have free movement into and through ' + \
-                           provincesgloss + '.'
-          else:
-            self.english = 'I ' + random.choice(['propose', 'request', 'ask']) + ' that no ' + \
-                           random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' exist in ' + \
-                           provincesgloss + '.'
-        # (YES (PRP (NOT (DMZ
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         powersgloss + ' have free movement into and through ' + \
-                         provincesgloss + '.'
-        # (REJ (PRP (NOT (DMZ
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'I ' + random.choice(['disagree with', 'reject']) + ' free movement into and through ' + \
-                         provincesgloss + ' for ' + powersgloss + '.'
-        # (CCL (PRP (NOT (DMZ
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         provincesgloss + ' not enjoy a ' + random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + \
-                         ' with respect to ' + powersgloss + '.'
-        # (HUH (PRP (NOT (DMZ
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a DMZ.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (DMZ
-        if self.container.container.container is None:
-          self.english = powersgloss + ' ' + \
-                         random.choice(['are not in', 'do not respect', 'do not have']) + ' ' + \
-                         random.choice(['a current', 'an active', 'a']) + ' ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (HUH (FCT (NOT (DMZ
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a DMZ.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (DMZ
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['doubt', 'don\'t think', 'do not think']) + ' that ' + \
-                         helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' a ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (YES (PRP (NAR (DMZ
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that ' + \
-                         helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' a ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (REJ (PRP (NAR (DMZ
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that ' + \
-                         helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         ' should in fact be able to ' + random.choice(['form', 'sign', 'agree to', 'establish']) + ' a ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (CCL (PRP (NAR (DMZ
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' should not ' + \
-                         random.choice(['form', 'sign', 'agree to']) + ' a ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (HUH (PRP (NAR (DMZ
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a DMZ.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (DMZ
-        if self.container.container.container is None:
-          self.english = 'It is unclear if ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                         random.choice(['are in', 'have']) + ' a ' + \
-                         random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                         provincesgloss + '.'
-        # (HUH (FCT (NAR (DMZ
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a DMZ.'
-    elif self.container.operator == 'FCT':
-      # (FCT (DMZ
-      if self.container.container is None:
-        self.english = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' ' + \
-                       random.choice(['are in', 'have']) + ' ' + \
-                       random.choice(['DMZ', 'demilitarized zone', 'safe zone']) + ' in ' + \
-                       provincesgloss + '.'
-      # (HUH (FCT (DMZ
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about a DMZ.'
-    else:
-      self.english = self.formlistenglish()
+    self.english = 'I do not understand your proposal about a peace treaty.'
 
     return self.english
 
-  def formlistenglish(self): # type () -> str
+  def fctnotenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Forms the English for FCT (NOT (PCE ...)) sent as it is.
 
     :return: the English expression
     :rtype: str
     """
 
-    self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' form a DMZ in ' + helpers.listOfProvinces(self.provinces) + '.'
+    self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arenotina']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formclauseenglish(self): # type () -> str
+  def huhfctnotenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (FCT (NOT (PCE ...))).
 
     :return: the English expression
     :rtype: str
     """
-    if self.container.operator == "NOT":
-      self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' will not form a DMZ in ' + helpers.listOfProvinces(self.provinces) + ''
-    else:
-      self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective') + ' form a DMZ in ' + helpers.listOfProvinces(self.provinces) + ''
 
-    return self.simpleenglish
+    self.english = 'I do not understand your statement about a peace treaty.'
 
-  def formDAIDE(self): # type () -> str
+    return self.english
+
+  def prpnarenglish(self): # type: () -> str
     """
-    Create a DAIDE representation of this Message
+    Forms the English for PRP (NAR (PCE ...)) sent as it is or as the consequence of a conditional.
 
-    :return: the DAIDE message
+    :return: the English expression
     :rtype: str
     """
 
-    return 'DMZ (' + ' '.join(self.powers) + ') (' + ' '.join(self.provinces) + ')'
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['propose']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-  def swimthechannel(self): # type: () -> None
+    return self.english
+
+  def yesprpnarenglish(self): # type: () -> str
     """
-    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power
+    Forms the English for YES (PRP (NAR (PCE ...))).
 
+    :return: the English expression
+    :rtype: str
     """
 
-    if 'ENG' in self.provinces:
-      self.provinces.remove('ENG')
-      self.provinces.append('ECH')
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-class PressDraw(PressMessage):
-  """ The game-related content of a draw. """
+    return self.english
 
-  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+  def rejprpnarenglish(self): # type: () -> str
     """
-    Initialize the message with an utterance
+    Forms the English for REJ (PRP (NAR (PCE ...))).
 
-    :param utterance: the press utterance that this message is within the content for
-    :type utterance: PressUtterance
-    :param container: the press message that contains this one
-    :type container: PressMessage
-    :param thelists: the parsed, nested DAIDE statement
-    :type thelists: []
+    :return: the English expression
+    :rtype: str
     """
 
-    super().__init__(utterance, container)
-    if thelists is None or len(thelists) == 0:
-      self.operator = 'DRW'
-      if random.choice([True, True, False]):
-        self.powers = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
-      else:
-        self.powers = None
-      self.provinces = random.sample(helpers.provincelist, random.randint(1, 3))
-    else:
-      self.operator = thelists[0]
-      if len(thelists) > 1:
-        self.powers = thelists[1]
-      else:
-        self.powers = None
-      self.swimthechannel()
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + \
+                   ' should in fact ' + self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-  def formenglish(self): # type () -> str
+    return self.english
+
+  def cclprpnarenglish(self): # type: () -> str
     """
-    Creates an English expression about the draw in the context of a sender, recipients and desired tone.
+    Forms the English for CCL (PRP (NAR (PCE ...))).
 
     :return: the English expression
     :rtype: str
     """
 
-    powersgloss = ''
-    subpowersgloss = ''
-    if self.powers is not None:
-      powersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers)
-      subpowersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective')
-
-    if self.container.operator == 'PRP':
-      # (PRP (DRW
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        if self.powers is None:
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + ' we pursue a draw.'
-        else:
-          self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + ' we pursue a draw between ' + powersgloss + '.'
-      # (YES (PRP (DRW
-      elif self.container.container.operator == 'YES':
-        if self.powers is None:
-          self.english = 'I ' + random.choice(['agree to', 'concur with']) + ' pursuing a draw.'
-        else:
-          self.english = 'I ' + random.choice(['agree to', 'concur with']) + ' pursuing a draw between ' + powersgloss + '.'
-      # (REJ (PRP (DRW
-      elif self.container.container.operator == 'REJ':
-        if self.powers is None:
-          self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of', 'do not agree to']) + ' pursuing a draw.'
-        else:
-          self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of', 'do not agree to']) + ' pursuing a draw between ' + powersgloss + '.'
-      # (CCL (PRP (DRW
-      elif self.container.container.operator == 'CCL':
-        if self.powers is None:
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of a draw.'
-        else:
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of a draw between ' + powersgloss + '.'
-      # (HUH (PRP (DRW
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your draw proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (DRW
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          if self.powers is None:
-            self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + ' we do not pursue a draw.'
-          else:
-            self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + ' we do not pursue a draw between ' + powersgloss + '.'
-        # (YES (PRP (NOT (DRW
-        elif self.container.container.container.operator == 'YES':
-          if self.powers is None:
-            self.english = 'I ' + random.choice(['agree that', 'concur that']) + ' we should not pursue a draw.'
-          else:
-            self.english = 'I ' + random.choice(['agree that', 'concur that']) + ' we should not pursue a draw between ' + powersgloss + '.'
-        # (REJ (PRP (NOT (DRW
-        elif self.container.container.container.operator == 'REJ':
-          if self.powers is None:
-            self.english = 'I ' + random.choice(['still think', 'nevertheless believe']) + ' we should pursue a draw.'
-          else:
-            self.english = 'I ' + random.choice(['still think', 'nevertheless believe']) + ' we should pursue a draw between ' + powersgloss + '.'
-        # (CCL (PRP (NOT (DRW
-        elif self.container.container.container.operator == 'CCL':
-          if self.powers is None:
-            self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that we do not draw.'
-          else:
-            self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + subpowersgloss + ' not pursue a draw.'
-        # (HUH (PRP (NOT (DRW
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a draw.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (DRW
-        if self.container.container.container is None:
-          if self.powers is None:
-            self.english = 'I am not pursuing a draw.'
-          else:
-            self.english = subpowersgloss + ' are not pursuing a draw.'
-        # (HUH (FCT (NOT (DRW
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a draw.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (DRW
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          if self.powers is None:
-            self.english = 'It is ' + random.choice(['unclear', 'fuzzy', 'uncertain']) + ' that we should pursue a draw.'
-          else:
-            self.english = 'It is ' + random.choice(['unclear', 'fuzzy', 'uncertain']) + ' that ' + subpowersgloss + ' should pursue a draw.'
-        # (YES (PRP (NAR (DRW
-        elif self.container.container.container.operator == 'YES':
-          if self.powers is None:
-            self.english = 'I ' + random.choice(['agree', 'concur']) + ' that it is ' + random.choice(['unclear', 'fuzzy', 'uncertain']) + ' that we should pursue a draw.'
-          else:
-            self.english = 'I ' + random.choice(['agree', 'concur']) + ' that it is ' + random.choice(['unclear', 'fuzzy', 'uncertain']) + ' that ' + subpowersgloss + ' should pursue a draw.'
-        # (REJ (PRP (NAR (DRW
-        elif self.container.container.container.operator == 'REJ':
-          if self.powers is None:
-            self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that we should pursue a draw.'
-          else:
-            self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that ' + subpowersgloss + ' should pursue a draw.'
-        # (CCL (PRP (NAR (DRW
-        elif self.container.container.container.operator == 'CCL':
-          if self.powers is None:
-            self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal regarding a draw.'
-          else:
-            self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal regarding a draw between ' + powersgloss + '.'
-        # (HUH (PRP (NAR (DRW
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a draw.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (DRW
-        if self.container.container.container is None:
-          if self.powers is None:
-            self.english = 'It is unclear if we are in a good draw position.'
-          else:
-            self.english = 'It is unclear if ' + subpowersgloss + ' are in a good draw position.'
-        # (HUH (FCT (NAR (DRW
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a draw.'
-    elif self.container.operator == 'FCT':
-      # (FCT (DRW
-      if self.container.container is None:
-        if self.powers is None:
-          self.english = 'We are in a good draw position.'
-        else:
-          self.english = subpowersgloss + ' are in a good draw position.'
-      # (HUH (FCT (DRW
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about a draw.'
-    else:
-      self.english = self.formlistenglish()
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + \
+                   ' avoid ' + self.utterance.rng.choice(helpers.phrasebanks['establishing']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
     return self.english
 
-  def formlistenglish(self): # type () -> str
+  def huhprpnarenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (PRP (NAR (PCE ...))).
 
-    :return: the simple English expression
+    :return: the English expression
     :rtype: str
     """
 
-    if self.powers is None:
-      self.simpleenglish = 'a draw'
-    else:
-      self.simpleenglish = 'a draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers)
+    self.english = 'I do not understand your proposal about a peace treaty.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formclauseenglish(self): # type () -> str
+  def fctnarenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Forms the English for FCT (NAR (PCE ...)) sent as it is.
 
-    :return: the simple English expression
+    :return: the English expression
     :rtype: str
     """
 
-    if self.powers is None and self.container.operator == "NOT":
-      self.simpleenglish = 'no draw'
-    elif self.powers is None:
-      self.simpleenglish = 'a draw'
-    elif self.container.operator == "NOT":
-      self.simpleenglish = 'no draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers)
-    else:
-      self.simpleenglish = 'a draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers)
+    self.english = 'It is unclear if ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['areina']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formDAIDE(self): # type () -> str
+  def huhfctnarenglish(self): # type: () -> str
     """
-    Create a DAIDE representation of this Message
+    Forms the English for HUH (FCT (NAR (PCE ...))).
 
-    :return: the DAIDE message
+    :return: the English expression
     :rtype: str
     """
 
-    if self.powers is None:
-      return 'DRW'
-    else:
-      return 'DRW (' + ' '.join(self.powers) + ')'
+    self.english = 'I do not understand your statement about a peace treaty.'
 
-class PressSolo(PressMessage):
-  """ The game-related content of a solo win. """
+    return self.english
 
-  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+  def fctenglish(self): # type: () -> str
     """
-    Initialize the message with an utterance
+    Forms the English for FCT (PCE ...) sent as it is.
 
-    :param utterance: the press utterance that this message is within the content for
-    :type utterance: PressUtterance
-    :param container: the press message that contains this one
-    :type container: PressMessage
-    :param thelists: the parsed, nested DAIDE statement
-    :type thelists: []
+    :return: the English expression
+    :rtype: str
     """
 
-    super().__init__(utterance, container)
-    if thelists is None or len(thelists) == 0:
-      self.operator = 'SLO'
-      if random.choice([True, True, False]):
-        self.winner = [utterance.frompower]
-      else:
-        self.winner = [random.choice(helpers.powerlist)]
-    elif len(thelists) == 2:
-      self.operator = thelists[0]
-      self.winner = thelists[1]
-      self.swimthechannel()
+    self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['areina']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
-  def formenglish(self): # type () -> str
+    return self.english
+
+  def huhfctenglish(self): # type: () -> str
     """
-    Creates an English expression about the solo win in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (FCT (PCE ...)).
 
     :return: the English expression
     :rtype: str
     """
 
-    winnergloss = helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers)
-    if self.container.operator == 'PRP':
-      # (PRP (SLO
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        if winnergloss == 'me':
-          self.english = 'I am ' + random.choice(['in a good position for a solo win', 'going for a solo win', 'not catchable - watch my solo win', 'just a matter of turns away from winning']) + '.'
-        elif winnergloss == 'you':
-          self.english = 'You are ' + random.choice(['in a good position for a solo win', 'going for a solo win', 'not catchable - go for a solo win', 'just a matter of turns away from winning']) + '.'
-        else:
-          self.english = winnergloss + ' is ' + random.choice(['in a good position for a solo win', 'going for a solo win', 'not catchable - going for a solo win', 'just a matter of turns away from winning']) + '.'
-      # (YES (PRP (SLO
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with']) + ' the likelihood of a solo win by ' + winnergloss + '.'
-      # (REJ (PRP (SLO
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['disagree with', 'reject']) + ' the likelihood of a solo win by ' + winnergloss + '.'
-      # (CCL (PRP (SLO
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of a solo win by ' + winnergloss + '.'
-      # (HUH (PRP (SLO
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your solo win proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (SLO
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          if winnergloss == 'me':
-            self.english = 'I am ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'You are ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          else:
-            self.english = winnergloss + ' is ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-        # (YES (PRP (NOT (SLO
-        elif self.container.container.container.operator == 'YES':
-          if winnergloss == 'me':
-            self.english = 'I agree I am ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'I agree you are ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          else:
-            self.english = 'I agree ' + winnergloss + ' is ' + random.choice(['not in a good position for a solo win', 'not going for a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-        # (REJ (PRP (NOT (SLO
-        elif self.container.container.container.operator == 'REJ':
-          if winnergloss == 'me':
-            self.english = 'I think I am ' + random.choice(['closer to a win than you think', 'going for a solo win anyway', 'nevertheless uncatchable', 'quite close to winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'I think you are ' + random.choice(['closer to a win than you think', 'going for a solo win anyway', 'nevertheless uncatchable', 'quite close to winning']) + '.'
-          else:
-            self.english = 'I think ' + winnergloss + ' is ' + random.choice(['closer to a win than you think', 'going for a solo win anyway', 'nevertheless uncatchable', 'quite close to winning']) + '.'
-        # (CCL (PRP (NOT (SLO
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that a solo win is not in the cards for ' + winnergloss + '.'
-        # (HUH (PRP (NOT (SLO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a solo win.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (SLO
-        if self.container.container.container is None:
-          self.english = winnergloss + ' is not pursuing a solo win.'
-        # (HUH (FCT (NOT (SLO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a solo win.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (SLO
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          if winnergloss == 'me':
-            self.english = 'I am ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'You are ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          else:
-            self.english = winnergloss + ' is ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-        # (YES (PRP (NAR (SLO
-        elif self.container.container.container.operator == 'YES':
-          if winnergloss == 'me':
-            self.english = 'I agree I am ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'I agree you are ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-          else:
-            self.english = 'I agree ' + winnergloss + ' is ' + random.choice(['unsure about a solo win', 'on the fence about a solo win', 'not uncatchable - no solo win yet', 'still a ways from winning']) + '.'
-        # (REJ (PRP (NAR (SLO
-        elif self.container.container.container.operator == 'REJ':
-          if winnergloss == 'me':
-            self.english = 'I disagree - I am ' + random.choice(['pretty sure about a solo win', 'close to a solo win', 'uncatchable - solo win not far away', 'just a few moves from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'I disagree - you are ' + random.choice(['pretty sure about a solo win', 'close to a solo win', 'uncatchable - solo win not far away', 'just a few moves from winning']) + '.'
-          else:
-            self.english = 'I disagree - ' + winnergloss + ' is ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable - solo win not far away', 'just a few moves from winning']) + '.'
-        # (CCL (PRP (NAR (SLO
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal that ' + \
-                         winnergloss + ' is not clearly capable of a solo win.'
-        # (HUH (PRP (NAR (SLO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a solo win.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (SLO
-        if self.container.container.container is None:
-          if winnergloss == 'me':
-            self.english = 'It is unclear if I am ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-          elif winnergloss == 'you':
-            self.english = 'It is unlcear if you are ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-          else:
-            self.english = 'I it is unlcear if ' + winnergloss + ' is ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-        # (HUH (FCT (NAR (SLO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a solo win.'
-    elif self.container.operator == 'FCT':
-      # (FCT (SLO
-      if self.container.container is None:
-        if winnergloss == 'me':
-          self.english = 'I am ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-        elif winnergloss == 'you':
-          self.english = 'You are ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-        else:
-          self.english = winnergloss + ' is ' + random.choice(['pretty sure for a solo win', 'close to a solo win', 'uncatchable', 'just a few moves from winning']) + '.'
-      # (HUH (FCT (SLO
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about a solo win.'
-    else:
-      self.english = self.formlistenglish()
+    self.english = 'I do not understand your statement about a peace treaty.'
 
     return self.english
 
-  def formlistenglish(self): # type () -> str
+  def formlistenglish(self): # type: () -> str
     """
-    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+    Creates a simple English statement about this peace deal, without any context like proposals, negations, etc.
+    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
 
-    :return: the simple English expression
+    :return: the simple English statement
     :rtype: str
+
     """
 
-    self.simpleenglish = 'a solo win by ' + helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers)
+    self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['peacetreaty']) + '.'
 
     return self.simpleenglish
 
-  def formclauseenglish(self):
+  def formclauseenglish(self): # type: () -> str
+    """
+    Creates a simple English statement about this peace deal, without any context like proposals, negations, etc.
+    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+
+    :return: the simple English statement
+    :rtype: str
+
+    """
 
     if self.container.operator == "NOT":
-      self.simpleenglish = 'there will not be '
+      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers,
+                                                case='Subjective', rng=self.utterance.rng) + ' ' + \
+                           self.utterance.rng.choice(helpers.phrasebanks['refusetoestablish']) + ' a ' + \
+                           self.utterance.rng.choice(helpers.phrasebanks['peacetreaty'])
     else:
-      self.simpleenglish = 'there will be '
-    self.simpleenglish +=  'a solo win by ' + helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers)
+      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['peacetreaty'])
 
     return self.simpleenglish
 
@@ -1834,10 +1533,12 @@ class PressSolo(PressMessage):
     :rtype: str
     """
 
-    return 'SLO (' + self.winner[0] + ')'
+    return 'PCE (' + ' '.join(self.allies) + ')'
 
-class PressAnd(PressMessage):
-  """ The game-related content of a conjunction. """
+class PressAlliance(PressMessage):
+  """ The game-related content of an alliance. """
+
+  __slots__ = ('allies', 'opponents')
 
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
@@ -1852,263 +1553,2427 @@ class PressAnd(PressMessage):
     """
 
     super().__init__(utterance, container)
-    self.conjuncts = []
     if thelists is None or len(thelists) == 0:
-      self.operator = 'AND'
-      for cconj in range(0, random.randint(2, 4)):
-        conjword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR'])
-        self.conjuncts.append(randomFactory(utterance, self, conjword))
-    elif len(thelists) > 1:
+      self.operator = 'ALY'
+      if self.utterance.rng.choice((True, True, False)):
+        self.allies = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
+        opplist = [curpower for curpower in helpers.powerlist if curpower not in self.allies]
+        self.opponents = self.utterance.rng.sample(opplist, self.utterance.rng.randint(1, min(3, len(opplist))))
+      else:
+        self.allies = self.utterance.rng.sample(helpers.powerlist, self.utterance.rng.randint(2, 3))
+        opplist = [curpower for curpower in helpers.powerlist if curpower not in self.allies and curpower != utterance.frompower]
+        self.opponents = self.utterance.rng.sample(opplist, self.utterance.rng.randint(1, min(3, len(opplist))))
+    elif len(thelists) == 4:
       self.operator = thelists[0]
-      for cConj in range(1, len(thelists)):
-        self.conjuncts.append(messageFactory(utterance, self, thelists[cConj]))
-      self.swimthechannel()
+      self.allies = thelists[1]
+      self.opponents = thelists[3]
 
   def formenglish(self): # type () -> str
     """
-    Creates an English expression about the conjunction in the context of a sender, recipients and desired tone.
+    Creates an English expression about the alliance in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.container is None:
+      self.english = 'Ahem.'
+      return self.english
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self)
+
+    return self.english
+
+  def prpenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (ALY ...) sent as it is or as the consequence of a conditional.
 
     :return: the English expression
     :rtype: str
     """
 
-    if self.container.operator == 'PRP':
-      # (PRP (AND
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + \
-                       ' all of the following: ' + self.formlistenglish()
-      # (YES (PRP (AND
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with', 'will accept']) + ' all of the following: ' + self.formlistenglish()
-      # (REJ (PRP (AND
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of', 'do not accept']) + \
-                       ' all of the following: ' + self.formlistenglish()
-      # (CCL (PRP (AND
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of the following: ' + self.formlistenglish()
-      # (HUH (PRP (AND
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your list of proposals.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (AND
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I do not ' + random.choice(['want', 'desire', 'support']) + ' the following: ' + self.formlistenglish()
-        # (YES (PRP (NOT (AND
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that none of the following are desirable: ' + self.formlistenglish()
-        # (REJ (PRP (NOT (AND
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'I ' + random.choice(['disagree', 'reject']) + ' that none of the following are desirable: ' + self.formlistenglish()
-        # (CCL (PRP (NOT (AND
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal rejecting the following: ' + self.formlistenglish()
-        # (HUH (PRP (NOT (AND
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of proposals.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (AND
-        if self.container.container.container is None:
-          self.english = 'The following conditions are not true: ' + self.formlistenglish()
-        # (HUH (FCT (NOT (AND
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of statements.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (AND
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['am ambivalent about', 'am unsure about', 'am not convinced of']) + ' the following: ' + self.formlistenglish()
-        # (YES (PRP (NAR (AND
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I am also ' + random.choice(['ambivalent about', 'unsure about', 'not convinced of']) + ' the following: ' + self.formlistenglish()
-        # (REJ (PRP (NAR (AND
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['reject', 'oppose']) + ' your ambivalence about: ' + self.formlistenglish()
-        # (CCL (PRP (NAR (AND
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my ambivalence about the following: ' + self.formlistenglish()
-        # (HUH (PRP (NAR (AND
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of proposals.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (AND
-        if self.container.container.container is None:
-          self.english = 'It is unclear if the following are true: ' + self.formlistenglish()
-        # (HUH (FCT (NAR (AND
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of statements.'
-    elif self.container.operator == 'FCT':
-      # (FCT (AND
-      if self.container.container is None:
-        self.english = 'The following are all true: ' + self.formlistenglish()
-      # (HUH (FCT (AND
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your list of statements.'
+    if self.utterance.rng.choice((True, False)):
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + \
+                     ' ' + self.utterance.rng.choice(helpers.phrasebanks['alliance']) + \
+                     ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + \
+                     ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
     else:
-      self.english = self.formlistenglish()
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['propose']) + ' that ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['alliance']) + \
+                     ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
     return self.english
 
-  def formlistenglish(self): # type () -> str
+  def yesprpenglish(self): # type: () -> str
     """
-    Creates an English expression about the conjunction in the context of a sender, recipients and desired tone.
+    Forms the English for YES (PRP (ALY ...)).
 
     :return: the English expression
     :rtype: str
     """
 
-    self.simpleenglish = '<br><ul>'
-    for curConj in self.conjuncts:
-      self.simpleenglish += '<li>' + helpers.initcap(curConj.formlistenglish()) + '</li>'
-    self.simpleenglish += '</ul>'
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreetoappreciate']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + \
+                   ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-    return self.simpleenglish
+    return self.english
 
-  def formclauseenglish(self): # type: () -> str
+  def rejprpenglish(self): # type: () -> str
     """
-    Creates a simple English clause, without any context like proposals, negations, etc.
-    Useful for conditional statements or other contexts in which simplicity is valued over flavor.
+    Forms the English for REJ (PRP (ALY ...)).
 
-    :return: the simple English clause
+    :return: the English expression
     :rtype: str
+    """
 
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['reject']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + \
+                   ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def cclprpenglish(self): # type: () -> str
     """
+    Forms the English for CCL (PRP (ALY ...)).
 
-    self.simpleenglish = self.formlistenglish()
+    :return: the English expression
+    :rtype: str
+    """
 
-    return self.simpleenglish
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + \
+                   ' between ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + \
+                   ' against ' + helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-  def formDAIDE(self): # type () -> str
+    return self.english
+
+  def huhprpenglish(self): # type: () -> str
     """
-    Create a DAIDE representation of this Message
+    Forms the English for HUH (PRP (ALY ...)).
 
-    :return: the DAIDE message
+    :return: the English expression
     :rtype: str
     """
 
-    return 'AND ' + ' '.join(['(' + curconj.formDAIDE() + ')' for curconj in self.conjuncts])
+    self.english = 'I do not understand your alliance proposal.'
 
-  def swimthechannel(self): # type: () -> None
+    return self.english
+
+  def prpnotenglish(self): # type: () -> str
     """
-    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power
+    Forms the English for PRP (NOT (ALY ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['ask']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
+    return self.english
+
+  def yesprpnotenglish(self): # type: () -> str
     """
+    Forms the English for YES (PRP (NOT (ALY ...))).
 
-    for conj in self.conjuncts:
-      conj.swimthechannel()
+    :return: the English expression
+    :rtype: str
+    """
 
-class PressOr(PressMessage):
-  """ The game-related content of a disjunction. """
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
 
-  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    return self.english
+
+  def rejprpnotenglish(self): # type: () -> str
     """
-    Initialize the message with an utterance
+    Forms the English for REJ (PRP (NOT (ALY ...))).
 
-    :param utterance: the press utterance that this message is within the content for
-    :type utterance: PressUtterance
-    :param container: the press message that contains this one
-    :type container: PressMessage
-    :param thelists: the parsed, nested DAIDE statement
-    :type thelists: []
+    :return: the English expression
+    :rtype: str
     """
 
-    super().__init__(utterance, container)
-    self.disjuncts = []
-    if thelists is None or len(thelists) == 0:
-      self.operator = 'AND'
-      for cdisj in range(0, random.randint(2, 4)):
-        disjword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR'])
-        self.disjuncts.append(randomFactory(utterance, self, disjword))
-    elif len(thelists) > 1:
-      self.operator = thelists[0]
-      for cDisj in range(1, len(thelists)):
-        self.disjuncts.append(messageFactory(utterance, self, thelists[cDisj]))
-      self.swimthechannel()
+    if self.utterance.rng.choice((True, False)):
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagree']) + ' that ' + \
+                     helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                     helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+    else:
+      self.english = 'No, ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['shouldbefree']) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['forming']) + ' ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                     helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def cclprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NOT (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def huhprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NOT (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about an alliance.'
+
+    return self.english
+
+  def fctnotenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NOT (ALY ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arenotin']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['current']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliancenoun']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+    self.english = self.english.replace(' a alliance', ' an alliance')
+
+    return self.english
+
+  def huhfctnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NOT (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about an alliance.'
+
+    return self.english
+
+  def prpnarenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NAR (ALY ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['doubt']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def yesprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NAR (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def rejprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NAR (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + \
+                   ' should in fact be able to ' + self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def cclprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NAR (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def huhprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NAR (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about an alliance.'
+
+    return self.english
+
+  def fctnarenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NAR (ALY ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unclear if ' + helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arein']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def huhfctnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NAR (ALY ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about an alliance.'
+
+    return self.english
+
+  def fctenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (ALY ...) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arein']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                   helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.english
+
+  def huhfctenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (ALY ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about an alliance.'
+
+    return self.english
+
+  def formlistenglish(self): # type: () -> str
+    """
+    Creates a simple English statement about this alliance, without any context like proposals, negations, etc.
+    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+
+    :return: the simple English statement
+    :rtype: str
+
+    """
+
+    self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng) + '.'
+
+    return self.simpleenglish
+
+  def formclauseenglish(self): # type: () -> str
+    """
+    Creates a simple English statement about this alliance, without any context like proposals, negations, etc.
+    Useful for lists of conjunctions or other contexts in which simplicity is valued over flavor.
+
+    :return: the simple English statement
+    :rtype: str
+
+    """
+    if self.container.operator == "NOT":  #For example, NOT ( PRP ( ALY
+      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers,
+                                                case='Subjective', rng=self.utterance.rng) + ' ' + \
+                           self.utterance.rng.choice(helpers.phrasebanks['willnotform']) + ' ' + \
+                           self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                           helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+    else:
+      self.simpleenglish = helpers.listOfPowers(self.allies, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' ' + \
+                         self.utterance.rng.choice(helpers.phrasebanks['alliance']) + ' against ' + \
+                         helpers.listOfPowers(self.opponents, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    return self.simpleenglish
+
+  def formDAIDE(self): # type () -> str
+    """
+    Create a DAIDE representation of this Message
+
+    :return: the DAIDE message
+    :rtype: str
+    """
+
+    return 'ALY (' + ' '.join(self.allies) + ') VSS (' + ' '.join(self.opponents) + ')'
+
+class PressDMZ(PressMessage):
+  """ The game-related content of a DMZ. """
+
+  __slots__ = ('powers', 'provinces')
+
+  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    """
+    Initialize the message with an utterance
+
+    :param utterance: the press utterance that this message is within the content for
+    :type utterance: PressUtterance
+    :param container: the press message that contains this one
+    :type container: PressMessage
+    :param thelists: the parsed, nested DAIDE statement
+    :type thelists: []
+    """
+
+    super().__init__(utterance, container)
+    if thelists is None or len(thelists) == 0:
+      self.operator = 'DMZ'
+      if self.utterance.rng.choice((True, True, False)):
+        self.powers = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
+      else:
+        self.powers = self.utterance.rng.sample(helpers.powerlist, self.utterance.rng.randint(1, 3))
+      self.provinces = self.utterance.rng.sample(helpers.provincelist, self.utterance.rng.randint(1, 3))
+    elif len(thelists) == 3:
+      self.operator = thelists[0]
+      self.powers = thelists[1]
+      self.provinces = thelists[2]
+
+  def formenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    powersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng)
+    provincesgloss = helpers.listOfProvinces(self.provinces)
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self, powersgloss, provincesgloss)
+
+    return self.english
+
+  def prpenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (DMZ ...) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if 'you ' in powersgloss.lower() and 'and me' in powersgloss.lower():
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + \
+                     ' we ' + self.utterance.rng.choice(helpers.phrasebanks['keepout']) + ' ' + \
+                     provincesgloss + '.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + ' that ' + \
+                     powersgloss + ' ' + self.utterance.rng.choice(helpers.phrasebanks['keepoutzone']) + ' ' + \
+                     provincesgloss + '.'
+
+    return self.english
+
+  def yesprpenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (DMZ ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreeto']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['keepingout']) + ' ' + \
+                   provincesgloss + ', covering ' + powersgloss + '.'
+
+    return self.english
+
+  def rejprpenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (DMZ ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['reject']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['keepingout']) + ' ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def cclprpenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (DMZ ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmzin']) + ' ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def huhprpenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (DMZ ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your DMZ proposal.'
+
+    return self.english
+
+  def prpnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (NOT (DMZ ...)) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.utterance.rng.choice((True, False)):
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['ask']) + ' that ' + \
+                     powersgloss + ' have free movement into and through ' + \
+                     provincesgloss + '.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['ask']) + ' that no ' + \
+                     self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' exist in ' + \
+                     provincesgloss + '.'
+
+    return self.english
+
+  def yesprpnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (NOT (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   powersgloss + ' have free movement into and through ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def rejprpnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (NOT (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagreewith']) + ' free movement into and through ' + \
+                   provincesgloss + ' for ' + powersgloss + '.'
+
+    return self.english
+
+  def cclprpnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (NOT (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   provincesgloss + ' not enjoy a ' + self.utterance.rng.choice(helpers.phrasebanks['dmz']) + \
+                   ' with respect to ' + powersgloss + '.'
+
+    return self.english
+
+  def huhprpnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (NOT (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a DMZ.'
+
+    return self.english
+
+  def fctnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (NOT (DMZ ...)) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = powersgloss + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arenotinrespect']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['current']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def huhfctnotenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (NOT (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a DMZ.'
+
+    return self.english
+
+  def prpnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (NAR (DMZ ...)) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['doubt']) + ' that ' + \
+                   helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def yesprpnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (NAR (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that ' + \
+                   helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def rejprpnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (NAR (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that ' + \
+                   helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   ' should in fact be able to ' + self.utterance.rng.choice(helpers.phrasebanks['establish']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def cclprpnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (NAR (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' should not ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['form']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def huhprpnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (NAR (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a DMZ.'
+
+    return self.english
+
+  def fctnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (NAR (DMZ ...)) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unclear if ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arein']) + ' a ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def huhfctnarenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (NAR (DMZ ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a DMZ.'
+
+    return self.english
+
+  def fctenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (DMZ ...) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['arein']) + ' ' + \
+                   self.utterance.rng.choice(helpers.phrasebanks['dmz']) + ' in ' + \
+                   provincesgloss + '.'
+
+    return self.english
+
+  def huhfctenglish(self, powersgloss, provincesgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (DMZ ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param provincesgloss: the provinces glossed
+    :type provincesgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a DMZ.'
+
+    return self.english
+
+  def formlistenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' form a DMZ in ' + helpers.listOfProvinces(self.provinces) + '.'
+
+    return self.simpleenglish
+
+  def formclauseenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+    if self.container.operator == "NOT":
+      self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' will not form a DMZ in ' + helpers.listOfProvinces(self.provinces) + ''
+    else:
+      self.simpleenglish = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng) + ' form a DMZ in ' + helpers.listOfProvinces(self.provinces) + ''
+
+    return self.simpleenglish
+
+  def formDAIDE(self): # type () -> str
+    """
+    Create a DAIDE representation of this Message
+
+    :return: the DAIDE message
+    :rtype: str
+    """
+
+    return 'DMZ (' + ' '.join(self.powers) + ') (' + ' '.join(self.provinces) + ')'
+
+  def swimthechannel(self): # type: () -> None
+    """
+    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power
+
+    """
+
+    if 'ENG' in self.provinces:
+      provinces = list(self.provinces)
+      provinces.remove('ENG')
+      provinces.append('ECH')
+      self.provinces = provinces
+
+class PressDraw(PressMessage):
+  """ The game-related content of a draw. """
+
+  __slots__ = ('powers', 'provinces')
+
+  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    """
+    Initialize the message with an utterance
+
+    :param utterance: the press utterance that this message is within the content for
+    :type utterance: PressUtterance
+    :param container: the press message that contains this one
+    :type container: PressMessage
+    :param thelists: the parsed, nested DAIDE statement
+    :type thelists: []
+    """
+
+    super().__init__(utterance, container)
+    if thelists is None or len(thelists) == 0:
+      self.operator = 'DRW'
+      if self.utterance.rng.choice((True, True, False)):
+        self.powers = [curpower for curpower in helpers.powerlist if curpower in utterance.topowers or curpower == utterance.frompower]
+      else:
+        self.powers = None
+      self.provinces = self.utterance.rng.sample(helpers.provincelist, self.utterance.rng.randint(1, 3))
+    else:
+      self.operator = thelists[0]
+      if len(thelists) > 1:
+        self.powers = thelists[1]
+      else:
+        self.powers = None
+
+  def formenglish(self): # type () -> str
+    """
+    Creates an English expression about the draw in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    powersgloss = ''
+    subpowersgloss = ''
+    if self.powers is not None:
+      powersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+      subpowersgloss = helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, case='Subjective', rng=self.utterance.rng)
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self, powersgloss, subpowersgloss)
+
+    return self.english
+
+  def prpenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (DRW ...) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + ' we pursue a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + ' we pursue a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def yesprpenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (DRW ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreeto']) + ' pursuing a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreeto']) + ' pursuing a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def rejprpenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (DRW ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['rejectagree']) + ' pursuing a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['rejectagree']) + ' pursuing a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def cclprpenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (DRW ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of a draw.'
+    else:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def huhprpenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (DRW ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your draw proposal.'
+
+    return self.english
+
+  def prpnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (NOT (DRW ...)) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + ' we do not pursue a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + ' we do not pursue a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def yesprpnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (NOT (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreethat']) + ' we should not pursue a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreethat']) + ' we should not pursue a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def rejprpnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (NOT (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['stillthink']) + ' we should pursue a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['stillthink']) + ' we should pursue a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def cclprpnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (NOT (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that we do not draw.'
+    else:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + subpowersgloss + ' not pursue a draw.'
+
+    return self.english
+
+  def huhprpnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (NOT (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a draw.'
+
+    return self.english
+
+  def fctnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (NOT (DRW ...)) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I am not pursuing a draw.'
+    else:
+      self.english = subpowersgloss + ' are not pursuing a draw.'
+
+    return self.english
+
+  def huhfctnotenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (NOT (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a draw.'
+
+    return self.english
+
+  def prpnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for PRP (NAR (DRW ...)) sent as it is or as the consequence of a conditional.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'It is ' + self.utterance.rng.choice(helpers.phrasebanks['unclear']) + ' that we should pursue a draw.'
+    else:
+      self.english = 'It is ' + self.utterance.rng.choice(helpers.phrasebanks['unclear']) + ' that ' + subpowersgloss + ' should pursue a draw.'
+
+    return self.english
+
+  def yesprpnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for YES (PRP (NAR (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that it is ' + self.utterance.rng.choice(helpers.phrasebanks['unclear']) + ' that we should pursue a draw.'
+    else:
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that it is ' + self.utterance.rng.choice(helpers.phrasebanks['unclear']) + ' that ' + subpowersgloss + ' should pursue a draw.'
+
+    return self.english
+
+  def rejprpnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for REJ (PRP (NAR (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that we should pursue a draw.'
+    else:
+      self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that ' + subpowersgloss + ' should pursue a draw.'
+
+    return self.english
+
+  def cclprpnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for CCL (PRP (NAR (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal regarding a draw.'
+    else:
+      self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal regarding a draw between ' + powersgloss + '.'
+
+    return self.english
+
+  def huhprpnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (PRP (NAR (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a draw.'
+
+    return self.english
+
+  def fctnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (NAR (DRW ...)) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'It is unclear if we are in a good draw position.'
+    else:
+      self.english = 'It is unclear if ' + subpowersgloss + ' are in a good draw position.'
+
+    return self.english
+
+  def huhfctnarenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (NAR (DRW ...))).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a draw.'
+
+    return self.english
+
+  def fctenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for FCT (DRW ...) sent as it is.
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.english = 'We are in a good draw position.'
+    else:
+      self.english = subpowersgloss + ' are in a good draw position.'
+
+    return self.english
+
+  def huhfctenglish(self, powersgloss, subpowersgloss): # type: (str, str) -> str
+    """
+    Forms the English for HUH (FCT (DRW ...)).
+
+    :param powersgloss: the powers glossed
+    :type powersgloss: str
+    :param subpowersgloss: the subpowers glossed
+    :type subpowersgloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a draw.'
+
+    return self.english
+
+  def formlistenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the simple English expression
+    :rtype: str
+    """
+
+    if self.powers is None:
+      self.simpleenglish = 'a draw'
+    else:
+      self.simpleenglish = 'a draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    return self.simpleenglish
+
+  def formclauseenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the simple English expression
+    :rtype: str
+    """
+
+    if self.powers is None and self.container.operator == "NOT":
+      self.simpleenglish = 'no draw'
+    elif self.powers is None:
+      self.simpleenglish = 'a draw'
+    elif self.container.operator == "NOT":
+      self.simpleenglish = 'no draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+    else:
+      self.simpleenglish = 'a draw between ' + helpers.listOfPowers(self.powers, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    return self.simpleenglish
+
+  def formDAIDE(self): # type () -> str
+    """
+    Create a DAIDE representation of this Message
+
+    :return: the DAIDE message
+    :rtype: str
+    """
+
+    if self.powers is None:
+      return 'DRW'
+    else:
+      return 'DRW (' + ' '.join(self.powers) + ')'
+
+class PressSolo(PressMessage):
+  """ The game-related content of a solo win. """
+
+  __slots__ = ('winner',)
+
+  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    """
+    Initialize the message with an utterance
+
+    :param utterance: the press utterance that this message is within the content for
+    :type utterance: PressUtterance
+    :param container: the press message that contains this one
+    :type container: PressMessage
+    :param thelists: the parsed, nested DAIDE statement
+    :type thelists: []
+    """
+
+    super().__init__(utterance, container)
+    if thelists is None or len(thelists) == 0:
+      self.operator = 'SLO'
+      if self.utterance.rng.choice((True, True, False)):
+        self.winner = [utterance.frompower]
+      else:
+        self.winner = [self.utterance.rng.choice(helpers.powerlist)]
+    elif len(thelists) == 2:
+      self.operator = thelists[0]
+      self.winner = thelists[1]
+
+  def formenglish(self): # type () -> str
+    """
+    Creates an English expression about the solo win in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    winnergloss = helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self, winnergloss)
+
+    return self.english
+
+  def prpenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for PRP (SLO ...) sent as it is or as the consequence of a conditional.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I am ' + self.utterance.rng.choice(helpers.phrasebanks['solofirstperson']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'You are ' + self.utterance.rng.choice(helpers.phrasebanks['solosecondperson']) + '.'
+    else:
+      self.english = winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['solothirdperson']) + '.'
+
+    return self.english
+
+  def yesprpenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for YES (PRP (SLO ...)).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreeto']) + ' the likelihood of a solo win by ' + winnergloss + '.'
+
+    return self.english
+
+  def rejprpenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for REJ (PRP (SLO ...)).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagreewith']) + ' the likelihood of a solo win by ' + winnergloss + '.'
+
+    return self.english
+
+  def cclprpenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for CCL (PRP (SLO ...)).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of a solo win by ' + winnergloss + '.'
+
+    return self.english
+
+  def huhprpenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (PRP (SLO ...)).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your solo win proposal.'
+
+    return self.english
+
+  def prpnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for PRP (NOT (SLO ...)) sent as it is or as the consequence of a conditional.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I am ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'You are ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+    else:
+      self.english = winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+
+    return self.english
+
+  def yesprpnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for YES (PRP (NOT (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I agree I am ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'I agree you are ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+    else:
+      self.english = 'I agree ' + winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['nosolo']) + '.'
+
+    return self.english
+
+  def rejprpnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for REJ (PRP (NOT (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I think I am ' + self.utterance.rng.choice(helpers.phrasebanks['solonevertheless']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'I think you are ' + self.utterance.rng.choice(helpers.phrasebanks['solonevertheless']) + '.'
+    else:
+      self.english = 'I think ' + winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['solonevertheless']) + '.'
+
+    return self.english
+
+  def cclprpnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for CCL (PRP (NOT (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that a solo win is not in the cards for ' + winnergloss + '.'
+
+    return self.english
+
+  def huhprpnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (PRP (NOT (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a solo win.'
+
+    return self.english
+
+  def fctnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for FCT (NOT (SLO ...)) sent as it is.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = winnergloss + ' is not pursuing a solo win.'
+
+    return self.english
+
+  def huhfctnotenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (FCT (NOT (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a solo win.'
+
+    return self.english
+
+  def prpnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for PRP (NAR (SLO ...)) sent as it is or as the consequence of a conditional.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I am ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'You are ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+    else:
+      self.english = winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+
+    return self.english
+
+  def yesprpnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for YES (PRP (NAR (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I agree I am ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'I agree you are ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+    else:
+      self.english = 'I agree ' + winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['unsuresolo']) + '.'
+
+    return self.english
+
+  def rejprpnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for REJ (PRP (NAR (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I disagree - I am ' + self.utterance.rng.choice(helpers.phrasebanks['nearsoloabout']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'I disagree - you are ' + self.utterance.rng.choice(helpers.phrasebanks['nearsoloabout']) + '.'
+    else:
+      self.english = 'I disagree - ' + winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolofor']) + '.'
+
+    return self.english
+
+  def cclprpnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for CCL (PRP (NAR (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal that ' + \
+                   winnergloss + ' is not clearly capable of a solo win.'
+
+    return self.english
+
+  def huhprpnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (PRP (NAR (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a solo win.'
+
+    return self.english
+
+  def fctnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for FCT (NAR (SLO ...)) sent as it is.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'It is unclear if I am ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'It is unlcear if you are ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+    else:
+      self.english = 'I it is unlcear if ' + winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+
+    return self.english
+
+  def huhfctnarenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (FCT (NAR (SLO ...))).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a solo win.'
+
+    return self.english
+
+  def fctenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for FCT (SLO ...) sent as it is.
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    if winnergloss == 'me':
+      self.english = 'I am ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+    elif winnergloss == 'you':
+      self.english = 'You are ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+    else:
+      self.english = winnergloss + ' is ' + self.utterance.rng.choice(helpers.phrasebanks['nearsolo']) + '.'
+
+    return self.english
+
+  def huhfctenglish(self, winnergloss): # type: (str) -> str
+    """
+    Forms the English for HUH (FCT (SLO ...)).
+
+    :param winnergloss: the winner glossed
+    :type winnergloss: str
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a solo win.'
+
+    return self.english
+
+  def formlistenglish(self): # type () -> str
+    """
+    Creates an English expression about the DMZ in the context of a sender, recipients and desired tone.
+
+    :return: the simple English expression
+    :rtype: str
+    """
+
+    self.simpleenglish = 'a solo win by ' + helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    return self.simpleenglish
+
+  def formclauseenglish(self):
+
+    if self.container.operator == "NOT":
+      self.simpleenglish = 'there will not be '
+    else:
+      self.simpleenglish = 'there will be '
+    self.simpleenglish +=  'a solo win by ' + helpers.listOfPowers(self.winner, self.utterance.frompower, self.utterance.topowers, rng=self.utterance.rng)
+
+    return self.simpleenglish
+
+  def formDAIDE(self): # type () -> str
+    """
+    Create a DAIDE representation of this Message
+
+    :return: the DAIDE message
+    :rtype: str
+    """
+
+    return 'SLO (' + self.winner[0] + ')'
+
+class PressAnd(PressMessage):
+  """ The game-related content of a conjunction. """
+
+  __slots__ = ('conjuncts',)
+
+  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    """
+    Initialize the message with an utterance
+
+    :param utterance: the press utterance that this message is within the content for
+    :type utterance: PressUtterance
+    :param container: the press message that contains this one
+    :type container: PressMessage
+    :param thelists: the parsed, nested DAIDE statement
+    :type thelists: []
+    """
+
+    super().__init__(utterance, container)
+    self.conjuncts = []
+    if thelists is None or len(thelists) == 0:
+      self.operator = 'AND'
+      for cconj in range(0, self.utterance.rng.randint(2, 4)):
+        conjword = self.utterance.rng.choice(randomterms)
+        self.conjuncts.append(randomFactory(utterance, self, conjword))
+    elif len(thelists) > 1:
+      self.operator = thelists[0]
+      for cConj in range(1, len(thelists)):
+        self.conjuncts.append(messageFactory(utterance, self, thelists[cConj]))
+
+  def formenglish(self): # type () -> str
+    """
+    Creates an English expression about the conjunction in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self)
+
+    return self.english
+
+  def prpenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (AND ...) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + \
+                   ' all of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (AND ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreetowillaccept']) + ' all of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (AND ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['rejectaccept']) + \
+                   ' all of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (AND ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (AND ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def prpnotenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NOT (AND ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not ' + self.utterance.rng.choice(helpers.phrasebanks['want']) + ' the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NOT (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that none of the following are desirable: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NOT (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagree']) + ' that none of the following are desirable: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NOT (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal rejecting the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NOT (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def fctnotenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NOT (AND ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'The following conditions are not true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NOT (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of statements.'
+
+    return self.english
+
+  def prpnarenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NAR (AND ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['amambivalent']) + ' the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NAR (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I am also ' + self.utterance.rng.choice(helpers.phrasebanks['ambivalent']) + ' the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NAR (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['oppose']) + ' your ambivalence about: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NAR (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my ambivalence about the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NAR (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def fctnarenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NAR (AND ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unclear if the following are true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NAR (AND ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of statements.'
+
+    return self.english
+
+  def fctenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (AND ...) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'The following are all true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (AND ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of statements.'
+
+    return self.english
+
+  def formlistenglish(self): # type () -> str
+    """
+    Creates an English expression about the conjunction in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.simpleenglish = '<br><ul>'
+    for curConj in self.conjuncts:
+      self.simpleenglish += '<li>' + helpers.initcap(curConj.formlistenglish()) + '</li>'
+    self.simpleenglish += '</ul>'
+
+    return self.simpleenglish
+
+  def formclauseenglish(self): # type: () -> str
+    """
+    Creates a simple English clause, without any context like proposals, negations, etc.
+    Useful for conditional statements or other contexts in which simplicity is valued over flavor.
+
+    :return: the simple English clause
+    :rtype: str
+
+    """
+
+    self.simpleenglish = self.formlistenglish()
+
+    return self.simpleenglish
+
+  def formDAIDE(self): # type () -> str
+    """
+    Create a DAIDE representation of this Message
+
+    :return: the DAIDE message
+    :rtype: str
+    """
+
+    return 'AND ' + ' '.join(['(' + curconj.formDAIDE() + ')' for curconj in self.conjuncts])
+
+  def swimthechannel(self): # type: () -> None
+    """
+    Changes references to the English Channel as ENG to ECH to avoid misunderstanding the province vs the power
+
+    """
+
+    for conj in self.conjuncts:
+      conj.swimthechannel()
+
+class PressOr(PressMessage):
+  """ The game-related content of a disjunction. """
+
+  __slots__ = ('disjuncts',)
+
+  def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
+    """
+    Initialize the message with an utterance
+
+    :param utterance: the press utterance that this message is within the content for
+    :type utterance: PressUtterance
+    :param container: the press message that contains this one
+    :type container: PressMessage
+    :param thelists: the parsed, nested DAIDE statement
+    :type thelists: []
+    """
+
+    super().__init__(utterance, container)
+    self.disjuncts = []
+    if thelists is None or len(thelists) == 0:
+      self.operator = 'AND'
+      for cdisj in range(0, self.utterance.rng.randint(2, 4)):
+        disjword = self.utterance.rng.choice(randomterms)
+        self.disjuncts.append(randomFactory(utterance, self, disjword))
+    elif len(thelists) > 1:
+      self.operator = thelists[0]
+      for cDisj in range(1, len(thelists)):
+        self.disjuncts.append(messageFactory(utterance, self, thelists[cDisj]))
+
+  def formenglish(self): # type () -> str
+    """
+    Creates an English expression about the disjunction in the context of a sender, recipients and desired tone.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    template = englishtemplate(self)
+    if template is not None:
+      template(self)
+
+    return self.english
+
+  def prpenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (ORR ...) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['offer']) + \
+                   ' that you choose one of the following options: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (ORR ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreetowillaccept']) + ' one of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (ORR ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['rejectaccept']) + \
+                   ' any of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (ORR ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of a choice from the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (ORR ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def prpnotenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NOT (ORR ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not ' + self.utterance.rng.choice(helpers.phrasebanks['want']) + ' any of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NOT (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that none of the following are desirable: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NOT (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['disagree']) + ' that none of the following are desirable: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NOT (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal rejecting the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NOT (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def fctnotenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NOT (ORR ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'One of the following conditions are not true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NOT (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of statements.'
+
+    return self.english
+
+  def prpnarenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NAR (ORR ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['amambivalent']) + ' one of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def yesprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NAR (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I am also ' + self.utterance.rng.choice(helpers.phrasebanks['ambivalent']) + ' one the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def rejprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NAR (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['oppose']) + ' your ambivalence about any of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def cclprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NAR (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my ambivalence about one of the following: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NAR (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of proposals.'
+
+    return self.english
+
+  def fctnarenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NAR (ORR ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unclear if each of the following are true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NAR (ORR ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your list of statements.'
+
+    return self.english
+
+  def fctenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (ORR ...) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
 
-  def formenglish(self): # type () -> str
+    self.english = 'One of the following is true: ' + self.formlistenglish()
+
+    return self.english
+
+  def huhfctenglish(self): # type: () -> str
     """
-    Creates an English expression about the disjunction in the context of a sender, recipients and desired tone.
+    Forms the English for HUH (FCT (ORR ...)).
 
     :return: the English expression
     :rtype: str
     """
 
-    if self.container.operator == 'PRP':
-      # (PRP (ORR
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        self.english = 'I ' + random.choice(['propose', 'request', 'offer']) + \
-                       ' that you choose one of the following options: ' + self.formlistenglish()
-      # (YES (PRP (ORR
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with', 'will accept']) + ' one of the following: ' + self.formlistenglish()
-      # (REJ (PRP (ORR
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of', 'do not accept']) + \
-                       ' any of the following: ' + self.formlistenglish()
-      # (CCL (PRP (ORR
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of a choice from the following: ' + self.formlistenglish()
-      # (HUH (PRP (ORR
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your list of proposals.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (ORR
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I do not ' + random.choice(['want', 'desire', 'support']) + ' any of the following: ' + self.formlistenglish()
-        # (YES (PRP (NOT (ORR
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that none of the following are desirable: ' + self.formlistenglish()
-        # (REJ (PRP (NOT (ORR
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'I ' + random.choice(['disagree', 'reject']) + ' that none of the following are desirable: ' + self.formlistenglish()
-        # (CCL (PRP (NOT (ORR
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal rejecting the following: ' + self.formlistenglish()
-        # (HUH (PRP (NOT (ORR
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of proposals.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (ORR
-        if self.container.container.container is None:
-          self.english = 'One of the following conditions are not true: ' + self.formlistenglish()
-        # (HUH (FCT (NOT (ORR
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of statements.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (ORR
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I ' + random.choice(['am ambivalent about', 'am unsure about', 'am not convinced of']) + ' one of the following: ' + self.formlistenglish()
-        # (YES (PRP (NAR (ORR
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I am also ' + random.choice(['ambivalent about', 'unsure about', 'not convinced of']) + ' one the following: ' + self.formlistenglish()
-        # (REJ (PRP (NAR (ORR
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['reject', 'oppose']) + ' your ambivalence about any of the following: ' + self.formlistenglish()
-        # (CCL (PRP (NAR (ORR
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my ambivalence about one of the following: ' + self.formlistenglish()
-        # (HUH (PRP (NAR (ORR
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of proposals.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (ORR
-        if self.container.container.container is None:
-          self.english = 'It is unclear if each of the following are true: ' + self.formlistenglish()
-        # (HUH (FCT (NAR (ORR
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your list of statements.'
-    elif self.container.operator == 'FCT':
-      # (FCT (ORR
-      if self.container.container is None:
-        self.english = 'One of the following is true: ' + self.formlistenglish()
-      # (HUH (FCT (ORR
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your list of statements.'
-    else:
-      self.english = self.formlistenglish()
+    self.english = 'I do not understand your list of statements.'
 
     return self.english
 
@@ -2163,6 +4028,8 @@ class PressOr(PressMessage):
 class PressIf(PressMessage):
   """ The game-related content of a conditional. """
 
+  __slots__ = ('antecedent', 'consequent', 'alternative')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2178,24 +4045,22 @@ class PressIf(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'IFF'
-      anteword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO', 'NOT', 'NAR', 'AND', 'ORR'])
+      anteword = self.utterance.rng.choice(randomarrangements)
       self.antecedent = randomFactory(utterance, self, anteword)
       self.consequent = randomFactory(utterance, self, 'PRP')
       self.alternative = None
-      if random.choice([True, False]):
+      if self.utterance.rng.choice((True, False)):
         self.alternative = randomFactory(utterance, self, 'PRP')
     elif len(thelists) == 3:
       self.operator = thelists[0]
       self.antecedent = messageFactory(utterance, self, thelists[1])
       self.consequent = messageFactory(utterance, self, thelists[2])
       self.alternative = None
-      self.swimthechannel()
     elif len(thelists) == 5:
       self.operator = thelists[0]
       self.antecedent = messageFactory(utterance, self, thelists[1])
       self.consequent = messageFactory(utterance, self, thelists[2])
       self.alternative = messageFactory(utterance, self, thelists[4])
-      self.swimthechannel()
     else:
       self.operator = thelists[0]
       self.antecedent = None
@@ -2216,15 +4081,15 @@ class PressIf(PressMessage):
         self.english += ', otherwise ' + self.alternative.formenglish()
     elif self.container.operator == 'REJ':
       # (REJ (IFF
-      self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of', 'do not accept']) + \
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['rejectaccept']) + \
                      ' the condition that ' + self.antecedent.formclauseenglish() + ' should lead to ' + self.consequent.formclauseenglish()
     elif self.container.operator == 'CCL':
       # (CCL (IFF
-      self.english = 'I ' + random.choice(['wish to retract', 'cancel', 'take back', 'no longer want']) + \
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['wishtoretract']) + \
                      ' the condition that ' + self.antecedent.formclauseenglish() + ' should lead to ' + self.consequent.formclauseenglish()
     elif self.container.operator == 'YES':
       # (YES (IFF
-      self.english = 'I ' + random.choice(['accept', 'concur with', 'approve of', 'accept']) + \
+      self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['approve']) + \
                      ' the condition that ' + self.antecedent.formclauseenglish() + ' should lead to ' + self.consequent.formclauseenglish()
 
     return self.english
@@ -2287,6 +4152,8 @@ class PressIf(PressMessage):
 class PressNot(PressMessage):
   """ The game-related content of a negation. """
 
+  __slots__ = ('proposition',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2303,12 +4170,11 @@ class PressNot(PressMessage):
     self.proposition = PressMessage(utterance, self)
     if thelists is None or len(thelists) == 0:
       self.operator = 'NOT'
-      propword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO'])
+      propword = self.utterance.rng.choice(randompropositions)
       self.proposition = randomFactory(utterance, self, propword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.proposition = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -2367,6 +4233,8 @@ class PressNot(PressMessage):
 class PressNar(PressMessage):
   """ The game-related content of missing evidence. """
 
+  __slots__ = ('proposition',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2383,12 +4251,11 @@ class PressNar(PressMessage):
     self.proposition = PressMessage(utterance, self)
     if thelists is None or len(thelists) == 0:
       self.operator = 'NAR'
-      propword = random.choice(['PCE', 'ALY', 'DMZ', 'SLO', 'DRW', 'XDO'])
+      propword = self.utterance.rng.choice(randompropositions)
       self.proposition = randomFactory(utterance, self, propword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.proposition = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -2447,6 +4314,8 @@ class PressNar(PressMessage):
 class PressMoveExecute(PressMessage):
   """ The game-related content of an executable move. """
 
+  __slots__ = ()
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2462,12 +4331,11 @@ class PressMoveExecute(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'XDO'
-      detword = random.choice(['HLD', 'MTO', 'SUP', 'SUPMTO', 'CVYCTO', 'CVYVIA', 'RTO', 'DSB', 'BLD', 'REM', 'WVE'])
+      detword = self.utterance.rng.choice(randomorders)
       self.details = randomFactory(utterance, self, detword)
     elif len(thelists) == 2:
       self.operator = thelists[0]
       self.details = messageFactory(utterance, self, thelists[1])
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -2477,79 +4345,261 @@ class PressMoveExecute(PressMessage):
     :rtype: str
     """
 
-    if self.container.operator == 'PRP':
-      # (PRP (XDO
-      if self.container.container is None or self.container.container.operator == 'IFF':
-        self.english = 'I ' + random.choice(['propose', 'request', 'ask for']) + ' this move: ' + self.details.formlistenglish()
-      # (YES (PRP (XDO
-      elif self.container.container.operator == 'YES':
-        self.english = 'I ' + random.choice(['agree to', 'concur with', 'accept']) + ' the move: ' + self.details.formlistenglish()
-      # (REJ (PRP (XDO
-      elif self.container.container.operator == 'REJ':
-        self.english = 'I ' + random.choice(['reject', 'do not concur with', 'do not approve of']) + ' the move: ' + self.details.formlistenglish()
-      # (CCL (PRP (XDO
-      elif self.container.container.operator == 'CCL':
-        self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my proposal of the move: ' + self.details.formlistenglish()
-      # (HUH (PRP (XDO
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your move proposal.'
-    elif self.container.operator == 'NOT':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NOT (XDO
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I do not want the following move to happen: ' + self.details.formlistenglish()
-        # (YES (PRP (NOT (XDO
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that this move will not happen: ' + self.details.formlistenglish()
-        # (REJ (PRP (NOT (XDO
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'I do not promise that I won\'t make this move: ' + self.details.formlistenglish()
-        # (CCL (PRP (NOT (XDO
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my objection to the move: ' + self.details.formlistenglish()
-        # (HUH (PRP (NOT (XDO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a move.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NOT (XDO
-        if self.container.container.container is None:
-          self.english = 'It is unlikely that this move will occur: ' + self.details.formlistenglish()
-        # (HUH (FCT (NOT (XDO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a move.'
-    elif self.container.operator == 'NAR':
-      if self.container.container.operator == 'PRP':
-        # (PRP (NAR (XDO
-        if self.container.container.container is None or self.container.container.container.operator == 'IFF':
-          self.english = 'I am not sure about the move: ' + self.details.formlistenglish()
-        # (YES (PRP (NAR (XDO
-        elif self.container.container.container.operator == 'YES':
-          self.english = 'I ' + random.choice(['agree', 'concur']) + ' that we should be hesitant about the move: ' + self.details.formlistenglish()
-        # (REJ (PRP (NAR (XDO
-        elif self.container.container.container.operator == 'REJ':
-          self.english = 'No, I ' + random.choice(['think', 'believe']) + ' that we should be sure about the move: ' + self.details.formlistenglish()
-        # (CCL (PRP (NAR (XDO
-        elif self.container.container.container.operator == 'CCL':
-          self.english = 'I wish to ' + random.choice(['cancel', 'retract', 'take back']) + ' my hesitance about the move: ' + self.details.formlistenglish()
-        # (HUH (PRP (NAR (XDO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your proposal about a move.'
-      elif self.container.container.operator == 'FCT':
-        # (FCT (NAR (XDO
-        if self.container.container.container is None:
-          self.english = 'It is unclear if this move will happen: ' + self.details.formlistenglish()
-        # (HUH (FCT (NAR (XDO
-        elif self.container.container.container.operator == 'HUH':
-          self.english = 'I do not understand your statement about a move.'
-    elif self.container.operator == 'FCT':
-      # (FCT (XDO
-      if self.container.container is None:
-        self.english = 'This move will happen: ' + self.details.formlistenglish()
-      # (HUH (FCT (XDO
-      elif self.container.container.operator == 'HUH':
-        self.english = 'I do not understand your statement about a move.'
-    else:
-      self.english = self.formlistenglish()
+    template = englishtemplate(self)
+    if template is not None:
+      template(self)
+
+    return self.english
+
+  def prpenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (XDO ...) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['askfor']) + ' this move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def yesprpenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (XDO ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agreetoaccept']) + ' the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def rejprpenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (XDO ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['reject']) + ' the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def cclprpenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (XDO ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my proposal of the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhprpenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (XDO ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your move proposal.'
+
+    return self.english
+
+  def prpnotenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NOT (XDO ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not want the following move to happen: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def yesprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NOT (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that this move will not happen: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def rejprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NOT (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not promise that I won\'t make this move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def cclprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NOT (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my objection to the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhprpnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NOT (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a move.'
+
+    return self.english
+
+  def fctnotenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NOT (XDO ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unlikely that this move will occur: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhfctnotenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NOT (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a move.'
+
+    return self.english
+
+  def prpnarenglish(self): # type: () -> str
+    """
+    Forms the English for PRP (NAR (XDO ...)) sent as it is or as the consequence of a conditional.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I am not sure about the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def yesprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for YES (PRP (NAR (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I ' + self.utterance.rng.choice(helpers.phrasebanks['agree']) + ' that we should be hesitant about the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def rejprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for REJ (PRP (NAR (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'No, I ' + self.utterance.rng.choice(helpers.phrasebanks['think']) + ' that we should be sure about the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def cclprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for CCL (PRP (NAR (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I wish to ' + self.utterance.rng.choice(helpers.phrasebanks['retract']) + ' my hesitance about the move: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhprpnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (PRP (NAR (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your proposal about a move.'
+
+    return self.english
+
+  def fctnarenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (NAR (XDO ...)) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'It is unclear if this move will happen: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhfctnarenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (NAR (XDO ...))).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a move.'
+
+    return self.english
+
+  def fctenglish(self): # type: () -> str
+    """
+    Forms the English for FCT (XDO ...) sent as it is.
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'This move will happen: ' + self.details.formlistenglish()
+
+    return self.english
+
+  def huhfctenglish(self): # type: () -> str
+    """
+    Forms the English for HUH (FCT (XDO ...)).
+
+    :return: the English expression
+    :rtype: str
+    """
+
+    self.english = 'I do not understand your statement about a move.'
 
     return self.english
 
@@ -2601,6 +4651,8 @@ class PressMoveExecute(PressMessage):
 class PressHold(PressMessage):
   """ The game-related content of a hold. """
 
+  __slots__ = ('unit',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2616,17 +4668,16 @@ class PressHold(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'HLD'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
     elif len(thelists) == 2:
       self.operator = thelists[1]
       self.unit = thelists[0]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -2727,11 +4778,13 @@ class PressHold(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
 
 class PressMoveInto(PressMessage):
   """ The game-related content of a move. """
 
+  __slots__ = ('unit', 'province')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2747,20 +4800,19 @@ class PressMoveInto(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'MTO'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       provlist = [curprov for curprov in helpers.provincelist if curprov != self.unit[2]]
-      self.province = random.choice(provlist)
+      self.province = self.utterance.rng.choice(provlist)
     elif len(thelists) == 3:
       self.operator = thelists[1]
       self.unit = thelists[0]
       self.province = thelists[2]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -2873,13 +4925,15 @@ class PressMoveInto(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
     if self.province == 'ENG':
       self.province = 'ECH'
 
 class PressSupportHold(PressMessage):
   """ The game-related content of a hold support. """
 
+  __slots__ = ('supporter', 'supported')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -2895,25 +4949,24 @@ class PressSupportHold(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'SUP'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.supporter = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.supporter = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.supporter = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.supporter = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.supporter = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.supported = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.supporter = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.supported = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.supported = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.supported = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.supported = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.supported = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
     elif len(thelists) == 3:
       self.operator = thelists[1]
       self.supporter = thelists[0]
       self.supported = thelists[2]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3044,13 +5097,15 @@ class PressSupportHold(PressMessage):
     """
 
     if self.supporter[2] == 'ENG':
-      self.supporter[2] = 'ECH'
+      self.supporter = [self.supporter[0], self.supporter[1], 'ECH']
     if self.supported[2] == 'ENG':
-      self.supported[2] = 'ECH'
+      self.supported = [self.supported[0], self.supported[1], 'ECH']
 
 class PressSupportMove(PressMessage):
   """ The game-related content of a move support. """
 
+  __slots__ = ('supporter', 'supported', 'province')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3066,28 +5121,27 @@ class PressSupportMove(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'SUP'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.supporter = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.supporter = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.supporter = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.supporter = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.supporter = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.supported = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.supporter = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.supported = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.supported = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.supported = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.supported = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.supported = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       provlist = [curprov for curprov in helpers.provincelist if curprov != self.supporter[2] and curprov != self.supported[2]]
-      self.province = random.choice(provlist)
+      self.province = self.utterance.rng.choice(provlist)
     elif len(thelists) == 5:
       self.operator = thelists[1]
       self.supporter = thelists[0]
       self.supported = thelists[2]
       self.province = thelists[4]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3229,15 +5283,17 @@ class PressSupportMove(PressMessage):
     """
 
     if self.supporter[2] == 'ENG':
-      self.supporter[2] = 'ECH'
+      self.supporter = [self.supporter[0], self.supporter[1], 'ECH']
     if self.supported[2] == 'ENG':
-      self.supported[2] = 'ECH'
+      self.supported = [self.supported[0], self.supported[1], 'ECH']
     if self.province == 'ENG':
       self.province = 'ECH'
 
 class PressConvoy(PressMessage):
   """ The game-related content of a convoy. """
 
+  __slots__ = ('convoyunit', 'convoyedunit', 'province')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3253,28 +5309,27 @@ class PressConvoy(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'CVY'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.convoyunit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.convoyunit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.convoyunit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.convoyunit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.convoyunit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.convoyedunit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.convoyunit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.convoyedunit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.convoyedunit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.convoyedunit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.convoyedunit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.convoyedunit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       provlist = [curprov for curprov in helpers.provincelist if curprov != self.convoyunit[2] and curprov != self.convoyedunit[2]]
-      self.province = random.choice(provlist)
+      self.province = self.utterance.rng.choice(provlist)
     elif len(thelists) == 5:
       self.operator = thelists[1]
       self.convoyunit = thelists[0]
       self.convoyedunit = thelists[2]
       self.province = thelists[4]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3398,15 +5453,17 @@ class PressConvoy(PressMessage):
     """
 
     if self.convoyunit[2] == 'ENG':
-      self.convoyunit[2] = 'ECH'
+      self.convoyunit = [self.convoyunit[0], self.convoyunit[1], 'ECH']
     if self.convoyedunit[2] == 'ENG':
-      self.convoyedunit[2] = 'ECH'
+      self.convoyedunit = [self.convoyedunit[0], self.convoyedunit[1], 'ECH']
     if self.province == 'ENG':
       self.province = 'ECH'
 
 class PressConvoyVia(PressMessage):
   """ The game-related content of a convoy over water. """
 
+  __slots__ = ('convoyedunit', 'destination', 'searoute')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3422,22 +5479,21 @@ class PressConvoyVia(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'CTO'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.convoyedunit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.convoyedunit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.convoyedunit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.convoyedunit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.convoyedunit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.convoyedunit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       provlist = [curprov for curprov in helpers.provincelist if curprov != self.convoyedunit[2]]
-      self.destination = random.choice(provlist)
-      self.searoute = random.sample(helpers.sealist, random.randint(1, 4))
+      self.destination = self.utterance.rng.choice(provlist)
+      self.searoute = self.utterance.rng.sample(helpers.sealist, self.utterance.rng.randint(1, 4))
     elif len(thelists) == 5:
       self.operator = thelists[1]
       self.convoyedunit = thelists[0]
       self.destination = thelists[2]
       self.searoute = thelists[4]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3532,7 +5588,7 @@ class PressConvoyVia(PressMessage):
     """
 
     if self.convoyedunit[2] == 'ENG':
-      self.convoyedunit[2] = 'ECH'
+      self.convoyedunit = [self.convoyedunit[0], self.convoyedunit[1], 'ECH']
     if self.destination == 'ENG':
       self.destination = 'ECH'
     if 'ENG' in self.searoute:
@@ -3541,6 +5597,8 @@ class PressConvoyVia(PressMessage):
 class PressRetreat(PressMessage):
   """ The game-related content of a retreat. """
 
+  __slots__ = ('unit', 'destination')
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3556,20 +5614,19 @@ class PressRetreat(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'RTO'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       provlist = [curprov for curprov in helpers.provincelist if curprov != self.unit[2]]
-      self.destination = random.choice(provlist)
+      self.destination = self.utterance.rng.choice(provlist)
     elif len(thelists) == 3:
       self.operator = thelists[1]
       self.unit = thelists[0]
       self.destination = thelists[2]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3664,13 +5721,15 @@ class PressRetreat(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
     if self.destination == 'ENG':
       self.destination = 'ECH'
 
 class PressDisband(PressMessage):
   """ The game-related content of a disband. """
 
+  __slots__ = ('unit',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3686,17 +5745,16 @@ class PressDisband(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'DSB'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
     elif len(thelists) == 2:
       self.operator = thelists[1]
       self.unit = thelists[0]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3788,11 +5846,13 @@ class PressDisband(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
 
 class PressBuild(PressMessage):
   """ The game-related content of a build. """
 
+  __slots__ = ('unit',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3808,17 +5868,16 @@ class PressBuild(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'BLD'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.supplylist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.supplylist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.supplylist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.supplylist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.supplylist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.supplylist)]
     elif len(thelists) == 2:
       self.operator = thelists[1]
       self.unit = thelists[0]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -3906,11 +5965,13 @@ class PressBuild(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
 
 class PressRemove(PressMessage):
   """ The game-related content of a remove. """
 
+  __slots__ = ('unit',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -3926,17 +5987,16 @@ class PressRemove(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'REM'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
-          self.unit = [utterance.frompower, random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
+          self.unit = [utterance.frompower, self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
         else:
-          self.unit = [random.choice(utterance.topowers), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+          self.unit = [self.utterance.rng.choice(utterance.topowers), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
       else:
-        self.unit = [random.choice(helpers.powerlist), random.choice(helpers.unitlist), random.choice(helpers.provincelist)]
+        self.unit = [self.utterance.rng.choice(helpers.powerlist), self.utterance.rng.choice(helpers.unitlist), self.utterance.rng.choice(helpers.provincelist)]
     elif len(thelists) == 2:
       self.operator = thelists[1]
       self.unit = thelists[0]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -4009,11 +6069,13 @@ class PressRemove(PressMessage):
     """
 
     if self.unit[2] == 'ENG':
-      self.unit[2] = 'ECH'
+      self.unit = [self.unit[0], self.unit[1], 'ECH']
 
 class PressWaive(PressMessage):
   """ The game-related content of a waive. """
 
+  __slots__ = ('power',)
+
   def __init__(self, utterance, container, thelists): # type: (PressUtterance, PressMessage, []) -> None
     """
     Initialize the message with an utterance
@@ -4029,17 +6091,16 @@ class PressWaive(PressMessage):
     super().__init__(utterance, container)
     if thelists is None or len(thelists) == 0:
       self.operator = 'WVE'
-      if random.choice([True, True, False]):
-        if random.choice([True, False]):
+      if self.utterance.rng.choice((True, True, False)):
+        if self.utterance.rng.choice((True, False)):
           self.power = utterance.frompower
         else:
-          self.power = random.choice(utterance.topowers)
+          self.power = self.utterance.rng.choice(utterance.topowers)
       else:
-        self.power = random.choice(helpers.powerlist)
+        self.power = self.utterance.rng.choice(helpers.powerlist)
     elif len(thelists) == 2:
       self.operator = thelists[1]
       self.power = thelists[0]
-      self.swimthechannel()
 
   def formenglish(self): # type () -> str
     """
@@ -4092,6 +6153,60 @@ class PressWaive(PressMessage):
 
     return self.power + ' WVE'
 
+parsecache = helpers.LRUCache(4096)
+
+def parsetemplate(daide): # type: (str) -> ()
+  """
+  Parses a DAIDE expression to nested tuples, reusing the parse of any earlier expression that
+  normalizes to the same text.  The tuples are shared between utterances, so message trees
+  built from them must not modify them in place.
+
+  :param daide: the press utterance in DAIDE syntax
+  :type daide: str
+
+  :return: the parsed, nested DAIDE expression
+  :rtype: ()
+  """
+
+  key = helpers.normalizedaide(daide)
+  template = parsecache.get(key)
+  if template is None:
+    template = helpers.freezelists(helpers.daide2lists(daide, strict=True))
+    parsecache.put(key, template)
+
+  return template
+
+pressoperators = {} # type: {str: type}
+orderforms = {} # type: {(str, int): type}
+randomoperators = {} # type: {str: type}
+
+def register_operator(token, messageclass, arity=None, randomword=None): # type: (str, type, int, str) -> None
+  """
+  Registers a PressMessage subclass to be built by messageFactory and randomFactory.
+
+  Press operators lead their DAIDE expression, as in PRP (...), and are registered by token alone.
+  Order forms, as in (ENG AMY LVP) MTO YOR, are registered by their keyword and arity; five-element
+  forms use both keywords joined, for example SUPMTO or CTOVIA.
+
+  :param token: the DAIDE keyword, or joined keywords, for the message
+  :type token: str
+  :param messageclass: the class to construct, called with (utterance, container, thelists)
+  :type messageclass: type
+  :param arity: the number of elements in an order form, or None for a press operator
+  :type arity: int
+  :param randomword: the word randomFactory uses for this message if different from the token
+  :type randomword: str
+  """
+
+  if arity is None:
+    pressoperators[token] = messageclass
+  else:
+    orderforms[(token, arity)] = messageclass
+
+  if randomword is None:
+    randomword = token
+  randomoperators[randomword] = messageclass
+
 def messageFactory(utterance, container, daidelists): # type: (PressUtterance, PressMessage, []) -> PressMessage
   """
   Creates the objects and subobjects corresponding to a nested DAIDE list
@@ -4111,67 +6226,20 @@ def messageFactory(utterance, container, daidelists): # type: (PressUtterance, P
   if daidelists is None or len(daidelists) == 0:
     return PressMessage(utterance, container)
 
-  if daidelists[0] == 'FCT':
-    return PressFact(utterance, container, daidelists)
-  elif daidelists[0] == 'PRP':
-    return PressProposal(utterance, container, daidelists)
-  elif daidelists[0] == 'YES':
-    return PressAccept(utterance, container, daidelists)
-  elif daidelists[0] == 'REJ':
-    return PressReject(utterance, container, daidelists)
-  elif daidelists[0] == 'CCL':
-    return PressCancel(utterance, container, daidelists)
-  elif daidelists[0] == 'HUH':
-    return PressHuh(utterance, container, daidelists)
-  elif daidelists[0] == 'BWX':
-    return PressIgnore(utterance, container, daidelists)
-  elif daidelists[0] == 'PCE':
-    return PressPeace(utterance, container, daidelists)
-  elif daidelists[0] == 'ALY':
-    return PressAlliance(utterance, container, daidelists)
-  elif daidelists[0] == 'DMZ':
-    return PressDMZ(utterance, container, daidelists)
-  elif daidelists[0] == 'DRW':
-    return PressDraw(utterance, container, daidelists)
-  elif daidelists[0] == 'SLO':
-    return PressSolo(utterance, container, daidelists)
-  elif daidelists[0] == 'ORR':
-    return PressOr(utterance, container, daidelists)
-  elif daidelists[0] == 'AND':
-    return PressAnd(utterance, container, daidelists)
-  elif daidelists[0] == 'IFF':
-    return PressIf(utterance, container, daidelists)
-  elif daidelists[0] == 'NOT':
-    return PressNot(utterance, container, daidelists)
-  elif daidelists[0] == 'NAR':
-    return PressNar(utterance, container, daidelists)
-  elif daidelists[0] == 'XDO':
-    return PressMoveExecute(utterance, container, daidelists)
-  elif len(daidelists) == 2 and daidelists[1] == 'HLD':
-    return PressHold(utterance, container, daidelists)
-  elif len(daidelists) == 3 and daidelists[1] == 'MTO':
-    return PressMoveInto(utterance, container, daidelists)
-  elif len(daidelists) == 3 and daidelists[1] == 'SUP':
-    return PressSupportHold(utterance, container, daidelists)
-  elif len(daidelists) == 5 and daidelists[1] == 'SUP' and daidelists[3] == 'MTO':
-    return PressSupportMove(utterance, container, daidelists)
-  elif len(daidelists) == 5 and daidelists[1] == 'CVY' and daidelists[3] == 'CTO':
-    return PressConvoy(utterance, container, daidelists)
-  elif len(daidelists) == 5 and daidelists[1] == 'CTO' and daidelists[3] == 'VIA':
-    return PressConvoyVia(utterance, container, daidelists)
-  elif len(daidelists) == 3 and daidelists[1] == 'RTO':
-    return PressRetreat(utterance, container, daidelists)
-  elif len(daidelists) == 2 and daidelists[1] == 'DSB':
-    return PressDisband(utterance, container, daidelists)
-  elif len(daidelists) == 2 and daidelists[1] == 'BLD':
-    return PressBuild(utterance, container, daidelists)
-  elif len(daidelists) == 2 and daidelists[1] == 'REM':
-    return PressRemove(utterance, container, daidelists)
-  elif len(daidelists) == 2 and daidelists[1] == 'WVE':
-    return PressWaive(utterance, container, daidelists)
-  else:
+  messageclass = None
+  if isinstance(daidelists[0], str):
+    messageclass = pressoperators.get(daidelists[0])
+  if messageclass is None and len(daidelists) > 1 and isinstance(daidelists[1], str):
+    token = daidelists[1]
+    if len(daidelists) == 5 and isinstance(daidelists[3], str):
+      token += daidelists[3]
+    messageclass = orderforms.get((token, len(daidelists)))
+
+  if messageclass is None:
     return PressMessage(utterance, container)
 
+  return messageclass(utterance, container, daidelists)
+
 def randomFactory(utterance, container, daideword): # type: (PressUtterance, PressMessage, str) -> PressMessage
   """
   Randomly constructs the objects and subobjects corresponding to a DAIDE word
@@ -4188,68 +6256,43 @@ def randomFactory(utterance, container, daideword): # type: (PressUtterance, Pre
   
   """
 
-  if daideword == 'FCT':
-    return PressFact(utterance, container, None)
-  elif daideword == 'PRP':
-    return PressProposal(utterance, container, None)
-  elif daideword == 'YES':
-    return PressAccept(utterance, container, None)
-  elif daideword == 'REJ':
-    return PressReject(utterance, container, None)
-  elif daideword == 'CCL':
-    return PressCancel(utterance, container, None)
-  elif daideword == 'HUH':
-    return PressHuh(utterance, container, None)
-  elif daideword == 'BWX':
-    return PressIgnore(utterance, container, None)
-  elif daideword == 'PCE':
-    return PressPeace(utterance, container, None)
-  elif daideword == 'ALY':
-    return PressAlliance(utterance, container, None)
-  elif daideword == 'DMZ':
-    return PressDMZ(utterance, container, None)
-  elif daideword == 'DRW':
-    return PressDraw(utterance, container, None)
-  elif daideword == 'SLO':
-    return PressSolo(utterance, container, None)
-  elif daideword == 'ORR':
-    return PressOr(utterance, container, None)
-  elif daideword == 'AND':
-    return PressAnd(utterance, container, None)
-  elif daideword == 'IFF':
-    return PressIf(utterance, container, None)
-  elif daideword == 'NOT':
-    return PressNot(utterance, container, None)
-  elif daideword == 'NAR':
-    return PressNar(utterance, container, None)
-  elif daideword == 'XDO':
-    return PressMoveExecute(utterance, container, None)
-  elif daideword == 'HLD':
-    return PressHold(utterance, container, None)
-  elif daideword == 'MTO':
-    return PressMoveInto(utterance, container, None)
-  elif daideword == 'SUP':
-    return PressSupportHold(utterance, container, None)
-  elif daideword == 'SUPMTO':
-    return PressSupportMove(utterance, container, None)
-  elif daideword == 'CVYCTO':
-    return PressConvoy(utterance, container, None)
-  elif daideword == 'CVYVIA':
-    return PressConvoyVia(utterance, container, None)
-  elif daideword == 'RTO':
-    return PressRetreat(utterance, container, None)
-  elif daideword == 'DSB':
-    return PressDisband(utterance, container, None)
-  elif daideword == 'BLD':
-    return PressBuild(utterance, container, None)
-  elif daideword == 'REM':
-    return PressRemove(utterance, container, None)
-  elif daideword == 'WVE':
-    return PressWaive(utterance, container, None)
-  else:
+  messageclass = randomoperators.get(daideword)
+  if messageclass is None:
     return PressMessage(utterance, container)
 
-def daide2gloss(daide, tones=None): # type: (str, []) -> str
+  return messageclass(utterance, container, None)
+
+register_operator('FCT', PressFact)
+register_operator('PRP', PressProposal)
+register_operator('YES', PressAccept)
+register_operator('REJ', PressReject)
+register_operator('CCL', PressCancel)
+register_operator('HUH', PressHuh)
+register_operator('BWX', PressIgnore)
+register_operator('PCE', PressPeace)
+register_operator('ALY', PressAlliance)
+register_operator('DMZ', PressDMZ)
+register_operator('DRW', PressDraw)
+register_operator('SLO', PressSolo)
+register_operator('ORR', PressOr)
+register_operator('AND', PressAnd)
+register_operator('IFF', PressIf)
+register_operator('NOT', PressNot)
+register_operator('NAR', PressNar)
+register_operator('XDO', PressMoveExecute)
+register_operator('HLD', PressHold, arity=2)
+register_operator('MTO', PressMoveInto, arity=3)
+register_operator('SUP', PressSupportHold, arity=3)
+register_operator('SUPMTO', PressSupportMove, arity=5)
+register_operator('CVYCTO', PressConvoy, arity=5)
+register_operator('CTOVIA', PressConvoyVia, arity=5, randomword='CVYVIA')
+register_operator('RTO', PressRetreat, arity=3)
+register_operator('DSB', PressDisband, arity=2)
+register_operator('BLD', PressBuild, arity=2)
+register_operator('REM', PressRemove, arity=2)
+register_operator('WVE', PressWaive, arity=2)
+
+def daide2gloss(daide, tones=None, seed=None): # type: (str, [], object) -> str
   """
   Create a new utterance from DAIDE, return an English gloss
 
@@ -4257,18 +6300,93 @@ def daide2gloss(daide, tones=None): # type: (str, []) -> str
   :type daide: str
   :param tones: the tones to use when forming English
   :type tones: []
+  :param seed: if given, the gloss is always the same for the same DAIDE, tones and seed
+  :type seed: object
+  """
+
+  return daide2glossresult(daide, tones, seed)[0]
+
+def daide2glossresult(daide, tones=None, seed=None): # type: (str, [], object) -> (str, str)
+  """
+  Create a new utterance from DAIDE, return an English gloss along with the reason if it could not be glossed
+
+  :param daide: the press utterance in DAIDE syntax
+  :type daide: str
+  :param tones: the tones to use when forming English
+  :type tones: []
+  :param seed: if given, the gloss is always the same for the same DAIDE, tones and seed
+  :type seed: object
+
+  :return: the gloss (Ahem. if none could be formed) and an error description, or None if the gloss succeeded
+  :rtype: (str, str)
   """
 
   if daide is None or len(daide.strip()) < 3:
-    return 'Ahem.'
+    return ('Ahem.', 'Empty DAIDE expression')
 
   try:
-    utterance = PressUtterance(daide, tones)
-    utterance.formenglish()
+    utterance = PressUtterance(daide, tones, seed=seed)
+    gloss = utterance.english
   except Exception as e:
-    return 'Ahem.'
+    return ('Ahem.', repr(e))
+
+  if utterance.parseerror is not None:
+    return ('Ahem.', str(utterance.parseerror))
+  if utterance.content is None:
+    return ('Ahem.', 'Expected FRM (sender) (recipients) (press)')
+  if utterance.glosserror is not None:
+    return ('Ahem.', utterance.glosserror)
+  if 'Ahem' in gloss:
+    return (gloss, 'Unsupported DAIDE expression')
+
+  return (gloss, None)
 
-  return utterance.english
+def daide2gloss_many(daides, tones=None, workers=1, chunksize=64, seed=None): # type: (iter, [], int, int, object) -> iter
+  """
+  Glosses many DAIDE expressions, yielding one (gloss, error) pair per input in input order as results
+  become available.  Inputs are read in batches; identical expressions within a batch are glossed once.
+  With more than one worker, batches too big for a single chunk are glossed in a process pool.  With a
+  seed, each gloss is the one daide2gloss gives for the same seed, whichever worker forms it.
+
+  :param daides: the press utterances in DAIDE syntax
+  :type daides: iter
+  :param tones: the tones to use when forming English
+  :type tones: []
+  :param workers: the number of processes to gloss with
+  :type workers: int
+  :param chunksize: the number of expressions handed to a worker at a time
+  :type chunksize: int
+  :param seed: if given, the seed for every gloss
+  :type seed: object
+
+  :return: the gloss and error description (None on success) for each input, as from daide2glossresult
+  :rtype: iter
+  """
+
+  batchsize = chunksize * max(workers, 1)
+  daideiter = iter(daides)
+  executor = None
+  try:
+    while True:
+      batch = list(itertools.islice(daideiter, batchsize))
+      if len(batch) == 0:
+        break
+      uniques = list(dict.fromkeys(batch))
+      if workers > 1 and len(uniques) > chunksize:
+        if executor is None:
+          executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(daide2glossresult, uniques, itertools.repeat(tones), itertools.repeat(seed), chunksize=chunksize)
+      else:
+        results = map(daide2glossresult, uniques, itertools.repeat(tones), itertools.repeat(seed))
+      # uniques are in order of first appearance, so each new expression is the next result
+      glossed = {}
+      for curdaide in batch:
+        if curdaide not in glossed:
+          glossed[curdaide] = next(results)
+        yield glossed[curdaide]
+  finally:
+    if executor is not None:
+      executor.shutdown()
 
 def datc2daide(datcs): # type: ([]) -> str
   """
@@ -4291,10 +6409,12 @@ def datc2daide(datcs): # type: ([]) -> str
       alldatc.append(datclists)
   if len(alldatc) == 1:
     pme = PressMoveExecute(None, None, alldatc[0])
+    pme.swimthechannel()
     return pme.formDAIDE()
   else:
     alldatc.insert(0, 'AND')
     conjunction = PressAnd(None, None, alldatc)
+    conjunction.swimthechannel()
     return conjunction.formDAIDE()
 
 def daide2datc(daide): # type: (str) -> []
@@ -4312,12 +6432,14 @@ def daide2datc(daide): # type: (str) -> []
   daidelists = helpers.daide2lists(daide)
   if daidelists[0] == 'XDO':
     pme = PressMoveExecute(None, None, daidelists)
+    pme.swimthechannel()
     return [pme.formDATC()]
   elif daidelists[0] == 'AND':
     retlist = []
     for curxdo in daidelists[1:]:
       if curxdo[0] == 'XDO':
         pme = PressMoveExecute(None, None, curxdo)
+        pme.swimthechannel()
         retlist.append(pme.formDATC())
     return retlist
   return []
@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+""" Generation of synthetic DAIDE and English pairs for training and validating translation models. """
+
+# Standard library imports
+import csv
+import json
+import hashlib
+import itertools
+import random
+import time
+import concurrent.futures
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+from . import helpers
+
+corpuscols = ['prompt', 'completion']
+
+def parseoperators(spec): # type: (str) -> {}
+  """
+  Reads a distribution of press kinds written like PRP:3,FCT:1,YES.  A kind without a weight has weight 1.
+
+  :param spec: the comma-separated press kinds and weights
+  :type spec: str
+
+  :return: the weight of each kind of press
+  :rtype: {}
+  """
+
+  retdict = {}
+  for curpart in spec.split(','):
+    curpart = curpart.strip().upper()
+    if curpart == '':
+      continue
+    curkind, sep, curweight = curpart.partition(':')
+    if curkind not in PRESSGLOSS.randompress:
+      raise ValueError('Unknown kind of press ' + curkind + ', expected one of ' + ' '.join(PRESSGLOSS.randompress))
+    retdict[curkind] = float(curweight) if sep != '' else 1.0
+
+  return retdict
+
+def trainingexample(utterance): # type: (PRESSGLOSS.PressUtterance) -> {}
+  """
+  Forms the training pair for an utterance: the English, introduced by sender and recipients, and the DAIDE.
+
+  :param utterance: the utterance, with English
+  :type utterance: PRESSGLOSS.PressUtterance
+
+  :return: the prompt and completion
+  :rtype: {}
+  """
+
+  return {'prompt': ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english,
+          'completion': utterance.daide}
+
+def generatechunk(chunkid, count, seed=0, operators=None, tones=None): # type: (int, int, object, {}, []) -> []
+  """
+  Generates one chunk of training pairs.  Each chunk draws from its own generator seeded with the corpus seed
+  and the chunk number, so a chunk is the same whichever process makes it.
+
+  :param chunkid: the number of the chunk within the corpus
+  :type chunkid: int
+  :param count: how many pairs to generate
+  :type count: int
+  :param seed: the seed of the corpus
+  :type seed: object
+  :param operators: the weight of each kind of press to generate, by default all kinds equally
+  :type operators: {}
+  :param tones: the tones to use, by default between one and three random tones for each pair
+  :type tones: []
+
+  :return: the training pairs
+  :rtype: []
+  """
+
+  rng = random.Random(str(seed) + '/' + str(chunkid))
+  kinds = None
+  weights = None
+  if operators is not None and len(operators) > 0:
+    kinds = list(operators.keys())
+    weights = list(operators.values())
+
+  retlist = []
+  for curiter in range(count):
+    curtones = tones
+    if curtones is None:
+      curtones = rng.sample(helpers.tonelist, rng.randint(1, 3))
+    curkind = None
+    if kinds is not None:
+      curkind = rng.choices(kinds, weights)[0]
+    retlist.append(trainingexample(PRESSGLOSS.PressUtterance(None, curtones, rng=rng, operator=curkind)))
+
+  return retlist
+
+def iteratecorpus(count, seed=0, workers=1, chunksize=1000, operators=None, tones=None, stats=None): # type: (int, object, int, int, {}, [], {}) -> iter
+  """
+  Generates unique training pairs in chunks, in a process pool if there is more than one worker.  Pairs whose
+  DAIDE was already generated are skipped.  The corpus depends only on the seed and the chunk size, not on the
+  number of workers, so runs with different seeds can be combined without repeating each other's chunks.
+
+  :param count: how many unique pairs to generate
+  :type count: int
+  :param seed: the seed of the corpus
+  :type seed: object
+  :param workers: the number of processes to generate with
+  :type workers: int
+  :param chunksize: the number of pairs generated at a time by a process
+  :type chunksize: int
+  :param operators: the weight of each kind of press to generate, by default all kinds equally
+  :type operators: {}
+  :param tones: the tones to use, by default between one and three random tones for each pair
+  :type tones: []
+  :param stats: if given, updated with the numbers of pairs generated and duplicates skipped
+  :type stats: {}
+
+  :return: the training pairs, fewer than count only if the kinds of press asked for cannot make that many
+  :rtype: iter
+  """
+
+  if stats is None:
+    stats = {}
+  stats['generated'] = 0
+  stats['duplicates'] = 0
+  stats['written'] = 0
+
+  seen = set()
+  chunkids = itertools.count()
+  executor = None
+  try:
+    while stats['written'] < count:
+      roundsize = min(max(workers, 1) * 2, -(-(count - stats['written']) // chunksize))
+      roundids = list(itertools.islice(chunkids, roundsize))
+      if workers > 1:
+        if executor is None:
+          executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        chunks = executor.map(generatechunk, roundids, itertools.repeat(chunksize), itertools.repeat(seed),
+                              itertools.repeat(operators), itertools.repeat(tones))
+      else:
+        chunks = map(generatechunk, roundids, itertools.repeat(chunksize), itertools.repeat(seed),
+                     itertools.repeat(operators), itertools.repeat(tones))
+      added = 0
+      for curchunk in chunks:
+        for curexample in curchunk:
+          stats['generated'] += 1
+          # kept as an int, which is smaller than the digest's bytes and hashes without reading them again
+          curkey = int.from_bytes(hashlib.blake2b(curexample['completion'].encode('utf-8'), digest_size=8).digest(), 'little')
+          if curkey in seen:
+            stats['duplicates'] += 1
+            continue
+          seen.add(curkey)
+          added += 1
+          stats['written'] += 1
+          yield curexample
+          if stats['written'] >= count:
+            break
+        if stats['written'] >= count:
+          break
+      if added == 0:
+        # a whole round of duplicates: there is no more variety to be had
+        break
+  finally:
+    if executor is not None:
+      executor.shutdown()
+
+def writecorpus(outpath, count, seed=0, workers=1, chunksize=1000, operators=None, tones=None): # type: (str, int, object, int, int, {}, []) -> {}
+  """
+  Writes unique training pairs to a JSONL file, or to a CSV file if the path ends in .csv, as they are generated.
+
+  :param outpath: the location on disk to write the corpus
+  :type outpath: str
+  :param count: how many unique pairs to write
+  :type count: int
+  :param seed: the seed of the corpus
+  :type seed: object
+  :param workers: the number of processes to generate with
+  :type workers: int
+  :param chunksize: the number of pairs generated at a time by a process
+  :type chunksize: int
+  :param operators: the weight of each kind of press to generate, by default all kinds equally
+  :type operators: {}
+  :param tones: the tones to use, by default between one and three random tones for each pair
+  :type tones: []
+
+  :return: the numbers of pairs generated, skipped as duplicates and written, the seconds taken and the pairs written per second
+  :rtype: {}
+  """
+
+  stats = {}
+  started = time.perf_counter()
+  examples = iteratecorpus(count, seed, workers, chunksize, operators, tones, stats)
+  if outpath.lower().endswith('.csv'):
+    with open(outpath, 'w', encoding='utf-8', newline='', buffering=1 << 20) as outfile:
+      writer = csv.DictWriter(outfile, fieldnames=corpuscols)
+      writer.writeheader()
+      writer.writerows(examples)
+  else:
+    with open(outpath, 'w', encoding='utf-8', buffering=1 << 20) as outfile:
+      for curexample in examples:
+        outfile.write(json.dumps(curexample) + '\n')
+  stats['seconds'] = time.perf_counter() - started
+  stats['rate'] = stats['written'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+
+  return stats
@@ -6,6 +6,9 @@ import re
 import random
 import pressgloss.core as PRESSGLOSS
 import pressgloss.helpers as helpers
+import pressgloss.corpus as CORPUS
+import pressgloss.translator as TRANSLATOR
+import pressgloss.validation as VALIDATION
 
 # Temporarily removing due to incompatibility with some systems 
 # from transformers import T5ForConditionalGeneration
@@ -20,109 +23,45 @@ openai_model_list = [
     'babbage',
     'ada'
 ]
+def fewshot_gloss(input, gloss=None):
+    # Pads the few-shot chat examples out to eight messages from the saved pool, picked for the kind of press
+    # the input looks like, so the same kind of press always gets the same prompt
+    if gloss == None:
+        gloss = []
+    pool_examples = TRANSLATOR.getfewshotpool().select(input)
+    return list(gloss) + list(pool_examples[:max(0, 8 - len(gloss))])
+
 class gloss2daide: 
-    def __init__(self, input=str, model=None, gloss=None, tones=None, tokenizer=None): 
-        if tones is None:
-            tones = random.sample(helpers.tonelist, random.randint(1, 3))
-        else:
-            self.tones = tones
+    def __init__(self, input=str, model=None, gloss=None, tones=None, tokenizer=None, transport=None, use_cache=True): 
+        # tones the caller did not choose are left out, since the cache keys on them and random ones would never hit
+        self.tones = tones
         if model==None:
             model = 'gpt-3.5-turbo'
         # if model in openai_model_list:
         self.model = model
-        openai.organization = os.getenv('OPENAI_ORG')
-        openai.api_key = os.getenv("OPENAI_API_KEY")
-        if openai.api_key == None:
+        # a transport other than the OpenAI API brings its own credentials
+        if transport is None and os.getenv("OPENAI_API_KEY") == None:
             print('Please set OPENAI_ORG and OPENAI_API_KEY environment variables')
             return
 
+        # translations already made with the same model and prompt are looked up on disk first
+        self.cache = TRANSLATOR.gettranslationcache() if use_cache else None
         if model in openai_model_list:
-            if gloss == None: 
-                utterance = PRESSGLOSS.PressUtterance(None, tones)
-                english = ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english
-                gloss = [{'role': 'user', 'content': english},
-                                        {'role': 'assistant', 'content': utterance.daide}]
-            while len(gloss) < 8:
-                utterance = PRESSGLOSS.PressUtterance(None, tones)
-                english = ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english
-
-                gloss.extend([{'role': 'user', 'content': english},
-                                        {'role': 'assistant', 'content': utterance.daide}])
-            if model==[]: 
-                print('No model specified, using default model')
-                model='gpt-3.5-turbo'
-            
-            self.daide = self.build_chat_complete(gloss, input, model)
+            gloss = fewshot_gloss(input, gloss)
+            self.daide = self.build_chat_complete(gloss, input, model, transport, tones)
         else: 
-            self.daide = self.finetune_completion_request(input, model)
+            self.daide = self.finetune_completion_request(input, model, transport, tones)
         
         # else:
         #     self.daide = self.huggingface_translate(input, model, tokenizer)
 
-    def finetune_completion_request(self, input, model):
-         
-        try:
-            response = openai.Completion.create(
-            model=model,
-            prompt=input,
-            max_tokens=100)
-            content= response['choices'][0]['text']
-            print("Before cleaner", content)
-            content= helpers.grammar_cleaner(content)
-            print("After cleaner", content)
-            return response
-        except Exception as e:
-            print(f"Request failed due to {e}, trying again in 5 seconds")
-            time.sleep(5)
+    def finetune_completion_request(self, input, model, transport=None, tones=None):
+        return TRANSLATOR.translate(input, model, tones=tones, chat=False, transport=transport, cache=self.cache)
     
-    def build_chat_complete(self, gloss, input: str, model= 'gpt-3.5-turbo'):
+    def build_chat_complete(self, gloss, input: str, model= 'gpt-3.5-turbo', transport=None, tones=None):
         #This function uses a string to define a system and a list of dictionaries to define the tunning examples. 
-        # start_time = time.time()
-        #If the request fails, we will try again after 5 seconds
-
-        message_data = [{"role": "system", "content": helpers.simple_system}]
-        message_data.extend(gloss)
-        message_data.append({"role": "user", "content": input})
-        content =None 
-        error = 'No_Error'
-        while True:
-                try:
-                        response = openai.ChatCompletion.create(
-                        model=model,
-                        messages=message_data,
-                        temperature=0)
-                        content= response['choices'][0]['message']['content']
-                        content= helpers.grammar_cleaner(content)
-                        error = helpers.error_fetch(content)
-                except Exception as e:
-                        # print(f"Request failed due to {e}, trying again in 5 seconds")
-                        time.sleep(5)
-
-                
-                
-                break
-        if error != 'No_Error':
-                message_data.extend(
-                        [{'role': 'assistant', 'content': content},
-                        {"role": "user", "content": f"That's not correct DAIDE, {error}, try again"}])
-                try:
-                        response = openai.ChatCompletion.create(
-                        model=model,
-                        messages=message_data,
-                        temperature=0)
-                        content= response['choices'][0]['message']['content']
-                        content= helpers.grammar_cleaner(re.sub('(.*)\\n\\n', '', content))
-                        error = helpers.error_fetch(content)
-                
-                    
-
-                except Exception as e:
-                        print(f"Request failed due to {e}, trying again in 5 seconds")
-                        time.sleep(5)
-        if error != 'No_Error':
-            return 'HUH?'
-        else:
-            return content
+        #Failed requests are retried with backoff, and an answer which does not parse is sent back once with its error.
+        return TRANSLATOR.translate(input, model, gloss, tones, transport=transport, cache=self.cache)
     # def huggingface_translate(self, input: str, model, tokenizer):
     #     input_ids = helpers.nlp_preprocess(input, tokenizer)
     #     model = T5ForConditionalGeneration.from_pretrained(model, device_map="auto")
@@ -193,13 +132,8 @@ class fine_tuned_model:
     def add_to_training_list(self, training_list, amount2add=int):
         if amount2add < 1: 
              return
-        i = 0
-        while i < amount2add:
-            tones = random.sample(helpers.tonelist, random.randint(1, 3))
-            utterance = PRESSGLOSS.PressUtterance(None, tones)
-            english = ''.join(utterance.frompower) + ' ' + ' '.join(utterance.topowers) + utterance.english
-            training_list.append({'prompt': english, "completion": utterance.daide})
-            i += 1
+        # a fresh corpus seed each time, so repeated calls add different examples
+        training_list.extend(CORPUS.iteratecorpus(amount2add, seed=random.getrandbits(64)))
         return training_list
     def fine_tune_predict(self, input: str)->str:
 
@@ -213,38 +147,22 @@ class fine_tuned_model:
 
          
 class validate_model:
-     def __init__(self, model, test_size, tones=None):
+     def __init__(self, model, test_size, tones=None, concurrency=16, transport=None, use_cache=True, output=None, seed=None):
         self.model = model
-        mismatch = 0
-        parse_failure = 0
-        i = 0
         if test_size is None: 
             test_size = 100
+        test_size = int(test_size)
         
-        if tones is None:
-            tones = random.sample(helpers.tonelist, random.randint(1, 3))
-        while i < test_size:
-            utterance = PRESSGLOSS.PressUtterance(None, tones)
-            english = ''.join(utterance.frompower) + ') ' + ' ('.join(utterance.topowers) + ') ' + utterance.english
-            daide = utterance.daide
-            encoding = gloss2daide(input=english, model=model)
-            translation = encoding.daide
-            if daide != translation:
-                mismatch += 1
-                try:
-                    if helpers.error_fetch(translation) != 'No_Error':
-                        parse_failure += 1
-                    else:
-                        pass
-                except Exception as e:
-                    print(f"API failure: {e}, probably server error, adding to failure rate.")
-                    parse_failure += 1
-            i += 1
-        
-        mismatch_rate = mismatch / test_size
-        parse_failure_rate = parse_failure / test_size
-        self.accuracy = (1 - mismatch_rate)*100
-        self.parse_accuracy = (1 - parse_failure_rate)*100
-
-            
-        
+        if model == None:
+            model = 'gpt-3.5-turbo'
+        chat = model in openai_model_list
+        # the same seed makes the same examples, which is what lets a run streamed to output be resumed
+        if seed is None:
+            seed = 0 if output is not None else random.randrange(2**32)
+        # all of the examples are sent at once, at most concurrency of them in flight
+        # a rerun only asks the model about examples it has not translated before
+        cache = TRANSLATOR.gettranslationcache() if use_cache else None
+        self.summary = VALIDATION.validate(output, test_size, model, seed, tones, concurrency, transport, cache, chat=chat)
+        self.accuracy = self.summary['accuracy']
+        self.parse_accuracy = self.summary['parserate']
+        self.cache_stats = cache.stats() if cache is not None else None
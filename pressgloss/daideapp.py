@@ -1,4 +1,7 @@
 # Standard library imports
+import io
+import json
+import itertools
 import logging
 import os
 import sys
@@ -14,6 +17,7 @@ import pressgloss.core as PRESSGLOSS
 import pressgloss.gamelog as GAMELOG
 import pressgloss.helpers as helpers
 import pressgloss.daide_translate as DAIDE
+import pressgloss.repair as REPAIR
 
 landingpage = Blueprint('landingpage', __name__, template_folder='templates')
 theapi = Blueprint('theapi', __name__, template_folder='templates')
@@ -31,14 +35,27 @@ def annotategamelog(): # type: () -> Response
   """
   Annotate a Diplomacy game log with glosses for each message containing only DAIDE
 
+  A log that is not well-formed JSON, or whose entries before its phases or first phase are not what a game log holds,
+  is answered with a 400.  The response is streamed a phase at a time once the first phase is annotated, so a later
+  phase that cannot be read ends the connection with the 200 response cut short, which the client sees as invalid JSON.
+
   :return: A Flask Response with type JSON containing the game log with annotations.
   :rtype: Response
   """
 
   if flask.request.method == 'POST':
-    reqdict = flask.request.get_json(force=True)
-    results = GAMELOG.annotatelog(reqdict)
-    return flask.jsonify(results)
+    # the log is read and annotated a phase at a time as it is sent back
+    reqstream = io.TextIOWrapper(flask.request.stream, encoding='UTF-8')
+    pieces = GAMELOG.streamannotatedlog(reqstream)
+    try:
+      # the opening object, and everything up to the first phase, is read before the response starts
+      firstpiece = next(pieces)
+    except json.JSONDecodeError as e:
+      flask.abort(400, 'The game log is not well-formed JSON: ' + str(e))
+    except (ValueError, TypeError, KeyError) as e:
+      # undecodable text, or phases and messages that are not objects with the fields of a game log
+      flask.abort(400, 'The game log could not be read: ' + type(e).__name__ + ' ' + str(e))
+    return Response(flask.stream_with_context(itertools.chain([firstpiece], pieces)), mimetype='application/json')
 
   return flask.jsonify({})
 
@@ -55,11 +72,34 @@ def daide2gloss(): # type: () -> Response
     reqdict = flask.request.get_json(force=True)
     daidetext = reqdict['daidetext']
     thetones = reqdict['tones']
-    results = {"gloss": PRESSGLOSS.daide2gloss(daidetext, thetones)}
+    theseed = reqdict.get('seed')
+    results = {"gloss": PRESSGLOSS.daide2gloss(daidetext, thetones, theseed)}
     return flask.jsonify(results)
 
   return flask.jsonify({})
 
+@theapi.route('/parsecache', methods=['GET'])
+def parsecache(): # type: () -> Response
+  """
+  Report usage of the shared DAIDE parse cache for monitoring
+
+  :return: A Flask Response with type JSON containing the cache hits, misses, evictions and size.
+  :rtype: Response
+  """
+
+  return flask.jsonify(PRESSGLOSS.parsecache.stats())
+
+@theapi.route('/repairstats', methods=['GET'])
+def repairstats(): # type: () -> Response
+  """
+  Report what the repair engine has done to model output, for monitoring
+
+  :return: A Flask Response with type JSON containing the calls, repairs of each kind, parses, seconds and cache usage.
+  :rtype: Response
+  """
+
+  return flask.jsonify(REPAIR.getengine().report())
+
 @theapi.route('/randomdaide', methods=['POST'])
 def randomdaide(): # type: () -> Response
   """
@@ -91,7 +131,7 @@ def gloss2daide(): # type: () -> Response
     reqdict = flask.request.get_json(force=True)
     englishtext = reqdict['englishtext']
     thetones = reqdict['tones']
-    results = {"DAIDE": DAIDE.gloss2daide(englishtext, thetones)}
+    results = {"DAIDE": DAIDE.gloss2daide(englishtext, tones=thetones).daide}
     return flask.jsonify(results)
 
   return flask.jsonify({})
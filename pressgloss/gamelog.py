@@ -1,16 +1,246 @@
 # Standard imports
 import json
+import io
 import os
+import csv
 from collections import Counter
 import copy
+import concurrent.futures
 
 # pressgloss imports
 import pressgloss.core as PRESSGLOSS
 from . import helpers
 
+class JSONStreamReader:
+  """ Decodes the top level of a JSON object from a text file a value at a time, reading only as much as needed. """
+
+  def __init__(self, infile, chunksize=65536): # type: (io.TextIOBase, int) -> None
+    """
+    Initialize the reader on an open text file
+
+    :param infile: the file to read
+    :type infile: io.TextIOBase
+    :param chunksize: how many characters to read at a time
+    :type chunksize: int
+    """
+
+    self.infile = infile
+    self.chunksize = chunksize
+    self.decoder = json.JSONDecoder()
+    self.buffer = ''
+    self.pos = 0
+    self.eof = False
+
+  def fill(self, minimum): # type: (int) -> bool
+    """
+    Reads more of the file into the buffer, discarding what has been consumed
+
+    :param minimum: the least number of characters to read, unless the file ends
+    :type minimum: int
+
+    :return: whether anything was read
+    :rtype: bool
+    """
+
+    if self.eof:
+      return False
+
+    self.buffer = self.buffer[self.pos:]
+    self.pos = 0
+    chunks = []
+    chunklen = 0
+    while chunklen < minimum:
+      chunk = self.infile.read(max(self.chunksize, minimum - chunklen))
+      if len(chunk) == 0:
+        self.eof = True
+        break
+      chunks.append(chunk)
+      chunklen += len(chunk)
+    self.buffer += ''.join(chunks)
+
+    return chunklen > 0
+
+  def peek(self): # type: () -> str
+    """
+    Skips whitespace and returns the next character without consuming it
+
+    :return: the next non-whitespace character, or the empty string at the end of the file
+    :rtype: str
+    """
+
+    while True:
+      while self.pos < len(self.buffer) and self.buffer[self.pos] in ' \t\r\n':
+        self.pos += 1
+      if self.pos < len(self.buffer) or not self.fill(self.chunksize):
+        break
+
+    return self.buffer[self.pos:self.pos + 1]
+
+  def expect(self, chars): # type: (str) -> str
+    """
+    Consumes the next non-whitespace character, which must be one of those given
+
+    :param chars: the acceptable characters
+    :type chars: str
+
+    :return: the character consumed
+    :rtype: str
+    """
+
+    nextchar = self.peek()
+    if nextchar == '' or nextchar not in chars:
+      raise json.JSONDecodeError('Expecting one of ' + repr(chars), self.buffer, self.pos)
+    self.pos += 1
+
+    return nextchar
+
+  def decode(self): # type: () -> object
+    """
+    Decodes the next complete JSON value, reading more of the file until it is complete
+
+    :return: the decoded value
+    :rtype: object
+    """
+
+    self.peek()
+    toread = self.chunksize
+    while True:
+      try:
+        value, end = self.decoder.raw_decode(self.buffer, self.pos)
+        # a number cut off by the end of the buffer may continue in the file
+        if self.eof or (end < len(self.buffer) and self.buffer[end] not in '0123456789+-.eE'):
+          self.pos = end
+          return value
+      except json.JSONDecodeError:
+        if self.eof:
+          raise
+      self.fill(toread)
+      toread *= 2
+
+def iterategamelog(infile, streamkeys=('phases',)): # type: (io.TextIOBase, ()) -> iter
+  """
+  Reads a JSON game log incrementally, yielding its top-level entries in file order as (key, value, streamed)
+  triples.  Entries named in streamkeys are not loaded whole: each element of an array is yielded as its own
+  (key, element, True) triple, and each member of an object as a (key, (memberkey, membervalue), True) triple,
+  so with the default only one phase of the game is in memory at a time.  Everything else, including streamed
+  entries which turn out to be empty, is yielded whole as (key, value, False).
+
+  :param infile: the game log file, opened as text
+  :type infile: io.TextIOBase
+  :param streamkeys: the top-level keys whose array elements are yielded one at a time
+  :type streamkeys: ()
+
+  :return: the top-level entries, with the elements of streamed arrays yielded separately
+  :rtype: iter
+
+  """
+
+  reader = JSONStreamReader(infile)
+  reader.expect('{')
+  if reader.peek() == '}':
+    return
+
+  while True:
+    key = reader.decode()
+    reader.expect(':')
+    if key in streamkeys and reader.peek() == '[':
+      reader.expect('[')
+      if reader.peek() == ']':
+        reader.expect(']')
+        yield key, [], False
+      else:
+        while True:
+          yield key, reader.decode(), True
+          if reader.expect(',]') == ']':
+            break
+    elif key in streamkeys and reader.peek() == '{':
+      reader.expect('{')
+      if reader.peek() == '}':
+        reader.expect('}')
+        yield key, {}, False
+      else:
+        while True:
+          memberkey = reader.decode()
+          reader.expect(':')
+          yield key, (memberkey, reader.decode()), True
+          if reader.expect(',}') == '}':
+            break
+    else:
+      yield key, reader.decode(), False
+    if reader.expect(',}') == '}':
+      break
+
+class GameLogWriter:
+  """ Writes a JSON game log a top-level entry or array element at a time, formatted as json.dump(indent=2) would. """
+
+  def __init__(self, write): # type: (callable) -> None
+    """
+    Initialize the writer and start the JSON object
+
+    :param write: called with each piece of JSON text, for example the write method of an open file
+    :type write: callable
+    """
+
+    self.write = write
+    self.entries = 0
+    self.openkey = None
+    self.items = 0
+    self.write('{')
+
+  def closearray(self): # type: () -> None
+    """
+    Finishes the array entry being written element by element, if any
+    """
+
+    if self.openkey is not None:
+      self.write('\n  ]' if self.items > 0 else ']')
+      self.openkey = None
+
+  def writeentry(self, key, value): # type: (str, object) -> None
+    """
+    Writes a whole top-level entry
+
+    :param key: the entry's key
+    :type key: str
+    :param value: the entry's value
+    :type value: object
+    """
+
+    self.closearray()
+    self.write((',' if self.entries > 0 else '') + '\n  ' + json.dumps(key) + ': ' + json.dumps(value, indent=2).replace('\n', '\n  '))
+    self.entries += 1
+
+  def writeitem(self, key, value): # type: (str, object) -> None
+    """
+    Writes one element of a top-level array entry, starting the entry if needed
+
+    :param key: the array entry's key, such as phases
+    :type key: str
+    :param value: the element
+    :type value: object
+    """
+
+    if self.openkey != key:
+      self.closearray()
+      self.write((',' if self.entries > 0 else '') + '\n  ' + json.dumps(key) + ': [')
+      self.entries += 1
+      self.openkey = key
+      self.items = 0
+    self.write((',' if self.items > 0 else '') + '\n    ' + json.dumps(value, indent=2).replace('\n', '\n    '))
+    self.items += 1
+
+  def close(self): # type: () -> None
+    """
+    Finishes the JSON object
+    """
+
+    self.closearray()
+    self.write('\n}' if self.entries > 0 else '}')
+
 def prettifygamefile(inpath, outpath): # type: (str, str) -> None
   """
-  Reads a JSON game log file and writes it prettily to another file
+  Reads a JSON game log file and writes it prettily to another file, one phase at a time.
+  The input and output may be the same file.
 
   :param inpath: the location on disk of the JSON game log
   :type inpath: str
@@ -19,11 +249,21 @@ def prettifygamefile(inpath, outpath): # type: (str, str) -> None
 
   """
 
-  with open(inpath, 'r', encoding='UTF-8') as jf:
-    curgame = json.load(jf)
-
-  with open(outpath, 'w', encoding='UTF-8') as of:
-    json.dump(curgame, of, indent=2)
+  temppath = outpath + '.tmp'
+  try:
+    with open(inpath, 'r', encoding='UTF-8') as jf, open(temppath, 'w', encoding='UTF-8') as of:
+      writer = GameLogWriter(of.write)
+      for curkey, curvalue, streamed in iterategamelog(jf):
+        if streamed:
+          writer.writeitem(curkey, curvalue)
+        else:
+          writer.writeentry(curkey, curvalue)
+      writer.close()
+    os.replace(temppath, outpath)
+  finally:
+    # a log that could not be read to the end leaves no partial output behind
+    if os.path.exists(temppath):
+      os.remove(temppath)
 
 def extractdatc(incontent): # type: (PRESSGLOSS.PressMessage) -> []
   """
@@ -89,56 +329,290 @@ def operatorcounts(incontent): # type: (PRESSGLOSS.PressMessage) -> Counter
 
   return retct
 
-def annotatelog(inlog): # type: ({}) -> {}
+def indexmessage(inmessage): # type: ({}) -> {}
+  """
+  Parses one game message as DAIDE and gathers everything the analyses need from it, so that
+  the message is parsed and glossed only once.
+
+  :param inmessage: a message from a phase of a game log
+  :type inmessage: {}
+
+  :return: the sender and recipient trigrams, the parsed utterance, its DAIDE operator counts, DATC shorthands and gloss.
+           None for global messages, which are not DAIDE.
+  :rtype: {}
+
   """
-  Annotate a Diplomacy game log with glosses for each message containing only DAIDE
+
+  currecipient = inmessage['recipient']
+  if currecipient == 'GLOBAL':
+    return None
+
+  cursendersym = helpers.powername2sym[inmessage['sender']]
+  currecsym = helpers.powername2sym[currecipient]
+  curdaide = 'FRM (' + cursendersym + ') (' + currecsym + ') (' + inmessage['message'] + ')'
+  curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective', 'Expert'])
+  datcs = []
+  if curutterance.content is not None:
+    datcs = extractdatc(curutterance.content)
+
+  return {'sendersym': cursendersym,
+          'recipientsym': currecsym,
+          'utterance': curutterance,
+          'operators': operatorcounts(curutterance.content),
+          'datcs': datcs,
+          'gloss': curutterance.english}
+
+def indexphase(inphase): # type: ({}) -> []
+  """
+  Indexes each message of a game phase with indexmessage
+
+  :param inphase: a phase of a game log
+  :type inphase: {}
+
+  :return: the indexed messages in the same order as the phase's messages
+  :rtype: []
+
+  """
+
+  if 'messages' not in inphase:
+    return []
+
+  return [indexmessage(curmessage) for curmessage in inphase['messages']]
+
+def indexgame(ingame): # type: ({}) -> []
+  """
+  Indexes every message of a game log once, for use by findPromises, annotatelog and analyzegame
+
+  :param ingame: a parsed JSON game log
+  :type ingame: {}
+
+  :return: for each phase, the list of indexed messages from indexphase
+  :rtype: []
+
+  """
+
+  if 'phases' not in ingame:
+    return []
+
+  return [indexphase(curphase) for curphase in ingame['phases']]
+
+def glossmessagetext(incontent, gloss): # type: (str, str) -> str
+  """
+  Forms the annotated text of a game message from its DAIDE and gloss
+
+  :param incontent: the DAIDE content of the message
+  :type incontent: str
+  :param gloss: the English gloss of the message
+  :type gloss: str
+
+  :return: the DAIDE followed by a plain-text version of the gloss
+  :rtype: str
+
+  """
+
+  if 'Ahem' in gloss:
+    return incontent + ':\nNot glossable DAIDE.'
+
+  curpress = gloss.replace('<ul>', '\n')
+  curpress = curpress.replace('</ul>', '')
+  curpress = curpress.replace('<li>', '* ')
+  curpress = curpress.replace('</li>', '\n')
+  curpress = curpress.replace('<br>', '\n')
+  curpress = curpress.replace('<br/>', '\n')
+
+  return incontent + ':\n' + curpress
+
+def annotatephase(inphase, phaseindex): # type: ({}, []) -> {}
+  """
+  Annotates the messages of one game phase with glosses.  The phase is not modified; a phase with
+  messages is shallow-copied with new message dictionaries, and everything else is shared with it.
+
+  :param inphase: a phase of a game log
+  :type inphase: {}
+  :param phaseindex: the phase's message index from indexphase
+  :type phaseindex: []
+
+  :return: the phase with each DAIDE message annotated with its English gloss
+  :rtype: {}
+
+  """
+
+  if 'messages' not in inphase:
+    return inphase
+
+  retphase = dict(inphase)
+  retphase['messages'] = []
+  for curmessage, curindexed in zip(inphase['messages'], phaseindex):
+    if curindexed is not None:
+      annotated = glossmessagetext(curmessage['message'], curindexed['gloss'])
+    else:
+      annotated = curmessage['message'] + ':\nGlobal messages not glossed.'
+    retphase['messages'].append(dict(curmessage, message=annotated))
+
+  return retphase
+
+def annotatelog(inlog, index=None): # type: ({}, []) -> {}
+  """
+  Annotate a Diplomacy game log with glosses for each message containing only DAIDE.  The input log
+  is not modified, and the result shares everything but the rewritten messages with it, so treat
+  both as read-only.
 
   :param inlog: the parsed-from-JSON representation of a Diplomacy game log
   :type inlog: {}
+  :param index: the game's message index from indexgame, built here if not given
+  :type index: []
 
   :return: the same game log with press which was DAIDE annotated with English glosses.
   :rtype: {}
 
   """
 
-  retdict = copy.deepcopy(inlog)
+  retdict = dict(inlog)
 
-  if 'phases' in retdict:
-    retdict['id'] += '_gloss'
-    for curphase in retdict['phases']:
-      if 'messages' in curphase:
-        for curmessage in curphase['messages']:
-          cursender = curmessage['sender']
-          cursendersym = helpers.powername2sym[cursender]
-          currecipient = curmessage['recipient']
-          currecsym = helpers.powername2sym[currecipient]
-          if currecipient != 'GLOBAL':
-            curcontent = curmessage['message']
-            curdaide = 'FRM (' + cursendersym + ') (' + currecsym + ') (' + curcontent + ')'
-            curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective', 'Expert'])
-            curutterance.formenglish()
-            curpress = curutterance.english
-            if 'Ahem' in curpress:
-              curmessage['message'] = curcontent + ':\nNot glossable DAIDE.'
-            else:
-              curpress = curpress.replace('<ul>', '\n')
-              curpress = curpress.replace('</ul>', '')
-              curpress = curpress.replace('<li>', '* ')
-              curpress = curpress.replace('</li>', '\n')
-              curpress = curpress.replace('<br>', '\n')
-              curpress = curpress.replace('<br/>', '\n')
-              curmessage['message'] = curcontent + ':\n' + curpress
-          else:
-            curmessage['message'] += ':\nGlobal messages not glossed.'
+  if 'phases' in inlog:
+    if index is None:
+      index = indexgame(inlog)
+    retdict['id'] = inlog['id'] + '_gloss'
+    retdict['phases'] = [annotatephase(curphase, phaseindex) for curphase, phaseindex in zip(inlog['phases'], index)]
 
   return retdict
 
-def findPromises(ingame): # type: ({}) -> []
+def streamannotatedlog(infile): # type: (io.TextIOBase) -> iter
+  """
+  Annotates a game log read incrementally from a file, as annotatelog does, producing the
+  annotated JSON a piece at a time so that only one phase is in memory at once.
+
+  :param infile: the game log file, opened as text
+  :type infile: io.TextIOBase
+
+  :return: the pieces of the annotated game log's JSON text
+  :rtype: iter
+
+  """
+
+  chunks = []
+  writer = GameLogWriter(chunks.append)
+  # entries before the phases are held back until it is known whether the log has phases
+  heldentries = []
+  sawphases = False
+  for curkey, curvalue, streamed in iterategamelog(infile):
+    if curkey == 'phases':
+      if not sawphases:
+        sawphases = True
+        for heldkey, heldvalue in heldentries:
+          writer.writeentry(heldkey, heldvalue + '_gloss' if heldkey == 'id' else heldvalue)
+      if streamed:
+        writer.writeitem(curkey, annotatephase(curvalue, indexphase(curvalue)))
+      else:
+        writer.writeentry(curkey, curvalue)
+    elif sawphases:
+      writer.writeentry(curkey, curvalue + '_gloss' if curkey == 'id' else curvalue)
+    else:
+      heldentries.append((curkey, curvalue))
+    # nothing is produced until the entries before the phases, and the first phase, have been read whole
+    if sawphases and len(chunks) > 0:
+      yield ''.join(chunks)
+      chunks.clear()
+  for heldkey, heldvalue in heldentries if not sawphases else []:
+    writer.writeentry(heldkey, heldvalue)
+  writer.close()
+  yield ''.join(chunks)
+
+class PromiseFinder:
+  """ Matches moves against earlier DAIDE proposals and acceptances of them, one game phase at a time. """
+
+  def __init__(self, gameid): # type: (str) -> None
+    """
+    Initialize with no proposals or acceptances seen
+
+    :param gameid: the ID of the game, reported with each move
+    :type gameid: str
+    """
+
+    self.gameid = gameid
+    self.datc2proposals = {}
+    self.datc2accepts = {}
+
+  def addphase(self, curphase, phaseindex): # type: ({}, []) -> []
+    """
+    Records the proposals and acceptances in a phase's press, then describes each of the phase's orders
+
+    :param curphase: a phase of the game log
+    :type curphase: {}
+    :param phaseindex: the phase's message index from indexphase
+    :type phaseindex: []
+
+    :return: descriptions of the phase's moves and actors, and if they had been previously proposed and/or accepted.
+    :rtype: []
+    """
+
+    retlist = []
+    datc2proposals = self.datc2proposals
+    datc2accepts = self.datc2accepts
+    for curindexed in phaseindex:
+      if curindexed is not None:
+        cursendersym = curindexed['sendersym']
+        currecsym = curindexed['recipientsym']
+        curutterance = curindexed['utterance']
+        if 'Ahem' not in curindexed['gloss']:
+          if curutterance.content.operator == 'PRP':
+            for curdatc in curindexed['datcs']:
+              moverkey = currecsym + '::' + curdatc
+              requesterdict = {'Mover Power': currecsym,
+                               'Move': curdatc,
+                               'Requester Power': cursendersym,
+                               'Request Phase': curphase['name']}
+              if moverkey not in datc2proposals:
+                datc2proposals[moverkey] = []
+              datc2proposals[moverkey].append(requesterdict)
+          elif curutterance.content.operator == 'YES':
+            for curdatc in curindexed['datcs']:
+              moverkey = cursendersym + '::' + curdatc
+              accepterdict = {'Accepter Power': cursendersym,
+                              'Accept Phase': curphase['name']}
+              if moverkey not in datc2accepts:
+                datc2accepts[moverkey] = []
+              datc2accepts[moverkey].append(accepterdict)
+    if 'orders' in curphase:
+      for powername, curorders in curphase['orders'].items():
+        if curorders is not None:
+          powersym = helpers.powername2sym[powername]
+          for curorder in curorders:
+            cleanorder = curorder.replace('ENG', 'ECH')
+            basemovedict = {'Game': self.gameid,
+                            'Mover Power': powersym,
+                            'Move': cleanorder,
+                            'Move Phase': curphase['name']}
+            if powersym + '::' + cleanorder in datc2proposals:
+              for curpropsal in datc2proposals[powersym + '::' + cleanorder]:
+                curmovedict = {key: val for key, val in basemovedict.items()}
+                curmovedict.update(curpropsal)
+                if powersym + '::' + cleanorder in datc2accepts:
+                  for curaccept in datc2accepts[powersym + '::' + cleanorder]:
+                    curaccdict = {key: val for key, val in curmovedict.items()}
+                    curaccdict.update(curaccept)
+                    retlist.append(curaccdict)
+                else:
+                  curmovedict['Accepter Power'] = ''
+                  curmovedict['Accept Phase'] = ''
+                  retlist.append(curmovedict)
+            else:
+              basemovedict['Requester Power'] = ''
+              basemovedict['Request Phase'] = ''
+              basemovedict['Accepter Power'] = ''
+              basemovedict['Accept Phase'] = ''
+              retlist.append(basemovedict)
+
+    return retlist
+
+def findPromises(ingame, index=None): # type: ({}, []) -> []
   """
   Analyzes moves and DAIDE press to find instances of cooperation on XDO proposals and/or acceptances.
 
   :param ingame: a parsed JSON game log
   :type ingame: {}
+  :param index: the game's message index from indexgame, built here if not given
+  :type index: []
 
   :return: a list of descriptions of moves and actors, and if they had been previously proposed and/or accepted.
   :rtype: []
@@ -148,156 +622,206 @@ def findPromises(ingame): # type: ({}) -> []
   retlist = []
 
   if 'phases' in ingame:
-    datc2proposals = {}
-    datc2accepts = {}
-    for curphase in ingame['phases']:
-      if 'messages' in curphase:
-        for curmessage in curphase['messages']:
+    if index is None:
+      index = indexgame(ingame)
+    finder = PromiseFinder(ingame['id'])
+    for curphase, phaseindex in zip(ingame['phases'], index):
+      retlist.extend(finder.addphase(curphase, phaseindex))
+
+  return retlist
+
+promisecols = ['Game', 'Mover Power', 'Move', 'Move Phase', 'Requester Power', 'Request Phase', 'Accepter Power', 'Accept Phase']
+
+def analyzegame(inpath): # type: (str) -> {}
+  """
+  Analyzes one game log: finds promises, tallies message and DAIDE usage, and writes the prettified
+  and glossed game logs next to the original.  The log is read a phase at a time and each message
+  is parsed once, into an index shared by these steps.  Runs in a worker process when analyzegym is parallel.
+
+  :param inpath: the location on disk of the JSON game log
+  :type inpath: str
+
+  :return: the promise rows and usage statistics for the game.  Statistics are None if the log has no phases.
+  :rtype: {}
+
+  """
+
+  folder, file = os.path.split(inpath)
+  prettypath = os.path.join(folder, file.replace('.json', '_pretty.json'))
+  glosspath = os.path.join(folder, file.replace('.json', '_gloss.json'))
+  retdict = {'path': inpath,
+             'promises': [],
+             'stats': None}
+  stats = {'messages': 0,
+           'daideerrors': 0,
+           'senders': Counter(),
+           'recipients': Counter(),
+           'exchanges': Counter(),
+           'operators': Counter(),
+           'powerusage': {'FRANCE': Counter(),
+                          'ENGLAND': Counter(),
+                          'AUSTRIA': Counter(),
+                          'GERMANY': Counter(),
+                          'ITALY': Counter(),
+                          'RUSSIA': Counter(),
+                          'TURKEY': Counter()}}
+
+  header = {}
+  finder = None
+  with open(inpath, 'r', encoding='UTF-8') as jf:
+    if JSONStreamReader(jf).peek() != '{':
+      # not a JSON object, so not a game log, and it is left alone
+      return retdict
+
+  try:
+    with open(inpath, 'r', encoding='UTF-8') as jf, \
+         open(prettypath + '.tmp', 'w', encoding='UTF-8') as prettyfile, \
+         open(glosspath + '.tmp', 'w', encoding='UTF-8') as glossfile:
+      prettywriter = GameLogWriter(prettyfile.write)
+      glosswriter = GameLogWriter(glossfile.write)
+      for curkey, curvalue, streamed in iterategamelog(jf):
+        if curkey == 'phases' and finder is None:
+          finder = PromiseFinder(header.get('id'))
+          for heldkey, heldvalue in header.items():
+            glosswriter.writeentry(heldkey, heldvalue + '_gloss' if heldkey == 'id' else heldvalue)
+        if not streamed:
+          prettywriter.writeentry(curkey, curvalue)
+          if finder is None:
+            header[curkey] = curvalue
+          else:
+            glosswriter.writeentry(curkey, curvalue + '_gloss' if curkey == 'id' else curvalue)
+          continue
+
+        curphase = curvalue
+        phaseindex = indexphase(curphase)
+        retdict['promises'].extend(finder.addphase(curphase, phaseindex))
+        for curmessage, curindexed in zip(curphase.get('messages', []), phaseindex):
+          stats['messages'] += 1
           cursender = curmessage['sender']
-          cursendersym = helpers.powername2sym[cursender]
+          stats['senders'][cursender] += 1
           currecipient = curmessage['recipient']
-          currecsym = helpers.powername2sym[currecipient]
-          if currecipient != 'GLOBAL':
-            curcontent = curmessage['message']
-            curdaide = 'FRM (' + cursendersym + ') (' + currecsym + ') (' + curcontent + ')'
-            curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective', 'Expert'])
-            curutterance.formenglish()
-            curpress = curutterance.english
-            if 'Ahem' not in curpress:
-              if curutterance.content.operator == 'PRP':
-                datcs = extractdatc(curutterance.content)
-                for curdatc in datcs:
-                  moverkey = currecsym + '::' + curdatc
-                  requesterdict = {'Mover Power': currecsym,
-                                   'Move': curdatc,
-                                   'Requester Power': cursendersym,
-                                   'Request Phase': curphase['name']}
-                  if moverkey not in datc2proposals:
-                    datc2proposals[moverkey] = []
-                  datc2proposals[moverkey].append(requesterdict)
-              elif curutterance.content.operator == 'YES':
-                datcs = extractdatc(curutterance.content)
-                for curdatc in datcs:
-                  moverkey = cursendersym + '::' + curdatc
-                  accepterdict = {'Accepter Power': cursendersym,
-                                  'Accept Phase': curphase['name']}
-                  if moverkey not in datc2accepts:
-                    datc2accepts[moverkey] = []
-                  datc2accepts[moverkey].append(accepterdict)
-      if 'orders' in curphase:
-        for powername, curorders in curphase['orders'].items():
-          if curorders is not None:
-            powersym = helpers.powername2sym[powername]
-            for curorder in curorders:
-              cleanorder = curorder.replace('ENG', 'ECH')
-              basemovedict = {'Game': ingame['id'],
-                              'Mover Power': powersym,
-                              'Move': cleanorder,
-                              'Move Phase': curphase['name']}
-              if powersym + '::' + cleanorder in datc2proposals:
-                for curpropsal in datc2proposals[powersym + '::' + cleanorder]:
-                  curmovedict = {key: val for key, val in basemovedict.items()}
-                  curmovedict.update(curpropsal)
-                  if powersym + '::' + cleanorder in datc2accepts:
-                    for curaccept in datc2accepts[powersym + '::' + cleanorder]:
-                      curaccdict = {key: val for key, val in curmovedict.items()}
-                      curaccdict.update(curaccept)
-                      retlist.append(curaccdict)
-                  else:
-                    curmovedict['Accepter Power'] = ''
-                    curmovedict['Accept Phase'] = ''
-                    retlist.append(curmovedict)
-              else:
-                basemovedict['Requester Power'] = ''
-                basemovedict['Request Phase'] = ''
-                basemovedict['Accepter Power'] = ''
-                basemovedict['Accept Phase'] = ''
-                retlist.append(basemovedict)
+          stats['recipients'][currecipient] += 1
+          stats['exchanges'][cursender + '->' + currecipient] += 1
+          if curindexed is not None:
+            stats['operators'] += curindexed['operators']
+            stats['powerusage'][cursender] += curindexed['operators']
+            if 'Ahem' in curindexed['gloss']:
+              stats['daideerrors'] += 1
+              stats['powerusage'][cursender]['Error'] += 1
+        prettywriter.writeitem(curkey, curphase)
+        glosswriter.writeitem(curkey, annotatephase(curphase, phaseindex))
+      prettywriter.close()
+      glosswriter.close()
+
+    if finder is not None:
+      os.replace(prettypath + '.tmp', prettypath)
+      os.replace(glosspath + '.tmp', glosspath)
+      retdict['stats'] = stats
+  finally:
+    # a log without phases, or one that could not be read to the end, leaves no partial output behind
+    for curpath in [prettypath + '.tmp', glosspath + '.tmp']:
+      if os.path.exists(curpath):
+        os.remove(curpath)
 
-  return retlist
+  return retdict
+
+def printgamestats(title, stats): # type: (str, {}) -> None
+  """
+  Prints the message and DAIDE usage statistics gathered by analyzegame.
+
+  :param title: the heading for the statistics, usually the game log path
+  :type title: str
+  :param stats: the statistics
+  :type stats: {}
+
+  """
+
+  print(title)
+  print('  ' + str(stats['messages']) + ' messages sent')
+  print('  ' + str(stats['daideerrors']) + ' DAIDE errors')
+  print('  Messages sent by ' + str(stats['senders'].most_common()))
+  print('  Messages sent to ' + str(stats['recipients'].most_common()))
+  print('  Message pairs ' +  str(stats['exchanges'].most_common()))
+  print('  DAIDE usage ' +  str(stats['operators'].most_common()))
+  for curpower, curdaideuse in stats['powerusage'].items():
+    print('  ' + curpower + ' DAIDE usage ' + str(curdaideuse.most_common()))
+
+def mergegamestats(totals, stats): # type: ({}, {}) -> {}
+  """
+  Adds one game's statistics from analyzegame into running totals.
+
+  :param totals: the running totals, or None to start from this game
+  :type totals: {}
+  :param stats: one game's statistics
+  :type stats: {}
+
+  :return: the updated totals
+  :rtype: {}
+
+  """
+
+  if totals is None:
+    return copy.deepcopy(stats)
+
+  totals['messages'] += stats['messages']
+  totals['daideerrors'] += stats['daideerrors']
+  for curkey in ['senders', 'recipients', 'exchanges', 'operators']:
+    totals[curkey].update(stats[curkey])
+  for curpower, curdaideuse in stats['powerusage'].items():
+    totals['powerusage'][curpower].update(curdaideuse)
+
+  return totals
 
-def analyzegym(inpath): # type: (str) -> []
+def analyzegym(inpath, workers=1): # type: (str, int) -> []
   """
   Searches through a folder for game logs and returns a list of paths to those which might be interesting for analysis.
-  Also creates prettyfied JSON logs and game transcripts with press gloss
+  Also creates prettyfied JSON logs and game transcripts with press gloss.  Promises found are written to moves.csv
+  in the folder as each game finishes.
 
   :param inpath: the folder that the logs are in
   :type inpath: str
+  :param workers: the number of processes to analyze games in
+  :type workers: int
 
   :return: a list of paths to game log files used in the analysis
   :rtype: []
 
   """
 
-  retset = set()
-
-  promises = []
+  gamepaths = []
   for root, dirs, files in os.walk(os.path.abspath(inpath)):
     for file in files:
-      curfullpath = os.path.join(root, file)
       if file.endswith('.json') and '_pretty.json' not in file and '_gloss.json' not in file:
-        print('Processing ' + file)
-        with open(curfullpath, 'r', encoding='UTF-8') as jf:
-          curgame = json.load(jf)
-        promises.extend(findPromises(curgame))
-        if 'phases' in curgame:
-          daideoperators = Counter()
-          powerdaideuse = {'FRANCE': Counter(),
-                           'ENGLAND': Counter(),
-                           'AUSTRIA': Counter(),
-                           'GERMANY': Counter(),
-                           'ITALY': Counter(),
-                           'RUSSIA': Counter(),
-                           'TURKEY': Counter()}
-          messagesenders = Counter()
-          messagerecipients = Counter()
-          messageexchanges = Counter()
-          messages = 0
-          daideerrors = 0
-          retset.add(curfullpath)
-          prtyfile = file.replace('.json', '_pretty.json')
-          fullprettypath = os.path.join(root, prtyfile)
-          prettifygamefile(curfullpath, fullprettypath)
-          for curphase in curgame['phases']:
-            if 'messages' in curphase:
-              for curmessage in curphase['messages']:
-                messages += 1
-                cursender = curmessage['sender']
-                messagesenders[cursender] += 1
-                cursendersym = helpers.powername2sym[cursender]
-                currecipient = curmessage['recipient']
-                messagerecipients[currecipient] += 1
-                currecsym = helpers.powername2sym[currecipient]
-                messageexchanges[cursender + '->' + currecipient] += 1
-                if currecipient != 'GLOBAL':
-                  curcontent = curmessage['message']
-                  curdaide = 'FRM (' + cursendersym + ') (' + currecsym + ') (' + curcontent + ')'
-                  curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective', 'Expert'])
-                  daideoperators += operatorcounts(curutterance.content)
-                  powerdaideuse[cursender] += operatorcounts(curutterance.content)
-                  curutterance.formenglish()
-                  curpress = curutterance.english
-                  if 'Ahem' in curpress:
-                    daideerrors += 1
-                    powerdaideuse[cursender]['Error'] += 1
-          curglossgame = annotatelog(curgame)
-          glossfile = file.replace('.json', '_gloss.json')
-          fullglosspath = os.path.join(root, glossfile)
-          with open(fullglosspath, 'w', encoding='UTF-8') as of:
-            json.dump(curglossgame, of, indent=2)
-          print(curfullpath)
-          print('  ' + str(messages) + ' messages sent')
-          print('  ' + str(daideerrors) + ' DAIDE errors')
-          print('  Messages sent by ' + str(messagesenders.most_common()))
-          print('  Messages sent to ' + str(messagerecipients.most_common()))
-          print('  Message pairs ' +  str(messageexchanges.most_common()))
-          print('  DAIDE usage ' +  str(daideoperators.most_common()))
-          for curpower, curdaideuse in powerdaideuse.items():
-            print('  ' + curpower + ' DAIDE usage ' + str(curdaideuse.most_common()))
-
-  helpers.writeCSV(os.path.join(inpath, 'moves.csv'), promises)
+        gamepaths.append(os.path.join(root, file))
 
-  return list(retset)
+  retlist = []
+  totals = None
+  executor = None
+  with open(os.path.join(inpath, 'moves.csv'), 'w', encoding='utf-8', newline='') as movesfile:
+    writer = csv.DictWriter(movesfile, fieldnames=promisecols)
+    writer.writeheader()
+    try:
+      if workers > 1 and len(gamepaths) > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+        results = executor.map(analyzegame, gamepaths)
+      else:
+        results = map(analyzegame, gamepaths)
+      for curresult in results:
+        print('Processing ' + os.path.basename(curresult['path']))
+        writer.writerows(curresult['promises'])
+        movesfile.flush()
+        if curresult['stats'] is not None:
+          retlist.append(curresult['path'])
+          printgamestats(curresult['path'], curresult['stats'])
+          totals = mergegamestats(totals, curresult['stats'])
+    finally:
+      if executor is not None:
+        executor.shutdown()
+
+  if totals is not None and len(retlist) > 1:
+    printgamestats('All ' + str(len(retlist)) + ' games', totals)
+
+  return retlist
 
 def analyzebackup(inpath): # type: (str) -> []
   """
@@ -318,27 +842,33 @@ def analyzebackup(inpath): # type: (str) -> []
     for file in files:
       curfullpath = os.path.join(root, file)
       if file.endswith('.json'):
+        curgame = {}
+        seasons = 0
         with open(curfullpath, 'r', encoding='UTF-8') as jf:
-          curgame = json.load(jf)
-        if 'message_history' in curgame:
-          for curkey, messagelist in curgame['message_history'].items():
-            for curmessage in messagelist:
-              curtonesstr = curmessage['tones']
-              if curtonesstr == '':
-                curtonesstr = 'Objective'
-              curtones = curtonesstr.split(',')
-              for curtone in curtones:
-                tonesused[curtone] += 1
-              curdaide = PRESSGLOSS.PressUtterance(curmessage['daide'], curtones)
-              messages += 1
-              if 'Ahem' in curdaide.english:
-                daideerrors += 1
-              if curdaide.content is not None:
-                daideoperators[curdaide.content.operator] += 1
-                if curdaide.content.details is not None:
-                  daideoperators[curdaide.content.details.operator] += 1
-            if len(messagelist) > 0 and curfullpath not in retset:
-              retset.add(curfullpath)
+          for curkey, curvalue, streamed in iterategamelog(jf, ('message_history', 'order_history', 'state_history', 'result_history')):
+            if not streamed:
+              curgame[curkey] = curvalue
+            elif curkey == 'message_history':
+              messagelist = curvalue[1]
+              for curmessage in messagelist:
+                curtonesstr = curmessage['tones']
+                if curtonesstr == '':
+                  curtonesstr = 'Objective'
+                curtones = curtonesstr.split(',')
+                for curtone in curtones:
+                  tonesused[curtone] += 1
+                curdaide = PRESSGLOSS.PressUtterance(curmessage['daide'], curtones)
+                messages += 1
+                if 'Ahem' in curdaide.english:
+                  daideerrors += 1
+                if curdaide.content is not None:
+                  daideoperators[curdaide.content.operator] += 1
+                  if curdaide.content.details is not None:
+                    daideoperators[curdaide.content.details.operator] += 1
+              if len(messagelist) > 0 and curfullpath not in retset:
+                retset.add(curfullpath)
+            elif curkey == 'order_history':
+              seasons += 1
         if 'status' in curgame and curgame['status'] == 'completed':
           print(curfullpath + ' completed')
           print('  won by ' + str(curgame['victory']))
@@ -365,7 +895,7 @@ def analyzebackup(inpath): # type: (str) -> []
           else:
             print('  Odd controller data')
         print(str(ctrl2powers))
-        print('  ' + str(len(curgame['order_history'])) + ' seasons played')
+        print('  ' + str(seasons) + ' seasons played')
 
   print('Press found in ' + str(len(retset)) + ' games.')
   print('  ' + str(messages) + ' messages found.')
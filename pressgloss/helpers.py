@@ -6,18 +6,11 @@ import csv
 import json
 import re
 import random
-import configparser
+import collections
+import threading
 
-import subprocess
-
-# 3rd-party imports
-from bs4 import BeautifulSoup
-
-# pressgloss imports
-import pressgloss.core
-
-#grammarimport: 
-from daidepp.grammar.grammar_utils import create_daide_grammar
+# configparser, subprocess, BeautifulSoup and the daidepp grammar are imported where they are used,
+# so that importing pressgloss for glossing does not pay for them
 
 # To request finetuned models hosted by openai
 # import requests
@@ -29,27 +22,137 @@ from daidepp.grammar.grammar_utils import create_daide_grammar
 # from transformers import AutoTokenizer
 
 
-refData = []
-
-#save list of dicts to 
-
-# Initialization loads reference data from resources CSV.
+# Initialization loads reference data from resources CSV, or from the pickled snapshot of it
+# if the snapshot was taken from the CSV as it is now.
 this_dir, this_filename = os.path.split(__file__)
 refPath = os.path.join(this_dir, 'resources', 'reference.csv')
-if (os.path.isfile(refPath)):
-  with open(refPath) as refFile:
-    refData = [{colName: str(cellValue) for colName, cellValue in row.items()}
-               for row in csv.DictReader(refFile, skipinitialspace=True)]
+refSnapshotPath = os.path.join(this_dir, 'resources', 'reference.pickle')
+phrasePath = os.path.join(this_dir, 'resources', 'phrases.json')
+
+def readreference(inpath=refPath): # type: (str) -> ()
+  """
+  Parses the reference data CSV.
+
+  :param inpath: the location on disk of the reference CSV
+  :type inpath: str
+
+  :return: a dictionary for each row, keyed on column name
+  :rtype: ()
+  """
+
+  with open(inpath) as refFile:
+    return tuple({colName: str(cellValue) for colName, cellValue in row.items()}
+                 for row in csv.DictReader(refFile, skipinitialspace=True))
+
+def writereferencesnapshot(inpath=refPath, outpath=refSnapshotPath): # type: (str, str) -> None
+  """
+  Pickles the parsed reference data along with a checksum of the CSV it came from.
+  Run this after editing the reference CSV, or the CSV will be parsed on every import.
+
+  :param inpath: the location on disk of the reference CSV
+  :type inpath: str
+  :param outpath: the location on disk to write the snapshot
+  :type outpath: str
+  """
+
+  import pickle
+  import zlib
 
+  with open(inpath, 'rb') as refFile:
+    checksum = zlib.crc32(refFile.read())
+  with open(outpath, 'wb') as snapshotFile:
+    pickle.dump({'crc32': checksum, 'rows': readreference(inpath)}, snapshotFile, protocol=4)
+
+def loadreference(inpath=refPath, snapshotpath=refSnapshotPath): # type: (str, str) -> ()
+  """
+  Loads the reference data from its snapshot if the snapshot matches the CSV, otherwise from the CSV.
+
+  :param inpath: the location on disk of the reference CSV
+  :type inpath: str
+  :param snapshotpath: the location on disk of the snapshot
+  :type snapshotpath: str
+
+  :return: a dictionary for each row, keyed on column name
+  :rtype: ()
+  """
+
+  if not os.path.isfile(inpath):
+    return ()
+
+  if os.path.isfile(snapshotpath):
+    import pickle
+    import zlib
+
+    with open(inpath, 'rb') as refFile:
+      checksum = zlib.crc32(refFile.read())
+    try:
+      with open(snapshotpath, 'rb') as snapshotFile:
+        snapshot = pickle.load(snapshotFile)
+      if snapshot['crc32'] == checksum:
+        return snapshot['rows']
+    except Exception:
+      pass
+
+  return readreference(inpath)
+
+refData = loadreference()
+
+# The reference tables never change: the lists are tuples, in CSV order so random choices from them are
+# reproducible, and each has a frozenset for membership tests.
 powerdict = {curdata['trigram']: curdata for curdata in refData if curdata['type'] == 'Power'}
-powerlist = list(powerdict.keys())
+powerlist = tuple(powerdict.keys())
+powerset = frozenset(powerlist)
 provincedict = {curdata['trigram']: curdata for curdata in refData if curdata['type'] == 'Province'}
-provincelist = list(provincedict.keys())
+provincelist = tuple(provincedict.keys())
+provinceset = frozenset(provincelist)
 unitdict = {curdata['trigram']: curdata for curdata in refData if curdata['type'] == 'Unit'}
-unitlist = list(unitdict.keys())
-sealist = [curdata['trigram'] for curdata in refData if curdata['Sea'] == '1' or curdata['Coast'] == '1']
-supplylist = [curdata['trigram'] for curdata in refData if curdata['Supply'] == '1']
-tonelist = ['Haughty', 'Objective', 'Urgent', 'Obsequious', 'PigLatin', 'Hostile', 'Friendly', 'Fearful', 'Confident', 'Empathetic', 'Upset', 'Expert']
+unitlist = tuple(unitdict.keys())
+unitset = frozenset(unitlist)
+sealist = tuple(curdata['trigram'] for curdata in refData if curdata['Sea'] == '1' or curdata['Coast'] == '1')
+seaset = frozenset(sealist)
+supplylist = tuple(curdata['trigram'] for curdata in refData if curdata['Supply'] == '1')
+supplyset = frozenset(supplylist)
+tonelist = ('Haughty', 'Objective', 'Urgent', 'Obsequious', 'PigLatin', 'Hostile', 'Friendly', 'Fearful', 'Confident', 'Empathetic', 'Upset', 'Expert')
+
+def readphrases(inpath=phrasePath): # type: (str) -> {str: ()}
+  """
+  Parses the phrase banks: for each bank name, the interchangeable wordings English is formed from.
+
+  :param inpath: the location on disk of the phrase bank JSON
+  :type inpath: str
+
+  :return: a tuple of phrases for each bank, keyed on bank name, in file order so random choices from them are reproducible
+  :rtype: {str: ()}
+  """
+
+  with open(inpath, 'r', encoding='utf-8') as phraseFile:
+    return {curname: tuple(curphrases) for curname, curphrases in json.load(phraseFile).items()}
+
+phrasebanks = readphrases()
+
+def phrase(bankname, rng=None, index=None): # type: (str, random.Random, int) -> str
+  """
+  Selects a wording from a phrase bank, by index or at random.
+
+  :param bankname: the name of the phrase bank, as in resources/phrases.json
+  :type bankname: str
+  :param rng: the random number generator to draw from, or None for the random module
+  :type rng: random.Random
+  :param index: the position of the wording in its bank, instead of a random one
+  :type index: int
+
+  :return: the wording
+  :rtype: str
+  """
+
+  bank = phrasebanks[bankname]
+  if index is not None:
+    return bank[index]
+  if rng is None:
+    return random.choice(bank)
+
+  return rng.choice(bank)
+
 powername2sym = {
                  'FRANCE': 'FRA',
                  'AUSTRIA': 'AUS',
@@ -77,6 +180,8 @@ def loadconfig(inpath): # type: (str) -> None
 
   global configs
 
+  import configparser
+
   configs = configparser.ConfigParser()
   configs.read(inpath)
 
@@ -93,6 +198,8 @@ def html2text(inhtml): # type: (str) -> str
 
   """
 
+  from bs4 import BeautifulSoup
+
   parsed = BeautifulSoup(inhtml, features='html.parser')
   rettext = parsed.get_text()
   rettext = rettext.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
@@ -225,7 +332,7 @@ def listOfProvinces(provincelist): # type: ([]) -> str
 
   return retstr
 
-def listOfPowers(powerlist, frompower, topowers, case='Objective'): # type: ([], str, [], str) -> str
+def listOfPowers(powerlist, frompower, topowers, case='Objective', rng=random): # type: ([], str, [], str, random.Random) -> str
   """
   Creates a list of names of Powers relative to a sender and recipient and with case if needed
 
@@ -237,6 +344,8 @@ def listOfPowers(powerlist, frompower, topowers, case='Objective'): # type: ([],
   :type topowers: []
   :param case: the case for a pronoun if needed (Objective|Subjective)
   :type case: str
+  :param rng: the random number generator that chooses between 'you and me' and 'us'
+  :type rng: random.Random
 
   :return: an English list of powers
   :rtype: str
@@ -293,11 +402,11 @@ def listOfPowers(powerlist, frompower, topowers, case='Objective'): # type: ([],
     retstr = retpref + ' and ' + retsuff
 
   if retstr == 'you and me':
-    if random.choice([True, False]):
+    if rng.choice([True, False]):
       retstr = 'us'
 
   if retstr == 'you and I':
-    if random.choice([True, False]):
+    if rng.choice([True, False]):
       retstr = 'we'
 
   return retstr
@@ -336,50 +445,268 @@ def size2numstr(inlist): # type: ([]) -> str
   else:
     return 'all'
 
-def daide2lists(daide): # type: (str) -> []
+class DAIDEParseError(ValueError):
+  """
+  Raised when a DAIDE expression cannot be tokenized into nested lists.  Records
+  where in the original expression the problem was found.
+
+  :param message: a description of the problem
+  :type message: str
+  :param position: the 0-based character offset into the expression where the problem was found
+  :type position: int
+  :param daide: the expression being parsed
+  :type daide: str
+
+  """
+
+  def __init__(self, message, position, daide): # type: (str, int, str) -> None
+    super().__init__('{} at position {}'.format(message, position))
+    self.message = message
+    self.position = position
+    self.daide = daide
+
+daidetoken = re.compile(r'[()]|[^\s(),]+')
+coastwords = frozenset(['NCS', 'ECS', 'SCS'])
+slashcoast = re.compile(r'([A-Z]+)/([ENS])CS?')
+
+def daideword(word, position, daide): # type: (str, int, str) -> ()
+  """
+  Converts a single whitespace- and parenthesis-delimited DAIDE word to its list
+  representation, folding DATC-style coasts such as SPA/NC into SPANCS.
+
+  :param word: the uppercased word
+  :type word: str
+  :param position: where the word starts in the expression, for error reporting
+  :type position: int
+  :param daide: the expression being parsed, for error reporting
+  :type daide: str
+
+  :return: the token (a str, or an int for numerals) and whether it was produced by folding a coast
+  :rtype: ()
+
+  """
+
+  if word.isalpha() and word.isascii():
+    return word, False
+  if word.isdigit() and word.isascii() and (len(word) == 1 or word[0] != '0'):
+    return int(word), False
+  if '/' in word:
+    folded = slashcoast.sub(r'\1\2CS', word)
+    if folded.isalpha() and folded.isascii():
+      return folded, True
+
+  raise DAIDEParseError('Unrecognized token ' + repr(word), position, daide)
+
+def closedaidelist(items, firstfolded): # type: ([], bool) -> object
+  """
+  Finishes a parenthesized DAIDE group.  A group holding just a province and a coast,
+  like (SPA NCS), collapses to the 6-character coast representation SPANCS.
+
+  :param items: the tokens and sublists found in the group
+  :type items: []
+  :param firstfolded: whether the first token was itself produced by folding a coast
+  :type firstfolded: bool
+
+  :return: the group as a list, or the collapsed coast token
+  :rtype: object
+
+  """
+
+  if len(items) == 2 and not firstfolded and isinstance(items[0], str) and isinstance(items[1], str) and items[1] in coastwords:
+    return items[0] + items[1]
+
+  return items
+
+def daide2lists(daide, strict=False): # type: (str, bool) -> []
   """
   Convert DAIDE formatted syntax to JSON-like nested lists
 
   Example: FRM ( ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA)VSS(RUS TUR) ))
   yields ["FRM", ["ENG"], ["FRA", "ITA"], ["PRP", ["ALY", ["ENG", "FRA", "ITA"], "VSS", ["RUS", "TUR"]]]]
 
+  Coasts given as (SPA NCS) or SPA/NC are normalized to SPANCS.  The expression is
+  tokenized in a single pass; tokens are separated by whitespace, commas or parentheses.
+
   :param daide: a press utterance in DAIDE syntax (with From and To info)
   :type daide: str
+  :param strict: raise a DAIDEParseError describing the problem instead of returning an empty list
+  :type strict: bool
 
-  :return: a nested list representation resulting from replacing DAIDE parentheses with JSON brackets
+  :return: a nested list representation resulting from replacing DAIDE parentheses with brackets
   :rtype: []
 
   """
 
-  retlist = []
+  try:
+    return tokenizedaide(daide)
+  except DAIDEParseError:
+    if strict:
+      raise
+    return []
 
-  # standardizing
-  metamorphosis = daide.strip().upper() # FRM ( ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA)VSS(RUS TUR) ))
-  metamorphosis = '(' + metamorphosis + ')' # (FRM ( ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA)VSS(RUS TUR) )))
+def tokenizedaide(daide): # type: (str) -> []
+  """
+  The single-pass tokenizer behind daide2lists.  Raises DAIDEParseError on malformed input.
 
-  # corrections for whitespace
-  metamorphosis = re.sub(r'\( +', r'(', metamorphosis) # (FRM (ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA)VSS(RUS TUR) )))
-  metamorphosis = re.sub(r' +\)', r')', metamorphosis) # (FRM (ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA)VSS(RUS TUR))))
-  metamorphosis = re.sub(r'\)([A-Z])', r') \1', metamorphosis) # FRM (ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA) VSS(RUS TUR)))
-  metamorphosis = re.sub(r'([A-Z])\(', r'\1 (', metamorphosis) # FRM (ENG) (FRA ITA) (PRP (ALY (ENG  FRA ITA) VSS (RUS TUR)))
-  metamorphosis = re.sub(r' +', r' ', metamorphosis) # (FRM (ENG) (FRA ITA) (PRP (ALY (ENG FRA ITA) VSS (RUS TUR))))
+  :param daide: a DAIDE expression
+  :type daide: str
 
-  # handle the coasts - unsure if DAIDE really specifies it this way, but was observed in the wild
-  metamorphosis = re.sub(r'\(([A-Z]+) ([ENS])CS\)', r'\1\2CS', metamorphosis) # (FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO (SPA NCS))))) to (FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO SPANCS))))
-  metamorphosis = re.sub(r'([A-Z]+)/([ENS])CS?', r'\1\2CS', metamorphosis) # (FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO SPA/NC)))) to (FRM (FRA) (ENG) (PRP (XDO ((ENG AMY LVP) MTO SPANCS))))
+  :return: a nested list representation of the expression
+  :rtype: []
 
-  # transformations to JSON
-  metamorphosis = re.sub(r'([A-Z]+)', r'"\1"', metamorphosis) # ("FRM" ("ENG") ("FRA" "ITA") ("PRP" ("ALY" ("ENG" "FRA" "ITA") "VSS" ("RUS" "TUR"))))
-  metamorphosis = re.sub(r' ', r', ', metamorphosis) # ("FRM", ("ENG"), ("FRA", "ITA"), ("PRP", ("ALY", ("ENG", "FRA", "ITA"), "VSS", ("RUS", "TUR"))))
-  metamorphosis = re.sub(r'\(', r'[', metamorphosis) # ["FRM", ["ENG"), ["FRA", "ITA"), ["PRP", ["ALY", ["ENG", "FRA", "ITA"), "VSS", ["RUS", "TUR"))))
-  metamorphosis = re.sub(r'\)', r']', metamorphosis) # ["FRM", ["ENG"], ["FRA", "ITA"], ["PRP", ["ALY", ["ENG", "FRA", "ITA"], "VSS", ["RUS", "TUR"]]]]
+  """
 
-  try:
-    retlist = json.loads(metamorphosis)
-  except ValueError:
-    retlist = []
+  if daide is None:
+    raise DAIDEParseError('No DAIDE expression', 0, daide)
+
+  current = []
+  firstfolded = False
+  stack = []
+  # tokens are uppercased one at a time, since uppercasing can change the length of the text and with it the positions reported
+  for curmatch in daidetoken.finditer(daide):
+    curtoken = curmatch.group().upper()
+    if curtoken == '(':
+      stack.append((current, firstfolded, curmatch.start()))
+      current = []
+      firstfolded = False
+    elif curtoken == ')':
+      if len(stack) == 0:
+        raise DAIDEParseError('Unbalanced closing parenthesis', curmatch.start(), daide)
+      closed = closedaidelist(current, firstfolded)
+      current, firstfolded, _ = stack.pop()
+      if len(current) == 0:
+        firstfolded = isinstance(closed, str)
+      current.append(closed)
+    else:
+      word, folded = daideword(curtoken, curmatch.start(), daide)
+      if len(current) == 0:
+        firstfolded = folded
+      current.append(word)
 
-  return retlist
+  if len(stack) > 0:
+    raise DAIDEParseError('Unclosed parenthesis', stack[-1][2], daide)
+
+  return closedaidelist(current, firstfolded)
+
+daideparen = re.compile(r'[\s,]*([()])[\s,]*')
+daidespace = re.compile(r'[\s,]+')
+
+def normalizedaide(daide): # type: (str) -> str
+  """
+  Normalizes case, whitespace and commas in a DAIDE expression the way daide2lists does, so that
+  expressions that parse identically normalize identically.
+
+  :param daide: a DAIDE expression
+  :type daide: str
+
+  :return: the expression uppercased, without whitespace around parentheses and with single spaces between words
+  :rtype: str
+
+  """
+
+  return daidespace.sub(' ', daideparen.sub(r'\1', daide.upper())).strip()
+
+def freezelists(daidelists): # type: ([]) -> ()
+  """
+  Converts the nested lists from daide2lists to nested tuples so that they can be shared safely.
+
+  :param daidelists: a nested list representation of a DAIDE expression
+  :type daidelists: []
+
+  :return: the same structure with tuples in place of lists
+  :rtype: ()
+
+  """
+
+  if isinstance(daidelists, list):
+    return tuple([freezelists(curitem) for curitem in daidelists])
+
+  return daidelists
+
+class LRUCache:
+  """ A bounded, thread-safe least-recently-used cache that counts hits, misses and evictions. """
+
+  def __init__(self, maxsize=4096): # type: (int) -> None
+    """
+    Initialize an empty cache
+
+    :param maxsize: the most entries to hold, 0 disables caching
+    :type maxsize: int
+    """
+
+    self.maxsize = maxsize
+    self.entries = collections.OrderedDict()
+    self.lock = threading.Lock()
+    self.hits = 0
+    self.misses = 0
+    self.evictions = 0
+
+  def get(self, key): # type: (object) -> object
+    """
+    Looks up a cached value, marking it as recently used
+
+    :param key: the cache key
+    :type key: object
+
+    :return: the cached value, or None if absent
+    :rtype: object
+    """
+
+    with self.lock:
+      value = self.entries.get(key)
+      if value is None:
+        self.misses += 1
+      else:
+        self.hits += 1
+        self.entries.move_to_end(key)
+
+    return value
+
+  def put(self, key, value): # type: (object, object) -> None
+    """
+    Caches a value, evicting the least recently used entry if the cache is full
+
+    :param key: the cache key
+    :type key: object
+    :param value: the value to cache, must not be None
+    :type value: object
+    """
+
+    if self.maxsize <= 0:
+      return
+
+    with self.lock:
+      self.entries[key] = value
+      self.entries.move_to_end(key)
+      while len(self.entries) > self.maxsize:
+        self.entries.popitem(last=False)
+        self.evictions += 1
+
+  def clear(self): # type: () -> None
+    """
+    Empties the cache and resets its counters
+    """
+
+    with self.lock:
+      self.entries.clear()
+      self.hits = 0
+      self.misses = 0
+      self.evictions = 0
+
+  def stats(self): # type: () -> {}
+    """
+    Reports cache usage for monitoring
+
+    :return: the hits, misses, evictions, current size and maximum size of the cache
+    :rtype: {}
+    """
+
+    with self.lock:
+      return {'hits': self.hits,
+              'misses': self.misses,
+              'evictions': self.evictions,
+              'size': len(self.entries),
+              'maxsize': self.maxsize}
 
 def datc2lists(owner, shorthand, thirdparty=''): # type: (str, str, str) -> []
   """
@@ -576,6 +903,349 @@ def piglatinize(instr): # type: (str) -> str
 
   return ' '.join(newwords)
 
+def haughtytone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Haughty tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' Pray we do not alter the deal further.'
+  elif kind == 'YES' or kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Haughty'] + ' has deigned to respond to your missive: ' + retstr
+    if urgent:
+      if kind == 'REJ':
+        retstr = retstr + ' Now leave me alone for a while, many things are afoot.'
+      else:
+        retstr = retstr + ' I expect to see action on this matter from you soon.'
+  else:
+    retstr = powerdict[utterance.frompower]['Haughty'] + ' demands your attention in this matter. ' + retstr + ' What say you to that?'
+    if kind == 'PRP' and urgent:
+      retstr = retstr + ' You don\'t have much time to waste in considering your response.'
+
+  return retstr
+
+def obsequioustone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Obsequious tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' Sorry for bothering you.'
+  elif kind == 'YES' or kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Familiar'] + ' is happy to provide a response: ' + retstr
+    if urgent:
+      if kind == 'REJ':
+        retstr = retstr + ' Not much time to chat, but all the best for your game.'
+      else:
+        retstr = retstr + ' I really need a response if you could be so kind.'
+  else:
+    if len(utterance.topowers) == 1:
+      retstr = 'Oh great leader of ' + powerdict[utterance.topowers[0]]['Haughty'] + ', please hear me out. ' + retstr + '. Respectfully, the nation of ' + powerdict[utterance.frompower]['Objective'] + '.'
+    else:
+      retstr = 'Oh great Powers of Europe, please hear me out. ' + retstr + '. Respectfully, the nation of ' + powerdict[utterance.frompower]['Objective'] + '.'
+    if kind == 'PRP' and urgent:
+      retstr = retstr + ' I really need a response if you could be so kind.'
+
+  return retstr
+
+def hostiletone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Hostile tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' This agreement, and your participation, aren\'t worth my time.'
+  elif kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Objective'] + ' cannot waste time on ' + utterance.rng.choice(['this foolishness', 'you', listOfPowers(utterance.topowers, '', [], rng=utterance.rng)]) + ': ' + retstr
+    if urgent:
+      retstr = retstr + ' Now leave me alone for a while, many things are afoot.'
+  elif kind == 'YES':
+    retstr = 'This had better work, or ' + utterance.rng.choice(['you', listOfPowers(utterance.topowers, '', [], rng=utterance.rng)]) + ' will soon be seeing my armies rolling into your provinces: ' + retstr
+    if urgent:
+      retstr = retstr + ' I expect to see action on this matter from you soon.'
+  elif kind == 'PRP':
+    if len(utterance.topowers) == 1:
+      retstr = 'This might be your last chance. ' + retstr + ' ' + utterance.rng.choice(['I await', powerdict[utterance.frompower]['Haughty'] + ' awaits']) + ' your response.'
+    else:
+      retstr = 'You ' + size2numstr(utterance.topowers) + ' think you\'ve got it all figured out. No matter - I have the following to propose: ' + retstr + ' ' + utterance.rng.choice(['I await', powerdict[utterance.frompower]['Haughty'] + ' awaits']) + ' your response.'
+  elif kind == 'FCT':
+    retstr = 'You are getting in my way - this should make you worried: ' + retstr
+
+  return retstr
+
+def friendlytone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Friendly tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' Apologies - had to change course, but hope to work with you on other initiatives.'
+  elif kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Objective'] + ' cannot make this commitment right now, but I want to find another way to work together: ' + retstr
+    if urgent:
+      retstr = retstr + ' Let\'s talk over another possibility in the next couple turns.'
+  elif kind == 'YES':
+    retstr = 'Yes, this will be a helpful move for both you and me.  ' + retstr + utterance.rng.choice([' Pleasure doing business with you!', ' Best of luck with your plans!'])
+  elif kind == 'PRP':
+    if len(utterance.topowers) == 1:
+      retstr = 'I think this proposal will help us both out. ' + retstr + ' ' + utterance.rng.choice(['You seem to be a reasonable sort.', 'I think our interests are aligned for the time being.'])
+    else:
+      retstr = 'Let\'s collaborate together in this phase of the game.' + retstr + ' We have more to gain from working together than going on our own.'
+  elif kind == 'FCT':
+    retstr = 'Here\'s something I have learned recently.  Hope it helps with your game: ' + retstr
+
+  return retstr
+
+def fearfultone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Fearful tone.  Facts are left as they are.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' I\'m having second thoughts about this situation.  I am nervous about your position.'
+  elif kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Objective'] + ' cannot see how this benefits me, and I worry about your growing strength: ' + retstr
+    if urgent:
+      retstr = retstr + ' Convince me you are not a significant threat to me, or I may seek alliances elsewhere.'
+  elif kind == 'YES':
+    retstr = 'I agree, and hope this appeases you for the time being.  ' + retstr + utterance.rng.choice([' Peaceful journey!', ' Best of luck with your plans!'])
+  elif kind == 'PRP':
+    if len(utterance.topowers) == 1:
+      retstr = 'Would this offer do anything to keep your armies off my territory? ' + retstr + ' ' + utterance.rng.choice(['You seem to be a reasonable sort.', 'I appeal to your better nature.'])
+    else:
+      retstr = 'I address you as one who needs your help - things are not going well for me.' + retstr + ' We have more to gain from working together than going on our own.'
+
+  return retstr
+
+def confidenttone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Confident tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' That\'s not actually the best choice I have right now - I\'m going to look for other options.'
+  elif kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Objective'] + ' can do better right now, given my position in the game. ' + retstr
+    if urgent:
+      retstr = retstr + ' I\'m close to reaching my goals - come up with a better proposal soon if you want to do something.'
+  elif kind == 'YES':
+    retstr = 'This is a good proposal for me.  ' + powerdict[utterance.frompower]['Objective'] + '\'s position will be strengthened.  ' + retstr + utterance.rng.choice([' Look out for ' + powerdict[utterance.frompower]['Haughty'] + '!', ' Best of luck with your plans!'])
+  elif kind == 'PRP':
+    retstr = 'I can see that you might need my help.  What do you say to this? ' + retstr
+  elif kind == 'FCT':
+    retstr = 'Here\'s something I have learned recently.  In my position, I can afford to share some intel: ' + retstr
+
+  return retstr
+
+def empathetictone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Empathetic tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' I do sympathize with your position, but I must retract this.'
+  elif kind == 'REJ':
+    retstr = powerdict[utterance.frompower]['Objective'] + ' sees that this would be of benefit to you, but I need more from the deal: ' + retstr
+    if urgent:
+      retstr = retstr + ' Given how the game is going for you, come back to me soon with something better.'
+  elif kind == 'YES':
+    retstr = 'I agree, and hope this helps you out for the time being.  ' + retstr + utterance.rng.choice([' Peaceful journey!', ' Best of luck with your plans!'])
+  elif kind == 'PRP':
+    if len(utterance.topowers) == 1:
+      retstr = 'I can see that the game is not going so well for you.  Would you like some help: ' + retstr + ' ' + utterance.rng.choice(['You should be able to get back on track soon.', 'I can see a couple ways out of trouble for you.'])
+    else:
+      retstr = 'We\'re all in the same boat.  What about a plan to move forward:' + retstr + ' We have more to gain from working together than going on our own.'
+  elif kind == 'FCT':
+    retstr = 'Here\'s something I have learned recently.  Hope it helps you out: ' + retstr
+
+  return retstr
+
+def upsettone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Upset tone.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL':
+    retstr = retstr + ' You\'re getting on my nerves - I won\'t be willing to help you out in future.'
+  elif kind == 'REJ':
+    retstr = 'This is a ridiculous offer - what makes you think I would be interested? ' + retstr
+    if urgent:
+      retstr = retstr + ' Start paying attention or get ready to see my armies marching into your provinces.'
+  elif kind == 'YES':
+    retstr = 'For now, I agree, but you need to start showing better faith: ' + retstr
+    if urgent:
+      retstr = retstr + ' I want to see you take action on this soon, or I will lose interest in cooperating.'
+  elif kind == 'PRP':
+    if len(utterance.topowers) == 1:
+      retstr = 'Your recent moves are not appropriate for a peaceful relationship.  This is my last offer: ' + retstr + ' ' + utterance.rng.choice(['You need to reconsider your approach.', 'I can see a difficult future for you.'])
+    else:
+      retstr = 'You ' + size2numstr(utterance.topowers) + ' are getting on my nerves.  This is my last offer:' + retstr + ' We should work together, but you are making that impossible.'
+  elif kind == 'FCT':
+    retstr = 'Here\'s something I have learned recently.  You had better take notice: ' + retstr
+
+  return retstr
+
+def urgenttone(utterance, retstr, kind, urgent): # type: (pressgloss.core.PressUtterance, str, str, bool) -> str
+  """
+  Renders a gloss in the Urgent tone, when no other tone takes precedence.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+  :param retstr: the English gloss that has been produced so far.
+  :type retstr: str
+  :param kind: the utterance's press kind, from toneplan
+  :type kind: str
+  :param urgent: whether the Urgent tone is also used
+  :type urgent: bool
+
+  :return: the gloss in tone
+  :rtype: str
+  """
+
+  if kind == 'CCL' or kind == 'REJ':
+    retstr = retstr + ' No time to consider that for now.'
+  elif kind == 'YES':
+    retstr = retstr + " Let's get going on this now that it's agreed."
+  elif kind == 'PRP':
+    retstr = retstr + ' We need to move fast on this.'
+
+  return retstr
+
+# The tones that change the wording of a gloss, in order of precedence: only the first one used applies.
+tonerenderers = collections.OrderedDict([('Haughty', haughtytone),
+                                         ('Obsequious', obsequioustone),
+                                         ('Hostile', hostiletone),
+                                         ('Friendly', friendlytone),
+                                         ('Fearful', fearfultone),
+                                         ('Confident', confidenttone),
+                                         ('Empathetic', empathetictone),
+                                         ('Upset', upsettone),
+                                         ('Urgent', urgenttone)])
+# Top-level press that is toned like another kind: a conditional is a proposal
+tonekinds = {'IFF': 'PRP'}
+# Top-level press that is never toned
+untonedkinds = frozenset(['HUH', 'BWX'])
+
+def toneplan(utterance): # type: (pressgloss.core.PressUtterance) -> ()
+  """
+  Works out once per utterance how its tones apply: the kind of its top-level press, the renderer for
+  the tone that takes precedence, and the tone flags that modify it.
+
+  :param utterance: the original DAIDE utterance
+  :type utterance: pressgloss.core.PressUtterance
+
+  :return: (press kind, renderer or None, whether Urgent is used, whether PigLatin is used)
+  :rtype: ()
+  """
+
+  kind = ''
+  if utterance.content is not None:
+    kind = tonekinds.get(utterance.content.operator, utterance.content.operator)
+  toneset = frozenset(utterance.tones)
+  renderer = None
+  for curtone, currenderer in tonerenderers.items():
+    if curtone in toneset:
+      renderer = currenderer
+      break
+
+  return kind, renderer, 'Urgent' in toneset, 'PigLatin' in toneset
+
 def tonetize(utterance, glosssofar): # type: (pressgloss.core.PressUtterance, str) -> str
   """
   Take a basic expression and apply tones to it if possible.
@@ -590,147 +1260,17 @@ def tonetize(utterance, glosssofar): # type: (pressgloss.core.PressUtterance, st
   if glosssofar == '' or glosssofar == 'Ahem.':
     return glosssofar
 
+  if utterance.toneplan is None:
+    utterance.toneplan = toneplan(utterance)
+  kind, renderer, urgent, piglatin = utterance.toneplan
+
   retstr = glosssofar
-  if 'HUH' in utterance.daide or 'BWX' in utterance.daide:
+  if kind in untonedkinds:
     return retstr
-  if 'Haughty' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' Pray we do not alter the deal further.'
-    elif 'YES' in utterance.daide or 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Haughty'] + ' has deigned to respond to your missive: ' + retstr
-      if 'Urgent' in utterance.tones:
-        if 'REJ' in utterance.daide:
-          retstr = retstr + ' Now leave me alone for a while, many things are afoot.'
-        else:
-          retstr = retstr + ' I expect to see action on this matter from you soon.'
-    else:
-      retstr = powerdict[utterance.frompower]['Haughty'] + ' demands your attention in this matter. ' + retstr + ' What say you to that?'
-      if 'PRP' in utterance.daide and 'Urgent' in utterance.tones:
-        retstr = retstr + ' You don\'t have much time to waste in considering your response.'
-  elif 'Obsequious' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' Sorry for bothering you.'
-    elif 'YES' in utterance.daide or 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Familiar'] + ' is happy to provide a response: ' + retstr
-      if 'Urgent' in utterance.tones:
-        if 'REJ' in utterance.daide:
-          retstr = retstr + ' Not much time to chat, but all the best for your game.'
-        else:
-          retstr = retstr + ' I really need a response if you could be so kind.'
-    else:
-      if len(utterance.topowers) == 1:
-        retstr = 'Oh great leader of ' + powerdict[utterance.topowers[0]]['Haughty'] + ', please hear me out. ' + retstr + '. Respectfully, the nation of ' + powerdict[utterance.frompower]['Objective'] + '.'
-      else:
-        retstr + 'Oh great Powers of Europe, please hear me out. ' + retstr + '. Respectfully, the nation of ' + powerdict[utterance.frompower]['Objective'] + '.'
-      if 'PRP' in utterance.daide and 'Urgent' in utterance.tones:
-        retstr = retstr + ' I really need a response if you could be so kind.'
-  elif 'Hostile' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' This agreement, and your participation, aren\'t worth my time.'
-    elif 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Objective'] + ' cannot waste time on ' + random.choice(['this foolishness', 'you', listOfPowers(utterance.topowers, '', [])]) + ': ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' Now leave me alone for a while, many things are afoot.'
-    elif 'YES' in utterance.daide:
-      retstr = 'This had better work, or ' + random.choice(['you', listOfPowers(utterance.topowers, '', [])]) + ' will soon be seeing my armies rolling into your provinces: ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' I expect to see action on this matter from you soon.'
-    elif 'PRP' in utterance.daide:
-      if len(utterance.topowers) == 1:
-        retstr = 'This might be your last chance. ' + retstr + ' ' + random.choice(['I await', powerdict[utterance.frompower]['Haughty'] + ' awaits']) + ' your response.'
-      else:
-        retstr + 'You ' + size2numstr(utterance.topowers) + ' think you\'ve got it all figured out. No matter - I have the following to propose: ' + retstr + ' ' + random.choice(['I await', powerdict[utterance.frompower]['Haughty'] + ' awaits']) + ' your response.'
-    elif 'FCT' in utterance.daide:
-      retstr = 'You are getting in my way - this should make you worried: ' + retstr
-  elif 'Friendly' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' Apologies - had to change course, but hope to work with you on other initiatives.'
-    elif 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Objective'] + ' cannot make this commitment right now, but I want to find another way to work together: ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' Let\'s talk over another possibility in the next couple turns.'
-    elif 'YES' in utterance.daide:
-      retstr = 'Yes, this will be a helpful move for both you and me.  ' + retstr + random.choice([' Pleasure doing business with you!', ' Best of luck with your plans!'])
-    elif 'PRP' in utterance.daide:
-      if len(utterance.topowers) == 1:
-        retstr = 'I think this proposal will help us both out. ' + retstr + ' ' + random.choice(['You seem to be a reasonable sort.', 'I think our interests are aligned for the time being.'])
-      else:
-        retstr = 'Let\'s collaborate together in this phase of the game.' + retstr + ' We have more to gain from working together than going on our own.'
-    elif 'FCT' in utterance.daide:
-      retstr = 'Here\'s something I have learned recently.  Hope it helps with your game: ' + retstr
-  elif 'Fearful' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' I\'m having second thoughts about this situation.  I am nervous about your position.'
-    elif 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Objective'] + ' cannot see how this benefits me, and I worry about your growing strength: ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' Convince me you are not a significant threat to me, or I may seek alliances elsewhere.'
-    elif 'YES' in utterance.daide:
-      retstr = 'I agree, and hope this appeases you for the time being.  ' + retstr + random.choice([' Peaceful journey!', ' Best of luck with your plans!'])
-    elif 'PRP' in utterance.daide:
-      if len(utterance.topowers) == 1:
-        retstr = 'Would this offer do anything to keep your armies off my territory? ' + retstr + ' ' + random.choice(['You seem to be a reasonable sort.', 'I appeal to your better nature.'])
-      else:
-        retstr = 'I address you as one who needs your help - things are not going well for me.' + retstr + ' We have more to gain from working together than going on our own.'
-    elif 'FCT' in utterance.tones:
-      retstr = 'Here\'s something I have learned recently.  It makes me nervous: ' + retstr
-  elif 'Confident' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' That\'s not actually the best choice I have right now - I\'m going to look for other options.'
-    elif 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Objective'] + ' can do better right now, given my position in the game. ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' I\'m close to reaching my goals - come up with a better proposal soon if you want to do something.'
-    elif 'YES' in utterance.daide:
-      retstr = 'This is a good proposal for me.  ' + powerdict[utterance.frompower]['Objective'] + '\'s position will be strengthened.  ' + retstr + random.choice([' Look out for ' + powerdict[utterance.frompower]['Haughty'] + '!', ' Best of luck with your plans!'])
-    elif 'PRP' in utterance.daide:
-      retstr = 'I can see that you might need my help.  What do you say to this? ' + retstr
-    elif 'FCT' in utterance.daide:
-      retstr = 'Here\'s something I have learned recently.  In my position, I can afford to share some intel: ' + retstr
-  elif 'Empathetic' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' I do sympathize with your position, but I must retract this.'
-    elif 'REJ' in utterance.daide:
-      retstr = powerdict[utterance.frompower]['Objective'] + ' sees that this would be of benefit to you, but I need more from the deal: ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' Given how the game is going for you, come back to me soon with something better.'
-    elif 'YES' in utterance.daide:
-      retstr = 'I agree, and hope this helps you out for the time being.  ' + retstr + random.choice([' Peaceful journey!', ' Best of luck with your plans!'])
-    elif 'PRP' in utterance.daide:
-      if len(utterance.topowers) == 1:
-        retstr = 'I can see that the game is not going so well for you.  Would you like some help: ' + retstr + ' ' + random.choice(['You should be able to get back on track soon.', 'I can see a couple ways out of trouble for you.'])
-      else:
-        retstr = 'We\'re all in the same boat.  What about a plan to move forward:' + retstr + ' We have more to gain from working together than going on our own.'
-    elif 'FCT' in utterance.daide:
-      retstr = 'Here\'s something I have learned recently.  Hope it helps you out: ' + retstr
-  elif 'Upset' in utterance.tones:
-    if 'CCL' in utterance.daide:
-      retstr = retstr + ' You\'re getting on my nerves - I won\'t be willing to help you out in future.'
-    elif 'REJ' in utterance.daide:
-      retstr = 'This is a ridiculous offer - what makes you think I would be interested? ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' Start paying attention or get ready to see my armies marching into your provinces.'
-    elif 'YES' in utterance.daide:
-      retstr = 'For now, I agree, but you need to start showing better faith: ' + retstr
-      if 'Urgent' in utterance.tones:
-        retstr = retstr + ' I want to see you take action on this soon, or I will lose interest in cooperating.'
-    elif 'PRP' in utterance.daide:
-      if len(utterance.topowers) == 1:
-        retstr = 'Your recent moves are not appropriate for a peaceful relationship.  This is my last offer: ' + retstr + ' ' + random.choice(['You need to reconsider your approach.', 'I can see a difficult future for you.'])
-      else:
-        retstr = 'You ' + size2numstr(utterance.topowers) + ' are getting on my nerves.  This is my last offer:' + retstr + ' We should work together, but you are making that impossible.'
-    elif 'FCT' in utterance.daide:
-      retstr = 'Here\'s something I have learned recently.  You had better take notice: ' + retstr
-  elif 'Urgent' in utterance.tones:
-    if 'PRP' in utterance.daide:
-      if 'CCL' in utterance.daide or 'REJ' in utterance.daide:
-        retstr = retstr + ' No time to consider that for now.'
-      elif 'YES' in utterance.daide:
-        retstr = retstr + " Let's get going on this now that it's agreed."
-      else:
-        retstr = retstr + ' We need to move fast on this.'
+  if renderer is not None:
+    retstr = renderer(utterance, retstr, kind, urgent)
 
-  if 'PigLatin' in utterance.tones:
+  if piglatin:
     retstr = piglatinize(retstr)
 
   return retstr
@@ -768,7 +1308,109 @@ AND: (AND (Press message) (Press message))
 
 arrangement_list = ['DMZ', 'ALY', 'PCE', 'AND', 'ORR', 'XDO']
 
-grammar = create_daide_grammar(level=130)
+grammarlevel = 130
+grammars = {}
+grammarlock = threading.Lock()
+
+def getcachefolder(): # type: () -> str
+  """
+  Returns the folder that pressgloss caches things in: $PRESSGLOSS_CACHE, or pressgloss under $XDG_CACHE_HOME or ~/.cache.
+
+  :return: the path of the cache folder, which may not exist yet
+  :rtype: str
+  """
+
+  cachefolder = os.environ.get('PRESSGLOSS_CACHE')
+  if cachefolder is None:
+    cachefolder = os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'pressgloss')
+
+  return cachefolder
+
+def getgrammarcachepath(level=grammarlevel): # type: (int) -> str
+  """
+  Returns where on disk the compiled daidepp grammar for a level is cached, which depends on the installed daidepp
+  version and on the installed version of parsimonious, whose Grammar is what is pickled.
+
+  :param level: the DAIDE press level of the grammar
+  :type level: int
+
+  :return: the path of the pickled grammar, or None if the daidepp or parsimonious version cannot be determined
+  :rtype: str
+  """
+
+  import importlib.metadata
+
+  try:
+    daideppversion = importlib.metadata.version('daidepp')
+    parsimoniousversion = importlib.metadata.version('parsimonious')
+  except importlib.metadata.PackageNotFoundError:
+    return None
+
+  return os.path.join(getcachefolder(), 'daidepp-' + daideppversion + '-parsimonious-' + parsimoniousversion + '-grammar-' + str(level) + '.pickle')
+
+def getgrammar(level=grammarlevel): # type: (int) -> parsimonious.Grammar
+  """
+  Returns the daidepp grammar for a DAIDE press level, building it on first use.  A built grammar is
+  pickled to the cache path so that later processes can load it instead of building it again; an
+  unreadable or unwritable cache falls back to building the grammar.
+
+  :param level: the DAIDE press level of the grammar
+  :type level: int
+
+  :return: the grammar
+  :rtype: parsimonious.Grammar
+  """
+
+  if level in grammars:
+    return grammars[level]
+
+  import pickle
+
+  with grammarlock:
+    if level not in grammars:
+      cachepath = getgrammarcachepath(level)
+      thegrammar = None
+      if cachepath is not None and os.path.isfile(cachepath):
+        import parsimonious
+
+        # a cache that is unreadable, truncated or written by other code is rebuilt rather than trusted
+        try:
+          with open(cachepath, 'rb') as cachefile:
+            thegrammar = pickle.load(cachefile)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, IndexError, TypeError, ValueError, RecursionError):
+          thegrammar = None
+        if not isinstance(thegrammar, parsimonious.Grammar):
+          thegrammar = None
+      if thegrammar is None:
+        from daidepp.grammar.grammar_utils import create_daide_grammar
+
+        thegrammar = create_daide_grammar(level=level)
+        if cachepath is not None:
+          try:
+            os.makedirs(os.path.dirname(cachepath), exist_ok=True)
+            with open(cachepath + '.' + str(os.getpid()), 'wb') as cachefile:
+              pickle.dump(thegrammar, cachefile, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(cachepath + '.' + str(os.getpid()), cachepath)
+          except (OSError, pickle.PicklingError, RecursionError, TypeError, AttributeError):
+            pass
+      grammars[level] = thegrammar
+
+  return grammars[level]
+
+def __getattr__(name): # type: (str) -> object
+  """
+  Builds helpers.grammar, the level 130 daidepp grammar, when it is first asked for.
+
+  :param name: the module attribute that was not found
+  :type name: str
+
+  :return: the grammar
+  :rtype: parsimonious.Grammar
+  """
+
+  if name == 'grammar':
+    return getgrammar()
+  raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(name))
 
 
 def add_paranthesis(substring, string):
@@ -789,14 +1431,12 @@ def aly_fix(string):
 
 
 def error_fetch(string):
-    try:
-        grammar.parse(string)
-        error = 'No Error'
-        return error, None
-    except Exception as e:
-        error = str(e)
-        error_type = re.findall(r"\s'(.*?)'\s", error)[0]
-        return error, error_type
+    # Checks against the daidepp grammar, remembering strings already checked
+    import pressgloss.repair as REPAIR
+    result = REPAIR.getengine().check(string)
+    if result is None:
+        return 'No Error', None
+    return result[0], result[1]
 
 # Disable
 def blockPrint():
@@ -807,128 +1447,17 @@ def enablePrint():
     sys.stdout = sys.__stdout__
 
 def grammar_cleaner(daide_attempt:str)->str:
-    i = 0
-
-    #We need to remove some alterations that happen to the string due to preprocessing of prompts
-    #Remove extra spaces
-    # string = re.sub(r'\s', '', daide_attempt)
-    # uppercasing the string in case the training algorithm removed its uppercase. 
-
-    daide_attempt = daide_attempt.upper()
-    #Remove the completion seperators. 
-    daide_attempt = re.sub(r'\n\n###\n\n', '', daide_attempt)
+    # Repairs at the place the grammar stops matching, a bounded number of times; see pressgloss.repair.
+    # Returns the repaired DAIDE, or the attempt uppercased with its FRM if it cannot be repaired.
+    import pressgloss.repair as REPAIR
+    result = REPAIR.getengine().repair(daide_attempt)
+    if result['error'] is None:
+        return result['daide']
+
+    daide_attempt = re.sub(r'\n\n###\n\n', '', daide_attempt.upper())
     if not daide_attempt.startswith('FRM ('):
         daide_attempt = 'FRM (' + daide_attempt
-    error, error_type = error_fetch(daide_attempt)
-    # We need to add this string in case the training prep script removed it as header. 
-    string = daide_attempt
-    #Check if daide_attempt starts with 'FRM ('
-    
-    while error != 'No Error' and i < 10:
-        #Get rid of incorrect server-client commands
-        string = re.sub(r'\sBNC\([A-Z]*\)', '', string)
-        #Replace incorrectly labeled units
-        string = re.sub(r'\sA\s', ' AMY ', string)
-        string = re.sub(r'\sF\s', ' FLT ', string)
-        string = re.sub(r'\sFLE\s', ' FLT ', string)
-        if string.count('(') > string.count(')'):
-            string = string + ')'
-        elif string.count('(') < string.count(')'):
-            #Remove the last parenthesis
-            string = string[:-1]
-        
-        error, error_type = error_fetch(string)
-        tokens = re.findall(r'[\s\(\)]*([A-Z]{3})[\s\(\)]*', string)
-        powers = []
-        arrangements = []
-        error_bits = re.findall(r"\s'(.*?)'[\s]*", error)
-        if len(error_bits) > 1:
-            message_mismatch = re.findall(r"\s'(.*?)'[\s]*", error)[1]
-            message_mismatch = re.sub(r'\(', r'\(', message_mismatch)
-            message_mismatch = re.sub(r'\)', r'\)', message_mismatch)
-        else:
-            message_mismatch = None
-        for token in tokens:
-            if token in powerlist:
-                powers.append(token)
-            if token in arrangement_list:
-                arrangements.append(token)
-        print(tokens)
-        if 'AND' and 'PRP' in tokens:
-            string = re.sub('(?<=PRP\()(.*?)(?=AND)', '', string)
-        if error_type == 'message':
-            print('dealing with message error')
-
-            
-            if string[:3] in arrangement_list:
-                string = 'PRP(' + string + ')'
-
-            if error[:38] == "Rule 'message' matched in its entirety": 
-
-                string = re.sub('\s' + message_mismatch, '', string)    
-
-            # #Remove substrings in the form of with BNC(*)
-            # string = re.sub(r'\sBNC\([A-Z]*\)', '', string)
-            # print(string)
-            #Try to parse the string again
-            print('parsing again')
-            original_error = error
-            error, error_type = error_fetch(string)
-        elif error_type == 'rpar' or error_type == 'lpar':
-            print('dealing with parenthesis error')
-
-            print(error)
-            #Count number of tokens that are in arrangement_list
-            # if len(powers)>1:
-            #     string = re.sub(r'\sDMZ', ' DMZ' + '(' + powers[0] + ' ' + powers[1] + ')', string)
-            #     print(string)
-            if len(arrangements) > 1 and 'AND' not in tokens: 
-                string = re.sub(r'PRP\(', 'PRP(AND ', string)
-            if 'AND' in tokens:
-                #Add parenthesis to around PCE(...)
-                string = add_paranthesis(r'PCE\(.*?\)(?=\s)', string)
-
-                #Add parenthesis to around DMZ(...)
-                string = add_paranthesis(r'(?<=\s)DMZ[\s]*\(.*?\)[\s]*\(.*?\)', string)
-                string = add_paranthesis(r'ALY\(.*?\)[\s]*VSS[\s]*\(.*?\)(?=\s)', string)
-                string = add_paranthesis(r'XDO\(.*?\).*?\)(?<=\s)', string)
-            #Count paranthesis and balance them across the string 
-            print('parsing again')
-            original_error = error
-            error, error_type = error_fetch(string)
-        elif error_type == 'arrangement': 
-            print('dealing with arrangement error')
-            if message_mismatch == None: 
-                return string
-            message_mismatch = message_mismatch[:3]
-            if 'VSS' in tokens:
-                #Replace mismatch string with ALY
-                string = re.sub(message_mismatch, 'ALY', string)
-                #remove characters between ALY(.*?) and VSS 
-                string = re.sub('(?<=ALY\(.{7}?\))(.*?)(?=VSS)', '', string)
-            else:
-                print(message_mismatch)
-                string = re.sub(message_mismatch, 'PCE', string)
-            print('parsing again')
-            error, error_type = error_fetch(string)
-        elif error_type == 'press_message':
-
-            if string[:3] == 'YES' and 'PRP' not in tokens:
-                string = string[:3] + '(PRP' + string[3:] + ')'
-
-
-            print('parsing again')
-            error, error_type = error_fetch(string)
-
-        print(string)
-
-        i += 1
-    i += 1
-
-    if error != 'No Error':
-        return(daide_attempt)
-    else:
-        return string
+    return daide_attempt
 
 def jsonl_loader(json_file_pointer: str)->list: 
   with open(json_file_pointer, 'r') as json_file:
@@ -953,6 +1482,8 @@ def dicts_to_jsonl(data_list: list, filename: str) -> None:
             out.write(jout)
 
 def run_cmd(cmd):
+    import subprocess
+
     result = subprocess.run([
       '/bin/bash',
       '-c',
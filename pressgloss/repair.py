@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+""" Repair of the almost-DAIDE that language models write, guided by where the DAIDE grammar stops matching it. """
+
+# Standard library imports
+import re
+import time
+import bisect
+import threading
+import collections
+
+# pressgloss imports
+from . import helpers
+
+# Words models write for units instead of the DAIDE ones
+unitaliases = {'A': 'AMY', 'ARMY': 'AMY', 'F': 'FLT', 'FLE': 'FLT', 'FLEET': 'FLT'}
+# Press which must be proposed, or answered, rather than sent bare
+arrangements = frozenset(['PCE', 'ALY', 'DMZ', 'XDO', 'AND', 'ORR', 'DRW', 'SLO', 'NOT', 'NAR'])
+separator = re.compile(r'\n\n###\n\n|```[A-Za-z]*')
+
+def tokenize(content): # type: (str) -> []
+  """
+  Splits what a model wrote into DAIDE words and parentheses, uppercased, fixing what can be fixed without the grammar:
+  completion separators and code fences, prose before the FRM, unit names, BNC server commands and unclosed parentheses.
+
+  :param content: what the model wrote
+  :type content: str
+
+  :return: the tokens, and the names of the repairs made
+  :rtype: ()
+  """
+
+  repairs = []
+  tokens = helpers.daidetoken.findall(separator.sub(' ', content.upper()))
+  if 'FRM' in tokens:
+    if tokens.index('FRM') > 0:
+      tokens = tokens[tokens.index('FRM'):]
+      repairs.append('prose')
+  else:
+    tokens = ['FRM', '('] + tokens
+    repairs.append('header')
+
+  rettokens = []
+  curindex = 0
+  while curindex < len(tokens):
+    curtoken = tokens[curindex]
+    if curtoken == 'BNC' and curindex + 2 < len(tokens) and tokens[curindex + 1] == '(':
+      # a server command, BNC (...) up to its closing parenthesis
+      closing = tokens.index(')', curindex) if ')' in tokens[curindex:] else len(tokens) - 1
+      curindex = closing + 1
+      repairs.append('bnc')
+      continue
+    if curtoken in unitaliases:
+      curtoken = unitaliases[curtoken]
+      repairs.append('unit')
+    rettokens.append(curtoken)
+    curindex += 1
+
+  depth = 0
+  for curtoken in rettokens:
+    depth += 1 if curtoken == '(' else -1 if curtoken == ')' else 0
+  if depth > 0:
+    rettokens.extend([')'] * depth)
+    repairs.append('close')
+
+  return rettokens, repairs
+
+def render(tokens): # type: ([]) -> ()
+  """
+  Writes tokens out as DAIDE, spaced the way pressgloss writes DAIDE.
+
+  :param tokens: the DAIDE words and parentheses
+  :type tokens: []
+
+  :return: the DAIDE, and where in it each token starts
+  :rtype: ()
+  """
+
+  parts = []
+  starts = []
+  length = 0
+  previous = '('
+  for curtoken in tokens:
+    if curtoken != ')' and previous != '(':
+      parts.append(' ')
+      length += 1
+    starts.append(length)
+    parts.append(curtoken)
+    length += len(curtoken)
+    previous = curtoken
+
+  return ''.join(parts), starts
+
+def groupend(tokens, start): # type: ([], int) -> int
+  """
+  Returns the index just past the parenthesized group, or single word, starting at an index.
+
+  :param tokens: the DAIDE words and parentheses
+  :type tokens: []
+  :param start: the index of the opening parenthesis or word
+  :type start: int
+
+  :return: the index after the group
+  :rtype: int
+  """
+
+  if start >= len(tokens) or tokens[start] != '(':
+    return start + 1
+  depth = 0
+  for curindex in range(start, len(tokens)):
+    depth += 1 if tokens[curindex] == '(' else -1 if tokens[curindex] == ')' else 0
+    if depth == 0:
+      return curindex + 1
+
+  return len(tokens)
+
+def candidates(tokens, index, rule, incomplete): # type: ([], int, str, bool) -> []
+  """
+  Returns the edits worth trying where the grammar stopped matching, most likely first.
+
+  :param tokens: the DAIDE words and parentheses
+  :type tokens: []
+  :param index: the index of the token the grammar stopped at
+  :type index: int
+  :param rule: the name of the grammar rule that did not match
+  :type rule: str
+  :param incomplete: whether a whole message matched, with tokens left over
+  :type incomplete: bool
+
+  :return: the name of each repair and the tokens it makes
+  :rtype: []
+  """
+
+  retlist = []
+  if incomplete:
+    # a whole message and then something more: drop the rest, or it may be one parenthesis too many
+    retlist.append(('truncate', tokens[:index]))
+    if index < len(tokens) and tokens[index] == ')':
+      retlist.append(('unbalanced', tokens[:index] + tokens[index + 1:]))
+    return retlist
+
+  curtoken = tokens[index] if index < len(tokens) else None
+  if curtoken in arrangements:
+    # bare press where a proposal or answer belongs
+    end = groupend(tokens, index + 1) if index + 1 < len(tokens) and tokens[index + 1] == '(' else index + 1
+    while end < len(tokens) and tokens[end] not in ('(', ')') and tokens[end] not in arrangements:
+      end += 1
+    while end < len(tokens) and tokens[end] == '(':
+      end = groupend(tokens, end)
+    retlist.append(('proposal', tokens[:index] + ['PRP', '('] + tokens[index:end] + [')'] + tokens[end:]))
+  if rule == 'lpar':
+    retlist.append(('open', tokens[:index] + ['('] + tokens[index:]))
+  if curtoken is not None and curtoken != '(':
+    retlist.append(('drop', tokens[:index] + tokens[index + 1:]))
+  if rule != 'lpar':
+    retlist.append(('close', tokens[:index] + [')'] + tokens[index:]))
+    if curtoken is not None and curtoken != '(' and curtoken != ')' and tokens[index - 1:index] != ['(']:
+      retlist.append(('group', tokens[:index] + ['('] + tokens[index:groupend(tokens, index)] + [')'] + tokens[groupend(tokens, index):]))
+  if curtoken == '(' or (rule == 'lpar' and curtoken == ')'):
+    retlist.append(('drop', tokens[:index] + tokens[index + 1:]))
+
+  return retlist
+
+def stoppedat(result, daide, tokens, starts): # type: ((), str, [], []) -> int
+  """
+  Returns the index of the token the grammar stopped matching at.
+
+  :param result: what RepairEngine.check found
+  :type result: ()
+  :param daide: the DAIDE checked
+  :type daide: str
+  :param tokens: the tokens of the DAIDE
+  :type tokens: []
+  :param starts: where in the DAIDE each token starts
+  :type starts: []
+
+  :return: the token index, one past the last token if the grammar matched it all
+  :rtype: int
+  """
+
+  if result is None or result[2] >= len(daide) or len(tokens) == 0:
+    return len(tokens) + (1 if result is None else 0)
+  retindex = max(bisect.bisect_right(starts, result[2]) - 1, 0)
+  if starts[retindex] + len(tokens[retindex]) <= result[2]:
+    # stopped at the space after a token
+    retindex += 1
+
+  return retindex
+
+class RepairEngine:
+  """
+  Repairs DAIDE written by models.  What the model wrote is tokenized once and fixed up without the grammar; then,
+  while the grammar rejects it, edits are tried at the token the grammar stopped at and the one that gets furthest is
+  kept.  Every string checked is remembered, so repeated checks cost a dictionary lookup, and each repair reports what
+  it did and how long it took instead of printing.
+  """
+
+  def __init__(self, parse=None, maxparses=24, cachesize=8192): # type: (callable, int, int) -> None
+    """
+    Initialize the engine
+
+    :param parse: checks DAIDE, raising a parsimonious ParseError if it does not match, by default the daidepp grammar's parse
+    :type parse: callable
+    :param maxparses: the most checks of new strings to make repairing one piece of DAIDE
+    :type maxparses: int
+    :param cachesize: the most checked strings, and repairs, to remember
+    :type cachesize: int
+    """
+
+    self.parse = parse
+    self.maxparses = maxparses
+    self.checks = helpers.LRUCache(cachesize)
+    self.repairs = helpers.LRUCache(cachesize)
+    self.lock = threading.Lock()
+    self.stats = collections.Counter()
+
+  def check(self, daide, parses=None): # type: (str, collections.Counter) -> ()
+    """
+    Checks DAIDE against the grammar, remembering the result.
+
+    :param daide: the DAIDE
+    :type daide: str
+    :param parses: counts the strings actually parsed, rather than remembered
+    :type parses: collections.Counter
+
+    :return: None if it parses, otherwise the error message, the rule that did not match, where in the DAIDE it stopped matching and whether a whole message matched before that
+    :rtype: ()
+    """
+
+    result = self.checks.get(daide)
+    if result is not None:
+      return result[0]
+
+    from parsimonious.exceptions import ParseError, IncompleteParseError
+
+    started = time.perf_counter()
+    # only the DAIDE failing to parse is a result; a grammar that cannot be built is not remembered as one
+    try:
+      if self.parse is None:
+        helpers.getgrammar().parse(daide)
+      else:
+        self.parse(daide)
+      result = None
+    except (ParseError, IncompleteParseError) as e:
+      expr = getattr(e, 'expr', None)
+      result = (str(e), getattr(expr, 'name', None), getattr(e, 'pos', len(daide)), isinstance(e, IncompleteParseError))
+    with self.lock:
+      self.stats['parses'] += 1
+      self.stats['parseseconds'] += time.perf_counter() - started
+    if parses is not None:
+      parses['parses'] += 1
+    self.checks.put(daide, (result,))
+
+    return result
+
+  def repair(self, content): # type: (str) -> {}
+    """
+    Repairs DAIDE written by a model.
+
+    :param content: what the model wrote
+    :type content: str
+
+    :return: the best DAIDE found as daide, the grammar's error with it or None as error, the repairs made, the number of strings parsed as parses and the seconds taken
+    :rtype: {}
+    """
+
+    remembered = self.repairs.get(content)
+    if remembered is not None:
+      with self.lock:
+        self.stats['calls'] += 1
+        self.stats['remembered'] += 1
+      return dict(remembered, repairs=list(remembered['repairs']), parses=0, seconds=0.0)
+
+    started = time.perf_counter()
+    parses = collections.Counter()
+    tokens, repairs = tokenize(content)
+    daide, starts = render(tokens)
+    result = self.check(daide, parses)
+    reached = stoppedat(result, daide, tokens, starts)
+    while result is not None and parses['parses'] < self.maxparses:
+      best = None
+      for curname, curtokens in candidates(tokens, reached, result[1], result[3]):
+        if parses['parses'] >= self.maxparses:
+          break
+        curdaide, curstarts = render(curtokens)
+        curresult = self.check(curdaide, parses)
+        # how many tokens the grammar got through is the measure of an edit; dropping a token need only not lose ground
+        curreached = stoppedat(curresult, curdaide, curtokens, curstarts)
+        if (curreached > reached or (curreached == reached and curname == 'drop')) and (best is None or curreached > best[4]):
+          best = (curname, curtokens, curdaide, curstarts, curreached, curresult)
+        if curresult is None:
+          break
+      if best is None:
+        break
+      repairs.append(best[0])
+      tokens, daide, starts, reached, result = best[1], best[2], best[3], best[4], best[5]
+
+    retdict = {'daide': daide,
+               'error': result[0] if result is not None else None,
+               'repairs': repairs,
+               'parses': parses['parses'],
+               'seconds': time.perf_counter() - started}
+    self.repairs.put(content, {'daide': retdict['daide'], 'error': retdict['error'], 'repairs': list(repairs)})
+    with self.lock:
+      self.stats['calls'] += 1
+      self.stats['seconds'] += retdict['seconds']
+      self.stats['repaired' if result is None else 'unrepaired'] += 1
+      for currepair in repairs:
+        self.stats['repair ' + currepair] += 1
+
+    return retdict
+
+  def report(self): # type: () -> {}
+    """
+    Reports what the engine has done, for monitoring
+
+    :return: the counts of calls, repairs and checks, the seconds spent and the hit rates of the remembered checks and repairs
+    :rtype: {}
+    """
+
+    with self.lock:
+      retdict = dict(self.stats)
+    retdict['checkcache'] = self.checks.stats()
+    retdict['repaircache'] = self.repairs.stats()
+
+    return retdict
+
+engines = {}
+enginelock = threading.Lock()
+
+def getengine(): # type: () -> RepairEngine
+  """
+  Returns the repair engine that checks against the daidepp grammar, shared by the whole process.
+
+  :return: the engine
+  :rtype: RepairEngine
+  """
+
+  with enginelock:
+    if 'daidepp' not in engines:
+      engines['daidepp'] = RepairEngine()
+
+    return engines['daidepp']
@@ -0,0 +1,830 @@
+# -*- coding: utf-8 -*-
+""" Concurrent translation of English press into DAIDE by a language model behind an OpenAI-style API. """
+
+# Standard library imports
+import os
+import re
+import json
+import math
+import logging
+import random
+import hashlib
+import threading
+import asyncio
+import collections
+import concurrent.futures
+import socket
+import sqlite3
+import time
+import urllib.request
+import urllib.error
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+import pressgloss.repair as REPAIR
+from . import helpers
+
+# HTTP statuses worth trying again: rate limiting and server trouble
+retrystatuses = frozenset([408, 409, 429, 500, 502, 503, 504])
+
+this_dir, this_filename = os.path.split(__file__)
+fewshotPath = os.path.join(this_dir, 'resources', 'fewshot.json')
+fewshotpools = {}
+fewshotlock = threading.Lock()
+translationcaches = {}
+
+class TransportError(Exception):
+  """ A failed request to the model, which says whether it is worth trying again. """
+
+  def __init__(self, message, retryable=False, status=None, retryafter=None): # type: (str, bool, int, float) -> None
+    """
+    Initialize the error
+
+    :param message: what went wrong
+    :type message: str
+    :param retryable: whether the same request may succeed later
+    :type retryable: bool
+    :param status: the HTTP status, if there was one
+    :type status: int
+    :param retryafter: the seconds the server asked to wait before trying again, if it did
+    :type retryafter: float
+    """
+
+    super().__init__(message)
+    self.retryable = retryable
+    self.status = status
+    self.retryafter = retryafter
+
+class TranslationError(Exception):
+  """ A request to the model which failed for good. """
+
+class HTTPTransport:
+  """ Posts requests to an OpenAI-style HTTP API from a pool of threads, so blocking sockets do not stall the event loop. """
+
+  def __init__(self, baseurl=None, apikey=None, organization=None, connections=8): # type: (str, str, str, int) -> None
+    """
+    Initialize the transport
+
+    :param baseurl: the root of the API, by default $OPENAI_BASE_URL or the OpenAI API
+    :type baseurl: str
+    :param apikey: the API key, by default $OPENAI_API_KEY
+    :type apikey: str
+    :param organization: the organization to bill, by default $OPENAI_ORG
+    :type organization: str
+    :param connections: the most requests to have open at once
+    :type connections: int
+    """
+
+    if baseurl is None:
+      baseurl = os.getenv('OPENAI_BASE_URL', 'https://api.openai.com/v1')
+    self.baseurl = baseurl.rstrip('/')
+    self.apikey = apikey if apikey is not None else os.getenv('OPENAI_API_KEY')
+    self.organization = organization if organization is not None else os.getenv('OPENAI_ORG')
+    self.connections = connections
+    self.executor = None
+
+  def post(self, route, payload, timeout): # type: (str, {}, float) -> {}
+    """
+    Posts one request and waits for the response.
+
+    :param route: the API route, such as chat/completions
+    :type route: str
+    :param payload: the body of the request
+    :type payload: {}
+    :param timeout: the seconds to wait for the server
+    :type timeout: float
+
+    :return: the body of the response
+    :rtype: {}
+    """
+
+    headers = {'Content-Type': 'application/json'}
+    if self.apikey is not None:
+      headers['Authorization'] = 'Bearer ' + self.apikey
+    if self.organization is not None:
+      headers['OpenAI-Organization'] = self.organization
+    request = urllib.request.Request(self.baseurl + '/' + route, data=json.dumps(payload).encode('utf-8'), headers=headers, method='POST')
+    try:
+      with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+      retryafter = None
+      try:
+        retryafter = float(e.headers.get('Retry-After'))
+      except (TypeError, ValueError):
+        pass
+      raise TransportError('HTTP ' + str(e.code) + ' from ' + route, e.code in retrystatuses, e.code, retryafter) from e
+    except (urllib.error.URLError, socket.timeout, ConnectionError) as e:
+      raise TransportError('Could not reach ' + self.baseurl + ': ' + str(e), True) from e
+    except ValueError as e:
+      raise TransportError('Malformed response from ' + route + ': ' + str(e), True) from e
+
+  async def __call__(self, route, payload, timeout): # type: (str, {}, float) -> {}
+    """
+    Posts one request without blocking the event loop.
+
+    :param route: the API route, such as chat/completions
+    :type route: str
+    :param payload: the body of the request
+    :type payload: {}
+    :param timeout: the seconds to wait for the server
+    :type timeout: float
+
+    :return: the body of the response
+    :rtype: {}
+    """
+
+    if self.executor is None:
+      self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.connections)
+
+    return await asyncio.get_running_loop().run_in_executor(self.executor, self.post, route, payload, timeout)
+
+  def close(self): # type: () -> None
+    """ Lets go of the request threads. """
+
+    if self.executor is not None:
+      self.executor.shutdown(wait=False)
+      self.executor = None
+
+def repairdaide(content): # type: (str) -> ()
+  """
+  Repairs the DAIDE a model wrote and checks it against the grammar.
+
+  :param content: what the model wrote
+  :type content: str
+
+  :return: the cleaned DAIDE, and the parse error or None if it parses
+  :rtype: ()
+  """
+
+  result = REPAIR.getengine().repair(content)
+
+  return result['daide'], result['error']
+
+def validfewshot(example): # type: ({}) -> bool
+  """
+  Checks that a few-shot example is worth showing a model: its DAIDE parses and reads back the same, and it passes
+  the daidepp grammar if daidepp is installed.
+
+  :param example: the prompt and completion
+  :type example: {}
+
+  :return: whether the example is valid
+  :rtype: bool
+  """
+
+  utterance = PRESSGLOSS.PressUtterance(example['completion'], glossing=False)
+  if utterance.parseerror is not None or utterance.content is None:
+    return False
+  if helpers.normalizedaide(utterance.formDAIDE()) != helpers.normalizedaide(example['completion']):
+    return False
+  try:
+    helpers.getgrammar()
+  except ImportError:
+    return True
+  error, errortype = helpers.error_fetch(example['completion'])
+
+  return error == 'No Error'
+
+def writefewshotpool(outpath=fewshotPath, perfamily=24, seed=0): # type: (str, int, object) -> None
+  """
+  Generates and saves a pool of valid few-shot examples for each kind of press.
+
+  :param outpath: the location on disk to write the pool
+  :type outpath: str
+  :param perfamily: how many examples of each kind of press to keep
+  :type perfamily: int
+  :param seed: the seed of the examples
+  :type seed: object
+  """
+
+  families = collections.OrderedDict()
+  for curindex, curfamily in enumerate(PRESSGLOSS.randompress):
+    families[curfamily] = []
+    seen = set()
+    chunkid = curindex
+    while len(families[curfamily]) < perfamily:
+      for curexample in CORPUS.generatechunk(chunkid, perfamily * 2, seed, {curfamily: 1}):
+        if len(families[curfamily]) < perfamily and curexample['completion'] not in seen and validfewshot(curexample):
+          seen.add(curexample['completion'])
+          families[curfamily].append({'english': curexample['prompt'], 'daide': curexample['completion']})
+      chunkid += len(PRESSGLOSS.randompress)
+  with open(outpath + '.tmp', 'w', encoding='utf-8') as outfile:
+    json.dump({'seed': seed, 'families': families}, outfile, indent=2)
+  os.replace(outpath + '.tmp', outpath)
+
+def wordsof(english): # type: (str) -> set
+  """
+  Returns the distinct lowercase words of some English.
+
+  :param english: the English
+  :type english: str
+
+  :return: the words
+  :rtype: set
+  """
+
+  return set(re.findall("[a-z']+", english.lower()))
+
+class FewShotPool:
+  """
+  A fixed pool of few-shot examples for each kind of press.  The examples for a piece of English are those of the kind
+  of press whose examples share the most distinctive words with it, always in the same order, so every translation of
+  that kind starts with the same prompt and the model's prompt cache can be reused.
+  """
+
+  def __init__(self, families, version=''): # type: ({}, str) -> None
+    """
+    Initialize the pool and index its words
+
+    :param families: the examples of each kind of press, each with english and daide
+    :type families: {}
+    :param version: identifies the pool, for caches of what models made of it
+    :type version: str
+    """
+
+    self.version = version
+    self.families = list(families.keys())
+    self.messages = {}
+    self.selections = {}
+    examplewords = []
+    for curfamily, curexamples in families.items():
+      curmessages = []
+      for curexample in curexamples:
+        curmessages.extend([{'role': 'user', 'content': curexample['english']},
+                            {'role': 'assistant', 'content': curexample['daide']}])
+        examplewords.append((curfamily, wordsof(curexample['english'])))
+      self.messages[curfamily] = tuple(curmessages)
+
+    documentcounts = collections.Counter()
+    for curfamily, curwords in examplewords:
+      documentcounts.update(curwords)
+    weights = {curword: math.log(len(examplewords) / curcount) for curword, curcount in documentcounts.items()}
+    # each word lists what it adds to the cosine similarity of the examples it is in, so scoring is only additions
+    self.examplefamilies = [curfamily for curfamily, curwords in examplewords]
+    postings = collections.defaultdict(list)
+    for curindex, (curfamily, curwords) in enumerate(examplewords):
+      curnorm = math.sqrt(sum([weights[curword] ** 2 for curword in curwords])) or 1.0
+      for curword in curwords:
+        if weights[curword] > 0:
+          postings[curword].append((curindex, weights[curword] ** 2 / curnorm))
+    self.postings = {curword: tuple(curposting) for curword, curposting in postings.items()}
+    self.familycache = helpers.LRUCache(4096)
+
+  def family(self, english): # type: (str) -> str
+    """
+    Returns the kind of press of the example most like some English, by the cosine similarity of their distinctive words.
+
+    :param english: the English to translate
+    :type english: str
+
+    :return: the kind of press
+    :rtype: str
+    """
+
+    retfamily = self.familycache.get(english)
+    if retfamily is not None:
+      return retfamily
+
+    scores = [0.0] * len(self.examplefamilies)
+    for curword in wordsof(english):
+      for curindex, curscore in self.postings.get(curword, ()):
+        scores[curindex] += curscore
+    bestindex = max(range(len(scores)), key=scores.__getitem__)
+    retfamily = self.examplefamilies[bestindex] if scores[bestindex] > 0 else self.families[0]
+    self.familycache.put(english, retfamily)
+
+    return retfamily
+
+  def select(self, english, count=4): # type: (str, int) -> ()
+    """
+    Returns the few-shot chat for some English: turns of English from the user and DAIDE from the assistant.
+
+    :param english: the English to translate
+    :type english: str
+    :param count: how many examples to show
+    :type count: int
+
+    :return: the chat messages, which are shared and must not be changed
+    :rtype: ()
+    """
+
+    key = (self.family(english), count)
+    if key not in self.selections:
+      self.selections[key] = self.messages[key[0]][:count * 2]
+
+    return self.selections[key]
+
+def getfewshotpool(inpath=fewshotPath): # type: (str) -> FewShotPool
+  """
+  Returns the few-shot pool saved at a path, loading it the first time.
+
+  :param inpath: the location on disk of the pool
+  :type inpath: str
+
+  :return: the pool
+  :rtype: FewShotPool
+  """
+
+  with fewshotlock:
+    if inpath not in fewshotpools:
+      with open(inpath, 'rb') as infile:
+        contents = infile.read()
+      fewshotpools[inpath] = FewShotPool(json.loads(contents.decode('utf-8'))['families'], hashlib.blake2b(contents, digest_size=8).hexdigest())
+
+    return fewshotpools[inpath]
+
+def normalizeenglish(english): # type: (str) -> str
+  """
+  Puts English in the form translations are cached under: lowercase, with runs of whitespace made single spaces.
+
+  :param english: the English
+  :type english: str
+
+  :return: the normalized English
+  :rtype: str
+  """
+
+  return ' '.join(english.split()).lower()
+
+def promptversion(fewshot=None, chat=True): # type: ([], bool) -> str
+  """
+  Identifies the prompt a model is given apart from the English itself, so cached translations made with another
+  prompt are not used.
+
+  :param fewshot: example turns of English from the user and DAIDE from the assistant
+  :type fewshot: []
+  :param chat: whether the model is a chat model
+  :type chat: bool
+
+  :return: a digest of the system prompt and the examples
+  :rtype: str
+  """
+
+  prompt = [chat, helpers.simple_system if chat else '', list(fewshot) if fewshot is not None else []]
+
+  return hashlib.blake2b(json.dumps(prompt, sort_keys=True).encode('utf-8'), digest_size=16).hexdigest()
+
+def translationkey(english, tones, model, version): # type: (str, [], str, str) -> bytes
+  """
+  Returns the key a translation is cached under.
+
+  :param english: the English translated
+  :type english: str
+  :param tones: the tones of the English
+  :type tones: []
+  :param model: the model that translated it
+  :type model: str
+  :param version: the promptversion of the prompt the model was given
+  :type version: str
+
+  :return: the key
+  :rtype: bytes
+  """
+
+  keyparts = [normalizeenglish(english), sorted(tones) if tones is not None else [], model, version]
+
+  return hashlib.blake2b(json.dumps(keyparts).encode('utf-8'), digest_size=16).digest()
+
+class TranslationCache:
+  """
+  Translations already made by models, kept in SQLite so they outlive the process.  Entries expire after a time to
+  live, and when there are too many the least recently used are evicted.
+  """
+
+  def __init__(self, path=None, ttl=30 * 86400, maxentries=100000): # type: (str, float, int) -> None
+    """
+    Initialize the cache, creating its database if needed
+
+    :param path: the location on disk of the database, by default translations.sqlite in the cache folder; :memory: keeps it in memory
+    :type path: str
+    :param ttl: the seconds a translation is kept, None to keep them until evicted
+    :type ttl: float
+    :param maxentries: the most translations to keep
+    :type maxentries: int
+    """
+
+    if path is None:
+      path = os.path.join(helpers.getcachefolder(), 'translations.sqlite')
+    if path != ':memory:':
+      os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    self.path = path
+    self.ttl = ttl
+    self.maxentries = maxentries
+    self.lock = threading.Lock()
+    self.connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    if path != ':memory:':
+      self.connection.execute('PRAGMA journal_mode=WAL')
+      self.connection.execute('PRAGMA synchronous=NORMAL')
+    self.connection.execute('CREATE TABLE IF NOT EXISTS translations (key BLOB PRIMARY KEY, daide TEXT NOT NULL, created REAL NOT NULL, used REAL NOT NULL)')
+    self.connection.execute('CREATE INDEX IF NOT EXISTS translationsused ON translations (used)')
+    self.size = self.connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+    self.hits = 0
+    self.misses = 0
+    self.expirations = 0
+    self.evictions = 0
+
+  def get(self, key): # type: (bytes) -> str
+    """
+    Looks up a translation, marking it as recently used
+
+    :param key: the translationkey
+    :type key: bytes
+
+    :return: the DAIDE, or None if it is not cached or has expired
+    :rtype: str
+    """
+
+    now = time.time()
+    with self.lock:
+      row = self.connection.execute('SELECT daide, created FROM translations WHERE key = ?', (key,)).fetchone()
+      if row is not None and self.ttl is not None and row[1] < now - self.ttl:
+        self.connection.execute('DELETE FROM translations WHERE key = ?', (key,))
+        self.size -= 1
+        self.expirations += 1
+        row = None
+      if row is None:
+        self.misses += 1
+        return None
+      self.connection.execute('UPDATE translations SET used = ? WHERE key = ?', (now, key))
+      self.hits += 1
+
+    return row[0]
+
+  def put(self, key, daide): # type: (bytes, str) -> None
+    """
+    Caches a translation, evicting the least recently used tenth of the cache if it is full
+
+    :param key: the translationkey
+    :type key: bytes
+    :param daide: the DAIDE
+    :type daide: str
+    """
+
+    if self.maxentries <= 0:
+      return
+
+    now = time.time()
+    with self.lock:
+      # only a new key adds to the size; another translator sharing the cache may have put this one already
+      if self.connection.execute('INSERT INTO translations (key, daide, created, used) VALUES (?, ?, ?, ?) ON CONFLICT (key) DO NOTHING', (key, daide, now, now)).rowcount > 0:
+        self.size += 1
+      else:
+        self.connection.execute('UPDATE translations SET daide = ?, created = ?, used = ? WHERE key = ?', (daide, now, now, key))
+      if self.size > self.maxentries:
+        if self.ttl is not None:
+          self.expirations += self.connection.execute('DELETE FROM translations WHERE created < ?', (now - self.ttl,)).rowcount
+        self.size = self.connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        if self.size > self.maxentries:
+          excess = self.size - self.maxentries * 9 // 10
+          self.evictions += self.connection.execute('DELETE FROM translations WHERE key IN (SELECT key FROM translations ORDER BY used LIMIT ?)', (excess,)).rowcount
+          self.size = self.connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+
+  def clear(self): # type: () -> None
+    """
+    Empties the cache and resets its counters
+    """
+
+    with self.lock:
+      self.connection.execute('DELETE FROM translations')
+      self.size = 0
+      self.hits = 0
+      self.misses = 0
+      self.expirations = 0
+      self.evictions = 0
+
+  def stats(self): # type: () -> {}
+    """
+    Reports cache usage for monitoring
+
+    :return: the hits, misses, hit rate, expirations, evictions, current size and maximum size of the cache
+    :rtype: {}
+    """
+
+    with self.lock:
+      return {'hits': self.hits,
+              'misses': self.misses,
+              'hitrate': self.hits / (self.hits + self.misses) if self.hits + self.misses > 0 else 0.0,
+              'expirations': self.expirations,
+              'evictions': self.evictions,
+              'size': self.size,
+              'maxsize': self.maxentries}
+
+  def close(self): # type: () -> None
+    """ Closes the database. """
+
+    with self.lock:
+      self.connection.close()
+
+def gettranslationcache(path=None): # type: (str) -> TranslationCache
+  """
+  Returns the translation cache kept at a path, opening it the first time.
+
+  :param path: the location on disk of the database, by default translations.sqlite in the cache folder
+  :type path: str
+
+  :return: the cache, or None if it cannot be opened
+  :rtype: TranslationCache
+  """
+
+  with fewshotlock:
+    if path not in translationcaches:
+      try:
+        translationcaches[path] = TranslationCache(path)
+      except (OSError, sqlite3.Error):
+        translationcaches[path] = None
+
+    return translationcaches[path]
+
+class AsyncTranslator:
+  """
+  Translates English press into DAIDE with a language model, many requests at a time.  A semaphore bounds the
+  requests in flight, each request has a timeout, and failures the server may recover from are tried again after
+  an exponential backoff with full jitter.  The transport is any coroutine function taking the API route, the
+  request body and the timeout, and returning the response body, so a local stub can stand in for the API.
+  """
+
+  def __init__(self, model='gpt-3.5-turbo', transport=None, concurrency=8, timeout=30.0, retries=4, backoff=0.5, maxbackoff=30.0, chat=True, repair=repairdaide, seed=None, pool=None, cache=None): # type: (str, callable, int, float, int, float, float, bool, callable, object, FewShotPool, TranslationCache) -> None
+    """
+    Initialize the translator
+
+    :param model: the model to ask
+    :type model: str
+    :param transport: sends a request to the model, by default an HTTPTransport with a connection for each request in flight
+    :type transport: callable
+    :param concurrency: the most requests to have in flight at once
+    :type concurrency: int
+    :param timeout: the seconds to wait for each attempt at a request
+    :type timeout: float
+    :param retries: how many times to try a request again before giving up
+    :type retries: int
+    :param backoff: the seconds of the longest wait before the first retry, doubling for each retry after
+    :type backoff: float
+    :param maxbackoff: the longest wait in seconds before any retry
+    :type maxbackoff: float
+    :param chat: whether the model is a chat model, rather than a fine-tuned completion model
+    :type chat: bool
+    :param repair: cleans up what the model wrote, returning the DAIDE and the parse error or None
+    :type repair: callable
+    :param seed: seeds the jitter
+    :type seed: object
+    :param pool: where to find few-shot examples for chat models when none are given
+    :type pool: FewShotPool
+    :param cache: where to look for translations before asking the model, and to keep the ones it makes
+    :type cache: TranslationCache
+    """
+
+    self.model = model
+    if transport is None:
+      transport = HTTPTransport(connections=concurrency)
+    self.transport = transport
+    self.concurrency = concurrency
+    self.timeout = timeout
+    self.retries = retries
+    self.backoff = backoff
+    self.maxbackoff = maxbackoff
+    self.chat = chat
+    self.repair = repair
+    self.rng = random.Random(seed)
+    self.pool = pool
+    self.cache = cache
+    self.inflight = {}
+    self.semaphore = None
+    self.semaphoreloop = None
+    self.stats = collections.Counter()
+
+  def getsemaphore(self): # type: () -> asyncio.Semaphore
+    """
+    Returns the semaphore bounding requests in flight on the running event loop.
+
+    :return: the semaphore
+    :rtype: asyncio.Semaphore
+    """
+
+    curloop = asyncio.get_running_loop()
+    if self.semaphore is None or self.semaphoreloop is not curloop:
+      self.semaphore = asyncio.Semaphore(self.concurrency)
+      self.semaphoreloop = curloop
+
+    return self.semaphore
+
+  async def request(self, route, payload): # type: (str, {}) -> {}
+    """
+    Sends a request to the model, trying again with backoff when that may help.
+
+    :param route: the API route, such as chat/completions
+    :type route: str
+    :param payload: the body of the request
+    :type payload: {}
+
+    :return: the body of the response
+    :rtype: {}
+    """
+
+    attempt = 0
+    while True:
+      async with self.getsemaphore():
+        self.stats['requests'] += 1
+        try:
+          return await asyncio.wait_for(self.transport(route, payload, self.timeout), self.timeout)
+        except asyncio.TimeoutError:
+          lasterror = TransportError('No response from ' + route + ' in ' + str(self.timeout) + ' seconds', True)
+          self.stats['timeouts'] += 1
+        except TransportError as e:
+          lasterror = e
+      if not lasterror.retryable or attempt >= self.retries:
+        self.stats['failures'] += 1
+        raise TranslationError(str(lasterror)) from lasterror
+      # full jitter, but never sooner than the server asked
+      delay = self.rng.uniform(0, min(self.maxbackoff, self.backoff * 2 ** attempt))
+      if lasterror.retryafter is not None:
+        delay = max(delay, min(self.maxbackoff, lasterror.retryafter))
+      attempt += 1
+      self.stats['retries'] += 1
+      await asyncio.sleep(delay)
+
+  def chatmessages(self, english, fewshot=None): # type: (str, []) -> []
+    """
+    Forms the chat to ask the model for a translation.
+
+    :param english: the English to translate
+    :type english: str
+    :param fewshot: example turns of English from the user and DAIDE from the assistant, by default from the pool
+    :type fewshot: []
+
+    :return: the chat messages
+    :rtype: []
+    """
+
+    retlist = [{'role': 'system', 'content': helpers.simple_system}]
+    if fewshot is None and self.pool is not None:
+      fewshot = self.pool.select(english)
+    if fewshot is not None:
+      retlist.extend(fewshot)
+    retlist.append({'role': 'user', 'content': english})
+
+    return retlist
+
+  async def complete(self, messages): # type: ([]) -> str
+    """
+    Asks the model to continue a chat.
+
+    :param messages: the chat so far
+    :type messages: []
+
+    :return: what the model wrote
+    :rtype: str
+    """
+
+    response = await self.request('chat/completions', {'model': self.model, 'messages': messages, 'temperature': 0})
+
+    return response['choices'][0]['message']['content']
+
+  async def translate(self, english, fewshot=None, tones=None): # type: (str, [], []) -> str
+    """
+    Translates English into DAIDE, from the cache if the same English was translated by the same model with the same
+    prompt before.
+
+    :param english: the English to translate
+    :type english: str
+    :param fewshot: example turns of English from the user and DAIDE from the assistant, for chat models
+    :type fewshot: []
+    :param tones: the tones of the English
+    :type tones: []
+
+    :return: the DAIDE, or HUH? if the model could not be reached or did not write valid DAIDE
+    :rtype: str
+    """
+
+    return (await self.translateresult(english, fewshot, tones))[0]
+
+  async def translateresult(self, english, fewshot=None, tones=None): # type: (str, [], []) -> (str, bool)
+    """
+    Translates English into DAIDE as translate does, also telling whether this translation came from the cache.
+
+    :param english: the English to translate
+    :type english: str
+    :param fewshot: example turns of English from the user and DAIDE from the assistant, for chat models
+    :type fewshot: []
+    :param tones: the tones of the English
+    :type tones: []
+
+    :return: the DAIDE, or HUH?, and whether it was found in the cache rather than asked of the model
+    :rtype: (str, bool)
+    """
+
+    if self.chat and fewshot is None and self.pool is not None:
+      fewshot = self.pool.select(english)
+    if self.cache is None:
+      return await self.translateuncached(english, fewshot), False
+
+    key = translationkey(english, tones, self.model, promptversion(fewshot if self.chat else None, self.chat))
+    daide = self.cache.get(key)
+    if daide is not None:
+      self.stats['cached'] += 1
+      return daide, True
+    # the same translation already on its way from the model is waited for rather than asked for again
+    if key in self.inflight:
+      self.stats['coalesced'] += 1
+      return await asyncio.shield(self.inflight[key]), False
+    self.inflight[key] = asyncio.ensure_future(self.translateuncached(english, fewshot))
+    try:
+      daide = await asyncio.shield(self.inflight[key])
+    finally:
+      del self.inflight[key]
+    if daide != 'HUH?':
+      self.cache.put(key, daide)
+
+    return daide, False
+
+  async def translateuncached(self, english, fewshot=None): # type: (str, []) -> str
+    """
+    Asks the model to translate English into DAIDE.  A chat model whose first answer does not parse is told the error
+    and asked once more.
+
+    :param english: the English to translate
+    :type english: str
+    :param fewshot: example turns of English from the user and DAIDE from the assistant, for chat models
+    :type fewshot: []
+
+    :return: the DAIDE, or HUH? if the model could not be reached or did not write valid DAIDE
+    :rtype: str
+    """
+
+    try:
+      if self.chat:
+        messages = self.chatmessages(english, fewshot)
+        content = await self.complete(messages)
+        daide, error = self.repair(content)
+        if error is not None:
+          messages.extend([{'role': 'assistant', 'content': content},
+                           {'role': 'user', 'content': "That's not correct DAIDE, " + error + ', try again'}])
+          content = await self.complete(messages)
+          daide, error = self.repair(re.sub('(.*)\\n\\n', '', content))
+      else:
+        response = await self.request('completions', {'model': self.model, 'prompt': english, 'max_tokens': 100})
+        daide, error = self.repair(response['choices'][0]['text'])
+    except TranslationError as e:
+      # request has already counted the failure
+      logging.debug('Translation failed due to ' + str(e))
+      return 'HUH?'
+    except (KeyError, IndexError, TypeError) as e:
+      self.stats['malformed'] += 1
+      logging.debug('Translation failed due to a malformed response: ' + repr(e))
+      return 'HUH?'
+
+    if error is not None:
+      self.stats['unparsed'] += 1
+      return 'HUH?'
+
+    return daide
+
+  async def translatemany(self, englishes, fewshots=None, tones=None): # type: ([], [], []) -> []
+    """
+    Translates many pieces of English at once, as many in flight as the concurrency allows.
+
+    :param englishes: the English to translate
+    :type englishes: []
+    :param fewshots: the few-shot examples for each piece of English, or None
+    :type fewshots: []
+    :param tones: the tones of the English
+    :type tones: []
+
+    :return: the DAIDE for each piece of English, in order
+    :rtype: []
+    """
+
+    if fewshots is None:
+      fewshots = [None] * len(englishes)
+
+    return await asyncio.gather(*[self.translate(curenglish, curfewshot, tones) for curenglish, curfewshot in zip(englishes, fewshots)])
+
+  def close(self): # type: () -> None
+    """ Lets go of whatever the transport holds open. """
+
+    if hasattr(self.transport, 'close'):
+      self.transport.close()
+
+def translate(english, model='gpt-3.5-turbo', fewshot=None, tones=None, **kwargs): # type: (str, str, [], [], ...) -> str
+  """
+  Translates one piece of English into DAIDE, from code which is not already running an event loop.
+
+  :param english: the English to translate
+  :type english: str
+  :param model: the model to ask
+  :type model: str
+  :param fewshot: example turns of English from the user and DAIDE from the assistant
+  :type fewshot: []
+  :param tones: the tones of the English
+  :type tones: []
+
+  :return: the DAIDE, or HUH?
+  :rtype: str
+  """
+
+  translator = AsyncTranslator(model, **kwargs)
+  try:
+    return asyncio.run(translator.translate(english, fewshot, tones))
+  finally:
+    translator.close()
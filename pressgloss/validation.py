@@ -0,0 +1,376 @@
+# -*- coding: utf-8 -*-
+""" Validation of translation models against generated DAIDE, streaming each result to disk as it arrives. """
+
+# Standard library imports
+import os
+import json
+import math
+import time
+import random
+import asyncio
+import importlib.util
+
+# pressgloss imports
+import pressgloss.core as PRESSGLOSS
+import pressgloss.corpus as CORPUS
+import pressgloss.translator as TRANSLATOR
+from . import helpers
+
+class LatencyHistogram:
+  """ Latencies counted in buckets 5% wide, so percentiles can be read off at any time in constant memory. """
+
+  def __init__(self, smallest=0.0001, growth=1.05): # type: (float, float) -> None
+    """
+    Initialize an empty histogram
+
+    :param smallest: the upper bound in seconds of the first bucket
+    :type smallest: float
+    :param growth: how much wider each bucket is than the one before
+    :type growth: float
+    """
+
+    self.smallest = smallest
+    self.growth = growth
+    self.buckets = []
+    self.count = 0
+    self.total = 0.0
+    self.largest = 0.0
+
+  def add(self, seconds): # type: (float) -> None
+    """
+    Counts a latency
+
+    :param seconds: the latency
+    :type seconds: float
+    """
+
+    bucket = 0
+    if seconds > self.smallest:
+      bucket = int(math.ceil(math.log(seconds / self.smallest) / math.log(self.growth)))
+    if bucket >= len(self.buckets):
+      self.buckets.extend([0] * (bucket + 1 - len(self.buckets)))
+    self.buckets[bucket] += 1
+    self.count += 1
+    self.total += seconds
+    self.largest = max(self.largest, seconds)
+
+  def percentile(self, percent): # type: (float) -> float
+    """
+    Returns a percentile of the latencies, as the upper bound of the bucket it falls in.
+
+    :param percent: the percentile, between 0 and 100
+    :type percent: float
+
+    :return: the latency in seconds, or None if there are none
+    :rtype: float
+    """
+
+    if self.count == 0:
+      return None
+    rank = max(1, int(math.ceil(self.count * percent / 100.0)))
+    seen = 0
+    for curbucket, curcount in enumerate(self.buckets):
+      seen += curcount
+      if seen >= rank:
+        return min(self.smallest * self.growth ** curbucket, self.largest)
+
+    return self.largest
+
+class ValidationMetrics:
+  """ Accuracy, parse rate and latency of a validation run, updated an example at a time. """
+
+  def __init__(self): # type: () -> None
+    """ Initialize metrics with no examples. """
+
+    self.examples = 0
+    self.matches = 0
+    self.parsed = 0
+    self.cached = 0
+    self.latencies = LatencyHistogram()
+    self.started = time.perf_counter()
+
+  def add(self, result): # type: ({}) -> None
+    """
+    Counts the result of one example
+
+    :param result: the example's result, as written to the results file
+    :type result: {}
+    """
+
+    self.examples += 1
+    self.matches += 1 if result['match'] else 0
+    self.parsed += 1 if result['parsed'] else 0
+    if result['cached']:
+      self.cached += 1
+    else:
+      self.latencies.add(result['seconds'])
+
+  def summary(self): # type: () -> {}
+    """
+    Reports the metrics so far
+
+    :return: the examples, accuracy and parse rate as percentages, latency percentiles in seconds of the examples the model was asked about, and examples per second
+    :rtype: {}
+    """
+
+    elapsed = time.perf_counter() - self.started
+
+    return {'examples': self.examples,
+            'accuracy': 100.0 * self.matches / self.examples if self.examples > 0 else 0.0,
+            'parserate': 100.0 * self.parsed / self.examples if self.examples > 0 else 0.0,
+            'cached': self.cached,
+            'latency': {'mean': self.latencies.total / self.latencies.count if self.latencies.count > 0 else None,
+                        'p50': self.latencies.percentile(50),
+                        'p90': self.latencies.percentile(90),
+                        'p99': self.latencies.percentile(99),
+                        'max': self.latencies.largest if self.latencies.count > 0 else None},
+            'seconds': elapsed,
+            'rate': self.examples / elapsed if elapsed > 0 else 0.0}
+
+class MockModel:
+  """
+  A transport that stands in for a model, to run validation offline.  It knows the right DAIDE for the English it
+  will be asked about, answers correctly with a given probability and otherwise with other DAIDE or garbage, after a
+  random delay.
+  """
+
+  def __init__(self, answers, accuracy=0.8, latency=0.2, seed=0): # type: ({}, float, float, object) -> None
+    """
+    Initialize the mock
+
+    :param answers: the right DAIDE for each piece of English
+    :type answers: {}
+    :param accuracy: the chance of answering correctly
+    :type accuracy: float
+    :param latency: the mean delay in seconds before answering, drawn from an exponential distribution
+    :type latency: float
+    :param seed: seeds the answers and delays
+    :type seed: object
+    """
+
+    self.answers = answers
+    self.wrong = list(answers.values())
+    self.accuracy = accuracy
+    self.latency = latency
+    self.rng = random.Random(seed)
+
+  async def __call__(self, route, payload, timeout): # type: (str, {}, float) -> {}
+    """
+    Answers a request as a model would.
+
+    :param route: the API route, chat/completions or completions
+    :type route: str
+    :param payload: the body of the request
+    :type payload: {}
+    :param timeout: the seconds to wait for the answer
+    :type timeout: float
+
+    :return: the body of the response
+    :rtype: {}
+    """
+
+    english = payload['messages'][-1]['content'] if route == 'chat/completions' else payload['prompt']
+    right = self.answers.get(english, 'I do not know.')
+    draw = self.rng.random()
+    if draw < self.accuracy:
+      content = right
+    elif draw < (1 + self.accuracy) / 2 and len(self.wrong) > 1:
+      wrongindex = self.rng.randrange(len(self.wrong))
+      content = self.wrong[wrongindex] if self.wrong[wrongindex] != right else self.wrong[wrongindex - 1]
+    else:
+      content = 'I am not sure how to say that in DAIDE.'
+    if self.latency > 0:
+      await asyncio.sleep(self.rng.expovariate(1.0 / self.latency))
+    if route == 'chat/completions':
+      return {'choices': [{'message': {'role': 'assistant', 'content': content}}]}
+
+    return {'choices': [{'text': content}]}
+
+def pressglossrepair(content): # type: (str) -> ()
+  """
+  Checks model output with the pressgloss parser rather than the daidepp grammar, for running without daidepp.
+
+  :param content: what the model wrote
+  :type content: str
+
+  :return: the DAIDE, and the parse error or None if it parses
+  :rtype: ()
+  """
+
+  try:
+    utterance = PRESSGLOSS.PressUtterance(helpers.normalizedaide(content), glossing=False)
+  except Exception as e:
+    return content, str(e)
+  if utterance.parseerror is not None:
+    return content, str(utterance.parseerror)
+  if utterance.content is None:
+    return content, 'Not a press utterance'
+
+  return helpers.normalizedaide(content), None
+
+def mockmodel(count, seed=0, tones=None, accuracy=0.8, latency=0.2): # type: (int, object, [], float, float) -> MockModel
+  """
+  Makes a mock model that knows the answers to the examples a validation run with the same count, seed and tones asks about.
+
+  :param count: how many examples the run validates on
+  :type count: int
+  :param seed: the seed of the examples
+  :type seed: object
+  :param tones: the tones of the examples
+  :type tones: []
+  :param accuracy: the chance of answering correctly
+  :type accuracy: float
+  :param latency: the mean delay in seconds before answering
+  :type latency: float
+
+  :return: the mock model
+  :rtype: MockModel
+  """
+
+  answers = {curexample['prompt']: curexample['completion'] for curexample in CORPUS.iteratecorpus(count, seed, tones=tones)}
+
+  return MockModel(answers, accuracy, latency, seed)
+
+def readresults(inpath, run): # type: (str, {}) -> ()
+  """
+  Reads the results an earlier validation run streamed to disk, so it can be resumed.  A last line cut off when the run
+  was interrupted is ignored and removed from the file.
+
+  :param inpath: the location on disk of the results
+  :type inpath: str
+  :param run: the settings of the run being resumed, which must be those the results were made with
+  :type run: {}
+
+  :return: the results of each example done, by index
+  :rtype: ()
+  """
+
+  retdict = {}
+  if not os.path.isfile(inpath):
+    return retdict
+
+  complete = 0
+  with open(inpath, 'r', encoding='utf-8') as infile:
+    for curline in infile:
+      if not curline.endswith('\n'):
+        break
+      try:
+        currecord = json.loads(curline)
+      except ValueError:
+        break
+      if 'run' in currecord:
+        if currecord['run'] != run:
+          raise ValueError(inpath + ' holds results of a different validation run: ' + json.dumps(currecord['run']))
+      else:
+        retdict[currecord['index']] = currecord
+      complete += len(curline.encode('utf-8'))
+  with open(inpath, 'r+b') as infile:
+    infile.truncate(complete)
+
+  return retdict
+
+async def validateasync(translator, examples, results, outfile, metrics, tones=None, progress=None, progressevery=100): # type: (TRANSLATOR.AsyncTranslator, iter, {}, io.TextIOBase, ValidationMetrics, [], callable, int) -> None
+  """
+  Translates examples with as many in flight as the translator allows, writing each result as it arrives.
+
+  :param translator: the translator
+  :type translator: TRANSLATOR.AsyncTranslator
+  :param examples: the index, English and DAIDE of each example
+  :type examples: iter
+  :param results: the results of examples already done, which are skipped
+  :type results: {}
+  :param outfile: where to write the results
+  :type outfile: io.TextIOBase
+  :param metrics: the metrics to update
+  :type metrics: ValidationMetrics
+  :param tones: the tones the examples were asked for with, which the cache keys on
+  :type tones: []
+  :param progress: called with the summary of the metrics every progressevery examples
+  :type progress: callable
+  :param progressevery: how often to report progress
+  :type progressevery: int
+  """
+
+  pending = iter(examples)
+
+  async def worker():
+    for curindex, curenglish, curdaide in pending:
+      if curindex in results:
+        continue
+      started = time.perf_counter()
+      translation, cached = await translator.translateresult(curenglish, tones=tones)
+      seconds = time.perf_counter() - started
+      currecord = {'index': curindex,
+                   'english': curenglish,
+                   'expected': curdaide,
+                   'translation': translation,
+                   'match': helpers.normalizedaide(translation) == helpers.normalizedaide(curdaide),
+                   'parsed': translation != 'HUH?',
+                   'cached': cached,
+                   'seconds': round(seconds, 6)}
+      outfile.write(json.dumps(currecord) + '\n')
+      metrics.add(currecord)
+      if progress is not None and metrics.examples % progressevery == 0:
+        progress(metrics.summary())
+
+  await asyncio.gather(*[worker() for curworker in range(translator.concurrency)])
+
+def validate(outpath, count=100, model='gpt-3.5-turbo', seed=0, tones=None, concurrency=16, transport=None, cache=None, repair=None, progress=None, progressevery=100, chat=True): # type: (str, int, str, object, [], int, callable, TRANSLATOR.TranslationCache, callable, callable, int, bool) -> {}
+  """
+  Validates a model on generated examples, streaming each example's result to a JSONL file as it arrives.  The
+  examples depend only on the seed, so a run that was interrupted picks up where it stopped when run again with the
+  same file and settings.
+
+  :param outpath: the location on disk of the results, whose first line records the settings of the run, or None to keep only the metrics
+  :type outpath: str
+  :param count: how many examples to validate on
+  :type count: int
+  :param model: the model to validate
+  :type model: str
+  :param seed: the seed of the examples
+  :type seed: object
+  :param tones: the tones of the examples, by default between one and three random tones for each
+  :type tones: []
+  :param concurrency: the most requests to have in flight at once
+  :type concurrency: int
+  :param transport: sends requests to the model, by default the OpenAI-style HTTP API
+  :type transport: callable
+  :param cache: where to look for translations before asking the model
+  :type cache: TRANSLATOR.TranslationCache
+  :param repair: cleans up what the model wrote, returning the DAIDE and the parse error or None, by default against the daidepp grammar if it is installed and the pressgloss parser if not
+  :type repair: callable
+  :param progress: called with the summary of the metrics every progressevery examples
+  :type progress: callable
+  :param progressevery: how often to report progress
+  :type progressevery: int
+  :param chat: whether the model is a chat model, rather than a fine-tuned completion model
+  :type chat: bool
+
+  :return: the summary of the metrics over every example, including those from before a resume, how many examples were resumed and the examples per second translated in this run
+  :rtype: {}
+  """
+
+  if repair is None:
+    repair = TRANSLATOR.repairdaide if importlib.util.find_spec('daidepp') is not None else pressglossrepair
+  run = {'model': model, 'count': count, 'seed': seed, 'tones': tones, 'chat': chat}
+  results = readresults(outpath, run) if outpath is not None else {}
+  metrics = ValidationMetrics()
+  for currecord in results.values():
+    metrics.add(currecord)
+  examples = ((curindex, curexample['prompt'], curexample['completion'])
+              for curindex, curexample in enumerate(CORPUS.iteratecorpus(count, seed, tones=tones)))
+  translator = TRANSLATOR.AsyncTranslator(model, transport=transport, concurrency=concurrency, chat=chat, repair=repair,
+                                          pool=TRANSLATOR.getfewshotpool() if chat else None, cache=cache)
+  try:
+    with open(outpath if outpath is not None else os.devnull, 'a', encoding='utf-8', buffering=1) as outfile:
+      if outpath is not None and outfile.tell() == 0:
+        outfile.write(json.dumps({'run': run}) + '\n')
+      asyncio.run(validateasync(translator, examples, results, outfile, metrics, tones, progress, progressevery))
+  finally:
+    translator.close()
+
+  retdict = metrics.summary()
+  retdict['resumed'] = len(results)
+  retdict['rate'] = (retdict['examples'] - retdict['resumed']) / retdict['seconds'] if retdict['seconds'] > 0 else 0.0
+
+  return retdict
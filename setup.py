@@ -26,7 +26,7 @@ setuptools.setup(
   ],
   keywords='analytics',
   packages=setuptools.find_packages(),
-  package_data={'':['resources/*.csv']},
+  package_data={'':['resources/*.csv', 'resources/*.pickle', 'resources/*.json']},
   include_package_data=True,
   python_requires='>=3.7',
   entry_points = {'console_scripts': ['pressgloss=pressgloss.__main__:main']}
@@ -5,11 +5,24 @@
 import unittest
 import os
 import json
+import io
+import csv
+import shutil
+import tempfile
+import subprocess
+import importlib.util
+import importlib.metadata
+import sys
+import asyncio
+import threading
+import http.server
 
 # pressgloss imports
 import pressgloss.core as PRESSGLOSS
 import pressgloss.helpers as helpers
 import pressgloss.gamelog as GAMELOG
+import pressgloss.translator as TRANSLATOR
+import pressgloss.repair as REPAIR
 
 shorthandtests = {'F NWG C A NWY - EDI': 'XDO ((ENG FLT NWG) CVY (FRA AMY NWY) CTO EDI)',
                   'A IRO R MAO': 'XDO ((ENG AMY IRO) RTO MAO)',
@@ -485,6 +498,199 @@ class ChannelTest(unittest.TestCase):
     channelutterance = PRESSGLOSS.PressUtterance(channeltest, [])
     self.assertEqual(channelutterance.formDAIDE(), channelanswer)
 
+class LazyGlossTest(unittest.TestCase):
+  """ Tests that English is only formed when asked for. """
+  def test(self):
+    structureonly = PRESSGLOSS.PressUtterance(channeltest, ['Objective'], glossing=False)
+    self.assertIsNone(structureonly.english)
+    self.assertEqual(structureonly.formDAIDE(), channelanswer)
+    structureonly.formenglish()
+    self.assertTrue('Ahem' not in structureonly.english)
+    lazy = PRESSGLOSS.PressUtterance(channeltest, ['Objective'])
+    self.assertTrue('Ahem' not in lazy.english)
+
+class PressQuery(PRESSGLOSS.PressMessage):
+  """ A stand-in for an operator registered from outside core. """
+  def __init__(self, utterance, container, thelists):
+    super().__init__(utterance, container)
+    self.operator = 'QRY'
+    if thelists is not None:
+      self.details = PRESSGLOSS.messageFactory(utterance, self, thelists[1])
+
+class CompactTreeTest(unittest.TestCase):
+  """ Tests that message trees have no per-node dictionaries and let go of the English they form unless asked to keep it. """
+  def test(self):
+    curdaide = 'FRM (ENG) (FRA ITA) (PRP (AND (PCE (FRA ITA)) (XDO ((ENG AMY LVP) RTO YOR))))'
+    utterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=1)
+    self.assertFalse(hasattr(utterance, '__dict__'))
+    nodes = [utterance.content]
+    while len(nodes) > 0:
+      curnode = nodes.pop()
+      self.assertFalse(hasattr(curnode, '__dict__'))
+      nodes.extend(curnode.children())
+    self.assertEqual([type(curchild) for curchild in utterance.content.details.children()], [PRESSGLOSS.PressPeace, PRESSGLOSS.PressMoveExecute])
+    self.assertTrue('Ahem' not in utterance.english)
+    self.assertEqual(utterance.content.english, 'Ahem.')
+    self.assertIsNone(utterance.content.details.conjuncts[0].simpleenglish)
+    retained = PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=1, retaintext=True)
+    self.assertEqual(retained.english, utterance.english)
+    self.assertEqual(retained.content.english, utterance.english)
+    self.assertIsNotNone(retained.content.details.conjuncts[0].simpleenglish)
+    utterance.formenglish()
+    self.assertEqual(utterance.english, retained.english)
+
+class AcyclicTreeTest(unittest.TestCase):
+  """ Tests that a glossed utterance and its messages are freed as soon as the utterance is dropped, without the cyclic garbage collector. """
+  def test(self):
+    import gc
+    import weakref
+    utterance = PRESSGLOSS.PressUtterance('FRM (FRA) (ENG) (REJ (IFF (XDO ((ENG AMY LVP) MTO YOR)) (PRP (XDO ((ENG FLT NTH) CVY (FRA AMY BRE) CTO LON)))))', ['Haughty'])
+    self.assertTrue('Ahem' not in utterance.english)
+    self.assertEqual(utterance.content.details.antecedent.container.operator, 'IFF')
+    self.assertEqual(utterance.content.details.antecedent.container.container.operator, 'REJ')
+    self.assertIsNone(utterance.content.container)
+    self.assertIs(utterance.content.details.antecedent.utterance, utterance)
+    other = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (REJ (IFF (PCE (ENG FRA)) (PRP (DRW))))')
+    self.assertIs(other.content.details.antecedent.container, utterance.content.details.antecedent.container)
+    gc.collect()
+    gc.disable()
+    try:
+      for curdaide in [utterance.daide, other.daide, 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)']:
+        curutterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective'])
+        curutterance.formenglish()
+        content = curutterance.content
+        ref = weakref.ref(curutterance)
+        del curutterance
+        self.assertIsNone(ref())
+        self.assertTrue(content is None or content.utterance is None)
+        del content
+      self.assertEqual(gc.collect(), 0)
+    finally:
+      gc.enable()
+    self.assertIsNone(PRESSGLOSS.messageFactory(None, None, ['PCE', ['ENG', 'FRA']]).utterance)
+
+class TemplateTest(unittest.TestCase):
+  """ Tests that messages form English with the template named by their ancestry, shared by every message in the same context. """
+  def test(self):
+    self.assertEqual(PRESSGLOSS.templatename(('PRP',)), 'prpenglish')
+    self.assertEqual(PRESSGLOSS.templatename(('PRP', 'IFF', 'REJ')), 'prpenglish')
+    self.assertEqual(PRESSGLOSS.templatename(('NAR', 'PRP', 'YES')), 'yesprpnarenglish')
+    self.assertEqual(PRESSGLOSS.templatename(('FCT', 'HUH')), 'huhfctenglish')
+    self.assertEqual(PRESSGLOSS.templatename(('AND', 'PRP')), 'listenglish')
+    self.assertEqual(PRESSGLOSS.templatename(('NOT',)), 'invalidenglish')
+    self.assertIsNone(PRESSGLOSS.templatename(('FCT', 'YES')))
+    self.assertIsNone(PRESSGLOSS.templatename(('NOT', 'AND', 'PRP')))
+    utterance = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (YES (PRP (NOT (DMZ (ENG FRA) (BEL HOL)))))', ['Objective'])
+    self.assertTrue('Ahem' not in utterance.english)
+    message = utterance.content.details.details.proposition
+    self.assertEqual(message.container.path, ('NOT', 'PRP', 'YES'))
+    self.assertEqual(PRESSGLOSS.englishtemplate(message), PRESSGLOSS.PressDMZ.yesprpnotenglish)
+    other = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (YES (PRP (NOT (PCE (ENG FRA)))))', ['Objective'])
+    self.assertIs(other.content.details.details.proposition.container, message.container)
+    self.assertEqual(PRESSGLOSS.englishtemplate(other.content.details.details.proposition), PRESSGLOSS.PressPeace.yesprpnotenglish)
+    self.assertTrue('Ahem' in PRESSGLOSS.daide2gloss('FRM (ENG) (FRA) (PCE (ENG FRA))', ['Objective']))
+    self.assertTrue('Ahem' in PRESSGLOSS.daide2gloss('FRM (ENG) (FRA) (YES (FCT (PCE (ENG FRA))))', ['Objective']))
+    # ever deeper nesting makes ever more ancestries, of which only the most recently used are kept
+    import collections
+    Container = collections.namedtuple('Container', ['operator', 'container'])
+    deepest = None
+    for curdepth in range(PRESSGLOSS.ancestries.maxsize + 100):
+      deepest = PRESSGLOSS.ancestryof(Container('AND', deepest))
+    self.assertEqual(len(deepest.path), PRESSGLOSS.ancestries.maxsize + 100)
+    self.assertLessEqual(PRESSGLOSS.ancestries.stats()['size'], PRESSGLOSS.ancestries.maxsize)
+    self.assertLessEqual(PRESSGLOSS.englishtemplates.stats()['size'], PRESSGLOSS.englishtemplates.maxsize)
+    self.assertEqual(PRESSGLOSS.englishtemplate(message), PRESSGLOSS.PressDMZ.yesprpnotenglish)
+
+class PhraseTest(unittest.TestCase):
+  """ Tests that the phrase banks load as tuples, select by index or random number generator, and cover every bank the messages use. """
+  def test(self):
+    import re
+    import random
+    self.assertEqual(helpers.phrasebanks['peacetreaty'], ('peace treaty', 'peace deal', 'non-agression pact', 'cease-fire'))
+    self.assertEqual(helpers.phrase('peacetreaty', index=2), 'non-agression pact')
+    self.assertEqual(helpers.phrase('peacetreaty', random.Random(5)), random.Random(5).choice(['peace treaty', 'peace deal', 'non-agression pact', 'cease-fire']))
+    self.assertTrue(helpers.phrase('agree') in ('agree', 'concur'))
+    with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'pressgloss', 'core.py'), 'r', encoding='utf-8') as corefile:
+      used = set(re.findall(r"helpers\.phrasebanks\['([a-z]+)'\]", corefile.read()))
+    self.assertEqual(used, set(helpers.phrasebanks.keys()))
+    for curbank in helpers.phrasebanks.values():
+      self.assertTrue(isinstance(curbank, tuple) and len(curbank) > 0)
+
+class RenderContextTest(unittest.TestCase):
+  """ Tests that a message asked for its English again within one rendering pass answers without forming it again, and that the pass lets go of it. """
+  def test(self):
+    curdaide = 'FRM (ENG) (FRA) (IFF (AND (PCE (ENG FRA)) (DRW)) (PRP (ORR (SLO (ENG)) (DRW))))'
+    utterance = PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=3)
+    english = utterance.english
+    self.assertTrue('Ahem' not in english)
+    self.assertIsNone(utterance.renders)
+    self.assertIsNone(utterance.content.antecedent.simpleenglish)
+    self.assertEqual(utterance.content.antecedent.english, 'Ahem.')
+    conjunction = utterance.content.antecedent
+    utterance.renders = {}
+    first = conjunction.formlistenglish()
+    state = utterance.rng.getstate()
+    self.assertEqual(conjunction.formlistenglish(), first)
+    self.assertEqual(conjunction.formclauseenglish(), first)
+    self.assertEqual(utterance.rng.getstate(), state)
+    self.assertEqual(len(utterance.renders), 2 + len(conjunction.conjuncts))
+    utterance.renders = None
+    utterance.formenglish()
+    self.assertEqual(utterance.english, english)
+    retained = PRESSGLOSS.PressUtterance(curdaide, ['Objective'], seed=3, retaintext=True)
+    self.assertEqual(retained.english, english)
+    self.assertIsNotNone(retained.content.antecedent.simpleenglish)
+
+class RegistryTest(unittest.TestCase):
+  """ Tests operator registration and registry dispatch. """
+  def test(self):
+    built = PRESSGLOSS.messageFactory(None, None, helpers.daide2lists('XDO ((ENG AMY LVP) MTO YOR)'))
+    self.assertIsInstance(built.details, PRESSGLOSS.PressMoveInto)
+    built = PRESSGLOSS.messageFactory(None, None, helpers.daide2lists('XDO ((ENG AMY WAL) SUP (FRA FLT MAO) MTO IRI)'))
+    self.assertIsInstance(built.details, PRESSGLOSS.PressSupportMove)
+    self.assertEqual(type(PRESSGLOSS.messageFactory(None, None, ['QRY', ['PCE', ['ENG', 'FRA']]])), PRESSGLOSS.PressMessage)
+    PRESSGLOSS.register_operator('QRY', PressQuery)
+    try:
+      built = PRESSGLOSS.messageFactory(None, None, ['QRY', ['PCE', ['ENG', 'FRA']]])
+      self.assertIsInstance(built, PressQuery)
+      self.assertIsInstance(built.details, PRESSGLOSS.PressPeace)
+      self.assertIsInstance(PRESSGLOSS.randomFactory(None, None, 'QRY'), PressQuery)
+    finally:
+      del PRESSGLOSS.pressoperators['QRY']
+      del PRESSGLOSS.randomoperators['QRY']
+
+class GlossManyTest(unittest.TestCase):
+  """ Tests batch glossing with per-item errors. """
+  def test(self):
+    batch = [peaceexprs[0], 'FRM (ENG) (FRA) (PRP (PCE (FRA ENG)', peaceexprs[0], '', peaceexprs[1]]
+    for curworkers, curchunksize in [(1, 5), (2, 2)]:
+      results = list(PRESSGLOSS.daide2gloss_many(batch, ['Objective'], workers=curworkers, chunksize=curchunksize))
+      self.assertEqual(len(results), len(batch))
+      self.assertIsNone(results[0][1])
+      self.assertEqual(results[0], results[2])
+      self.assertEqual(results[1][0], 'Ahem.')
+      self.assertTrue('Unclosed parenthesis' in results[1][1])
+      self.assertEqual(results[3], ('Ahem.', 'Empty DAIDE expression'))
+      self.assertTrue('Ahem' not in results[4][0])
+
+class ParseCacheTest(unittest.TestCase):
+  """ Tests the LRU cache of parsed DAIDE expressions. """
+  def test(self):
+    cache = helpers.LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    self.assertEqual(cache.get('a'), 1)
+    cache.put('c', 3)
+    self.assertIsNone(cache.get('b'))
+    self.assertEqual(cache.stats(), {'hits': 1, 'misses': 1, 'evictions': 1, 'size': 2, 'maxsize': 2})
+    self.assertEqual(helpers.normalizedaide('frm ( ENG)(FRA  ITA) (PRP (PCE (FRA ITA) ))'), helpers.normalizedaide(parsetests[0]))
+    first = PRESSGLOSS.PressUtterance(channeltest, [])
+    hits = PRESSGLOSS.parsecache.stats()['hits']
+    second = PRESSGLOSS.PressUtterance(channeltest.lower(), [])
+    self.assertEqual(PRESSGLOSS.parsecache.stats()['hits'], hits + 1)
+    self.assertEqual(first.formDAIDE(), channelanswer)
+    self.assertEqual(second.formDAIDE(), channelanswer)
+
 class PowerListTest(unittest.TestCase):
   """ Tests building lists of countries from trigrams. """
   def test(self):
@@ -531,6 +737,380 @@ class GameLogTest(unittest.TestCase):
           totmsg += len(curphase['messages'])
       self.assertEqual(totmsg, numberofmsgs[clogfile], 'The number of messages in ' + testlogs[clogfile] + ' should be ' + str(numberofmsgs[clogfile]))
 
+class GymTest(unittest.TestCase):
+  """ Tests parallel analysis of a folder of game logs. """
+  def test(self):
+    resourcedir = helpers.getresourcefolder()
+    with tempfile.TemporaryDirectory() as gymdir:
+      for curlogfile in ['umd_jata_cynn_1.json', 'umd_jata_cynn_2.json']:
+        shutil.copy(os.path.join(resourcedir, curlogfile), gymdir)
+      with open(os.path.join(gymdir, 'config.json'), 'w', encoding='utf-8') as configfile:
+        configfile.write('[1, 2, 3]')
+      analyzed = GAMELOG.analyzegym(gymdir, workers=2)
+      self.assertEqual(len(analyzed), 2)
+      self.assertFalse(os.path.isfile(os.path.join(gymdir, 'config_gloss.json')))
+      self.assertTrue(os.path.isfile(os.path.join(gymdir, 'umd_jata_cynn_1_gloss.json')))
+      self.assertTrue(os.path.isfile(os.path.join(gymdir, 'umd_jata_cynn_2_pretty.json')))
+      with open(os.path.join(gymdir, 'moves.csv'), 'r', encoding='utf-8') as movesfile:
+        moves = list(csv.DictReader(movesfile))
+      self.assertTrue(len(moves) > 0)
+      self.assertEqual(list(moves[0].keys()), GAMELOG.promisecols)
+      brokenpath = os.path.join(gymdir, 'broken.json')
+      with open(brokenpath, 'w', encoding='utf-8') as brokenfile:
+        brokenfile.write('{"id": "broken", "phases": [{"name": "S1901M"}, {"name"')
+      with self.assertRaises(json.JSONDecodeError):
+        GAMELOG.analyzegame(brokenpath)
+      with self.assertRaises(json.JSONDecodeError):
+        GAMELOG.prettifygamefile(brokenpath, os.path.join(gymdir, 'broken_pretty.json'))
+      self.assertEqual([curfile for curfile in os.listdir(gymdir) if curfile.endswith('.tmp')], [])
+
+class StreamTest(unittest.TestCase):
+  """ Tests that game logs streamed a phase at a time are written as json.dump would. """
+  def test(self):
+    with open(os.path.join(helpers.getresourcefolder(), 'umd_jata_cynn_2.json'), 'r', encoding='utf-8') as logfile:
+      logtext = logfile.read()
+    curgame = json.loads(logtext)
+    entries = list(GAMELOG.iterategamelog(io.StringIO(logtext)))
+    self.assertEqual(len([curentry for curentry in entries if curentry[2]]), len(curgame['phases']))
+    for curtext in [logtext, '{}', '{"id": "x", "phases": [], "map": 1.5e3}']:
+      written = []
+      writer = GAMELOG.GameLogWriter(written.append)
+      for curkey, curvalue, streamed in GAMELOG.iterategamelog(io.StringIO(curtext)):
+        if streamed:
+          writer.writeitem(curkey, curvalue)
+        else:
+          writer.writeentry(curkey, curvalue)
+      writer.close()
+      self.assertEqual(''.join(written), json.dumps(json.loads(curtext), indent=2))
+    annotated = json.loads(''.join(GAMELOG.streamannotatedlog(io.StringIO(logtext))))
+    self.assertEqual(annotated['id'], curgame['id'] + '_gloss')
+    self.assertEqual(len(annotated['phases']), len(curgame['phases']))
+
+class AnnotateRequestTest(unittest.TestCase):
+  """ Tests that the annotation endpoint turns away malformed game logs before it starts streaming. """
+  def test(self):
+    import pressgloss
+    client = pressgloss.create_app().test_client()
+    for curbody in [b'{"id": "x", "phases": [{"na', b'[1, 2, 3]', b'not json', b'{"phases": [1]}', b'{"id": 5, "phases": [{}]}',
+                    b'{"phases": [{"messages": [{"message": "FRM"}]}]}', b'{"id": "\xff", "phases": []}']:
+      self.assertEqual(client.post('/annotategamelog', data=curbody).status_code, 400)
+    response = client.post('/annotategamelog', data=b'{"id": "x", "phases": [{"name": "S1901M", "messages": []}]}')
+    self.assertEqual(response.status_code, 200)
+    self.assertEqual(json.loads(response.data)['id'], 'x_gloss')
+
+class StubModelHandler(http.server.BaseHTTPRequestHandler):
+  """ Answers chat completions with the last English it was sent, after first turning every other request away. """
+
+  def do_POST(self): # type: () -> None
+    """ Answers a request. """
+
+    request = json.loads(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+    self.server.requests += 1
+    if self.server.requests % 2 == 1:
+      self.send_response(429)
+      self.send_header('Retry-After', '0')
+      self.end_headers()
+      return
+    body = json.dumps({'choices': [{'message': {'role': 'assistant', 'content': 'FRM ' + request['messages'][-1]['content']}}]}).encode('utf-8')
+    self.send_response(200)
+    self.send_header('Content-Type', 'application/json')
+    self.send_header('Content-Length', str(len(body)))
+    self.end_headers()
+    self.wfile.write(body)
+
+  def log_message(self, *args): # type: (...) -> None
+    """ Keeps the test output quiet. """
+
+class TranslatorTest(unittest.TestCase):
+  """ Tests that the translator bounds requests in flight, retries with backoff and gives up on hopeless requests. """
+  def test(self):
+    repair = lambda content: (content, None if content.startswith('FRM') else 'not DAIDE')
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), StubModelHandler)
+    server.requests = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+      transport = TRANSLATOR.HTTPTransport('http://127.0.0.1:' + str(server.server_address[1]), apikey='test')
+      translator = TRANSLATOR.AsyncTranslator(transport=transport, concurrency=4, backoff=0.01, repair=repair, seed=0)
+      englishes = ['(ENG) (FRA) (PCE (ENG FRA)) ' + str(curiter) for curiter in range(12)]
+      self.assertEqual(asyncio.run(translator.translatemany(englishes)), ['FRM ' + curenglish for curenglish in englishes])
+      self.assertEqual(translator.stats['retries'], 12)
+      translator.close()
+    finally:
+      server.shutdown()
+      server.server_close()
+
+    inflight = [0, 0]
+    async def slowtransport(route, payload, timeout):
+      inflight[0] += 1
+      inflight[1] = max(inflight)
+      await asyncio.sleep(0.01)
+      inflight[0] -= 1
+      if payload['messages'][-1]['content'] == 'hopeless':
+        raise TRANSLATOR.TransportError('HTTP 400', False, 400)
+      return {'choices': [{'message': {'content': 'HUH'}}]}
+    translator = TRANSLATOR.AsyncTranslator(transport=slowtransport, concurrency=3, backoff=0.01, repair=repair)
+    self.assertEqual(asyncio.run(translator.translatemany(['hopeless'] + ['unparsable'] * 9)), ['HUH?'] * 10)
+    self.assertEqual(inflight[1], 3)
+    self.assertEqual(translator.stats['failures'], 1)
+    self.assertEqual(translator.stats['retries'], 0)
+    self.assertEqual(translator.stats['requests'], 19)
+
+    async def emptytransport(route, payload, timeout):
+      return {'choices': []}
+    translator = TRANSLATOR.AsyncTranslator(transport=emptytransport, repair=repair)
+    self.assertEqual(asyncio.run(translator.translatemany(['empty'] * 3)), ['HUH?'] * 3)
+    self.assertEqual(translator.stats['malformed'], 3)
+    self.assertEqual(translator.stats['failures'], 0)
+
+class FewShotTest(unittest.TestCase):
+  """ Tests that few-shot examples are valid, come from the matching kind of press and are shared between calls. """
+  def test(self):
+    pool = TRANSLATOR.getfewshotpool()
+    self.assertIs(pool, TRANSLATOR.getfewshotpool())
+    self.assertEqual(pool.families, list(PRESSGLOSS.randompress))
+    for curfamily in pool.families:
+      curexamples = pool.messages[curfamily]
+      self.assertEqual(pool.family(curexamples[0]['content']), curfamily)
+      self.assertIs(pool.select(curexamples[0]['content']), pool.select(curexamples[0]['content']))
+      self.assertEqual(len(pool.select(curexamples[0]['content'])), 8)
+      self.assertTrue(all(['(' + curfamily + ' ' in curexample['content'] for curexample in curexamples[1::2]]))
+    self.assertFalse(TRANSLATOR.validfewshot({'prompt': 'Peace?', 'completion': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA))'}))
+    with tempfile.TemporaryDirectory() as pooldir:
+      TRANSLATOR.writefewshotpool(os.path.join(pooldir, 'fewshot.json'), 2, 5)
+      smallpool = TRANSLATOR.getfewshotpool(os.path.join(pooldir, 'fewshot.json'))
+      self.assertEqual([len(curmessages) for curmessages in smallpool.messages.values()], [4] * len(PRESSGLOSS.randompress))
+      self.assertNotEqual(smallpool.version, pool.version)
+
+class TranslationCacheTest(unittest.TestCase):
+  """ Tests that repeated translations are answered from the cache, which expires, evicts and persists entries. """
+  def test(self):
+    calls = []
+    async def echotransport(route, payload, timeout):
+      calls.append(payload['messages'][-1]['content'])
+      return {'choices': [{'message': {'content': 'FRM ' + payload['messages'][-1]['content']}}]}
+    repair = lambda content: (content, None)
+    with tempfile.TemporaryDirectory() as cachedir:
+      cache = TRANSLATOR.TranslationCache(os.path.join(cachedir, 'translations.sqlite'), maxentries=10)
+      translator = TRANSLATOR.AsyncTranslator(transport=echotransport, repair=repair, cache=cache)
+      self.assertEqual(asyncio.run(translator.translatemany(['(ENG) (FRA) peace', '(ENG)  (FRA) Peace', '(ENG) (FRA) war'], tones=['Haughty'])),
+                       ['FRM (ENG) (FRA) peace', 'FRM (ENG) (FRA) peace', 'FRM (ENG) (FRA) war'])
+      self.assertEqual(len(calls), 2)
+      self.assertEqual(translator.stats['coalesced'], 1)
+      self.assertEqual(asyncio.run(translator.translate('(ENG) (FRA) WAR', tones=['Haughty'])), 'FRM (ENG) (FRA) war')
+      asyncio.run(translator.translate('(ENG) (FRA) peace', tones=['Friendly']))
+      asyncio.run(translator.translate('(ENG) (FRA) peace', [{'role': 'user', 'content': 'x'}, {'role': 'assistant', 'content': 'y'}], ['Haughty']))
+      self.assertEqual(len(calls), 4)
+      self.assertEqual(cache.stats()['hits'], 1)
+      cache.close()
+
+      cache = TRANSLATOR.TranslationCache(os.path.join(cachedir, 'translations.sqlite'), maxentries=10)
+      self.assertEqual(cache.stats()['size'], 4)
+      translator = TRANSLATOR.AsyncTranslator(transport=echotransport, repair=repair, cache=cache)
+      asyncio.run(translator.translatemany(['(ENG) (FRA) war'] + ['(ENG) (FRA) ' + str(curiter) for curiter in range(10)], tones=['Haughty']))
+      self.assertEqual(len(calls), 14)
+      self.assertEqual(cache.stats()['hits'], 1)
+      self.assertLessEqual(cache.stats()['size'], 10)
+      self.assertGreater(cache.stats()['evictions'], 0)
+      self.assertEqual(asyncio.run(translator.translate('(ENG) (FRA) 9', tones=['Haughty'])), 'FRM (ENG) (FRA) 9')
+      self.assertEqual(len(calls), 14)
+      cache.ttl = -1
+      self.assertIsNone(cache.get(TRANSLATOR.translationkey('(ENG) (FRA) 9', ['Haughty'], translator.model, TRANSLATOR.promptversion())))
+      self.assertEqual(cache.stats()['expirations'], 1)
+      cache.close()
+
+      # putting a key again replaces its translation without growing the cache
+      cache = TRANSLATOR.TranslationCache(':memory:')
+      key = TRANSLATOR.translationkey('(ENG) (FRA) peace', None, 'model', TRANSLATOR.promptversion())
+      for curdaide in ['FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))', 'FRM (ENG) (FRA) (PRP (PCE (FRA ENG)))']:
+        cache.put(key, curdaide)
+      self.assertEqual(cache.stats()['size'], 1)
+      self.assertEqual(cache.get(key), 'FRM (ENG) (FRA) (PRP (PCE (FRA ENG)))')
+      cache.close()
+    # glossing the same English back without tones finds the translation already made, once it parses, which takes daidepp
+    if importlib.util.find_spec('daidepp') is not None:
+      import pressgloss.daide_translate as DAIDE
+      daidetransport = lambda route, payload, timeout: echotransport(route, {'messages': [{'content': '(ENG) (FRA) (PRP (PCE (ENG FRA)))'}]}, timeout)
+      defaultcache = TRANSLATOR.translationcaches.get(None)
+      TRANSLATOR.translationcaches[None] = TRANSLATOR.TranslationCache(':memory:')
+      try:
+        glossed = [DAIDE.gloss2daide('England and France should be at peace.', transport=daidetransport) for curiter in range(3)]
+        self.assertEqual([curglossed.daide for curglossed in glossed], ['FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))'] * 3)
+        self.assertEqual(TRANSLATOR.translationcaches[None].stats()['hits'], 2)
+      finally:
+        TRANSLATOR.translationcaches[None].close()
+        if defaultcache is None:
+          del TRANSLATOR.translationcaches[None]
+        else:
+          TRANSLATOR.translationcaches[None] = defaultcache
+
+class ValidationTest(unittest.TestCase):
+  """ Tests that validation streams a result per example against a mock model and resumes an interrupted run where it stopped. """
+  def test(self):
+    import pressgloss.validation as VALIDATION
+    with tempfile.TemporaryDirectory() as validationdir:
+      outpath = os.path.join(validationdir, 'validation.jsonl')
+      whole = VALIDATION.validate(outpath, 60, seed=5, concurrency=8, transport=VALIDATION.mockmodel(60, 5, accuracy=1.0, latency=0.001), repair=VALIDATION.pressglossrepair)
+      self.assertEqual(whole['examples'], 60)
+      self.assertEqual(whole['accuracy'], 100.0)
+      self.assertEqual(whole['parserate'], 100.0)
+      self.assertIsNotNone(whole['latency']['p99'])
+      with open(outpath, 'r', encoding='utf-8') as outfile:
+        lines = outfile.readlines()
+      self.assertEqual(len(lines), 61)
+      self.assertEqual(json.loads(lines[0])['run']['seed'], 5)
+      # cut the run off partway through a line, with a model that now never answers correctly
+      with open(outpath, 'w', encoding='utf-8') as outfile:
+        outfile.write(''.join(lines[:41]) + lines[41][:20])
+      resumed = VALIDATION.validate(outpath, 60, seed=5, concurrency=8, transport=VALIDATION.mockmodel(60, 5, accuracy=0.0, latency=0.001), repair=VALIDATION.pressglossrepair)
+      self.assertEqual(resumed['resumed'], 40)
+      self.assertEqual(resumed['examples'], 60)
+      self.assertAlmostEqual(resumed['accuracy'], 100.0 * 40 / 60)
+      with open(outpath, 'r', encoding='utf-8') as outfile:
+        indices = [json.loads(curline)['index'] for curline in outfile.readlines()[1:]]
+      self.assertEqual(sorted(indices), list(range(60)))
+      with self.assertRaises(ValueError):
+        VALIDATION.validate(outpath, 60, seed=6, transport=VALIDATION.mockmodel(60, 6))
+      # with half the examples cached, only the cache hits themselves are marked cached, however the workers interleave
+      cache = TRANSLATOR.TranslationCache(':memory:')
+      VALIDATION.validate(None, 30, seed=5, concurrency=8, transport=VALIDATION.mockmodel(60, 5, latency=0.02), cache=cache, repair=VALIDATION.pressglossrepair)
+      cachedpath = os.path.join(validationdir, 'cached.jsonl')
+      VALIDATION.validate(cachedpath, 60, seed=5, concurrency=8, transport=VALIDATION.mockmodel(60, 5, latency=0.02), cache=cache, repair=VALIDATION.pressglossrepair)
+      with open(cachedpath, 'r', encoding='utf-8') as outfile:
+        records = [json.loads(curline) for curline in outfile.readlines()[1:]]
+      self.assertTrue(any([currecord['cached'] for currecord in records]))
+      self.assertEqual([currecord for currecord in records if currecord['cached'] and currecord['seconds'] > 0.01], [])
+
+class CorpusTest(unittest.TestCase):
+  """ Tests that generated corpora are unique, follow the press distribution and do not depend on the workers. """
+  def test(self):
+    import pressgloss.corpus as CORPUS
+    single = list(CORPUS.iteratecorpus(120, seed=3, chunksize=25))
+    pooled = list(CORPUS.iteratecorpus(120, seed=3, workers=2, chunksize=25))
+    self.assertEqual(single, pooled)
+    self.assertEqual(len(set([curexample['completion'] for curexample in single])), 120)
+    facts = list(CORPUS.iteratecorpus(30, seed=3, chunksize=10, operators=CORPUS.parseoperators('FCT:2')))
+    self.assertTrue(all([curexample['completion'].startswith('FRM') and '(FCT (' in curexample['completion'] for curexample in facts]))
+    with tempfile.TemporaryDirectory() as corpusdir:
+      stats = CORPUS.writecorpus(os.path.join(corpusdir, 'corpus.csv'), 50, seed=4, chunksize=20)
+      self.assertEqual(stats['written'], 50)
+      with open(os.path.join(corpusdir, 'corpus.csv'), 'r', encoding='utf-8') as corpusfile:
+        self.assertEqual(len(list(csv.DictReader(corpusfile))), 50)
+
+class SeedTest(unittest.TestCase):
+  """ Tests that a DAIDE expression, tones and seed always give the same gloss. """
+  def test(self):
+    curdaide = 'FRM (ENG) (FRA ITA) (PRP (AND (PCE (FRA ITA)) (XDO ((ENG AMY LVP) RTO YOR))))'
+    for curtones in [['Friendly', 'Urgent'], ['Hostile'], ['Objective']]:
+      glosses = set([PRESSGLOSS.daide2gloss(curdaide, curtones, seed=42) for curiter in range(20)])
+      self.assertEqual(len(glosses), 1)
+    first = PRESSGLOSS.PressUtterance(None, ['Friendly'], seed='shard-7')
+    second = PRESSGLOSS.PressUtterance(None, ['Friendly'], seed='shard-7')
+    self.assertEqual(first.daide, second.daide)
+    self.assertEqual(first.english, second.english)
+    self.assertEqual(first.english, PRESSGLOSS.daide2gloss(first.daide, ['Friendly'], seed='shard-7'))
+
+class TonePlanTest(unittest.TestCase):
+  """ Tests that tones are chosen by the top-level press, worked out once per gloss. """
+  def test(self):
+    utterance = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (CCL (PRP (PCE (ENG FRA))))', ['Urgent'])
+    self.assertTrue(utterance.english.endswith(' No time to consider that for now.'))
+    self.assertEqual(utterance.toneplan, ('CCL', helpers.urgenttone, True, False))
+    utterance.formenglish(['Friendly', 'Urgent'])
+    self.assertEqual(utterance.toneplan[:2], ('CCL', helpers.friendlytone))
+    fact = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (FCT (XDO ((ENG FLT LON) HLD)))', ['Hostile'])
+    self.assertTrue(fact.english.startswith('You are getting in my way'))
+    huh = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA) (HUH (PRP (PCE (ENG FRA))))', ['Haughty', 'PigLatin'])
+    self.assertEqual(huh.english, PRESSGLOSS.PressUtterance(huh.daide, ['Objective']).english)
+    # proposals to several powers get wording of their own
+    many = PRESSGLOSS.PressUtterance('FRM (ENG) (FRA GER) (PRP (PCE (ENG FRA GER)))', ['Obsequious'])
+    self.assertTrue(many.english.startswith('Oh great Powers of Europe, please hear me out. '))
+    self.assertTrue(many.english.endswith('. Respectfully, the nation of ' + helpers.powerdict['ENG']['Objective'] + '.'))
+    many.formenglish(['Hostile'])
+    self.assertTrue(many.english.startswith('You two think you\'ve got it all figured out.'))
+    self.assertTrue(many.english.endswith(' your response.'))
+
+class ReferenceTest(unittest.TestCase):
+  """ Tests that reference data loads from its snapshot only while the snapshot matches the CSV. """
+  def test(self):
+    self.assertEqual(helpers.loadreference(), helpers.readreference())
+    self.assertTrue(isinstance(helpers.powerlist, tuple))
+    self.assertTrue('ENG' in helpers.powerset and 'LON' in helpers.provinceset and 'NTH' in helpers.seaset)
+    with tempfile.TemporaryDirectory() as refdir:
+      csvpath = os.path.join(refdir, 'reference.csv')
+      snapshotpath = os.path.join(refdir, 'reference.pickle')
+      shutil.copy(helpers.refPath, csvpath)
+      helpers.writereferencesnapshot(csvpath, snapshotpath)
+      self.assertEqual(helpers.loadreference(csvpath, snapshotpath), helpers.refData)
+      with open(csvpath, 'a', encoding='utf-8') as csvfile:
+        csvfile.write('XXX,Province,Nowhere,Nowhere,Nowhere,Nowherean,0,0,0\n')
+      self.assertEqual(helpers.loadreference(csvpath, snapshotpath)[-1]['trigram'], 'XXX')
+
+# A small part of the DAIDE grammar, with daidepp's rule names, for repairing against
+repairgrammar = r'''
+message = "FRM" ws lpar powers rpar ws lpar powers rpar ws lpar press_message rpar
+press_message = prp / yes
+prp = "PRP" ws lpar arrangement rpar
+yes = "YES" ws lpar press_message rpar
+arrangement = pce / xdo
+pce = "PCE" ws lpar powers rpar
+xdo = "XDO" ws lpar lpar power ws unit ws province rpar ws "HLD" rpar
+unit = "AMY" / "FLT"
+province = ~"[A-Z]{3}"
+powers = power (ws power)*
+power = "ENG" / "FRA" / "GER"
+ws = ~" *"
+lpar = "(" ws
+rpar = ws ")"
+'''
+
+repairtests = {'frm (eng) (fra) (prp (pce (eng fra)': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))',
+               'Sure! Here it is: FRM (ENG) (FRA) (PCE (ENG FRA))': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))',
+               'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))) Thanks!': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))',
+               'FRM (ENG) (FRA) (YES (PCE (ENG FRA)))': 'FRM (ENG) (FRA) (YES (PRP (PCE (ENG FRA))))',
+               'FRM (ENG) (FRA) (PRP (PCE (ENG XYZ FRA)))': 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))',
+               'FRM (ENG) (FRA) BNC(XXX) (PRP (XDO ((ENG A LON) HLD)))': 'FRM (ENG) (FRA) (PRP (XDO ((ENG AMY LON) HLD)))'}
+
+class RepairTest(unittest.TestCase):
+  """ Tests that model output is repaired where the grammar stops matching it, within the bound on parses. """
+  def test(self):
+    tokens, repairs = REPAIR.tokenize('```\nfrm (eng) (fra) (prp (pce (eng fra)\n```')
+    self.assertEqual(REPAIR.render(tokens)[0], 'FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))')
+    self.assertEqual(repairs, ['close'])
+    if importlib.util.find_spec('parsimonious') is not None:
+      import parsimonious
+      engine = REPAIR.RepairEngine(parsimonious.Grammar(repairgrammar).parse, maxparses=8)
+      for curattempt, curdaide in repairtests.items():
+        curresult = engine.repair(curattempt)
+        self.assertEqual(curresult['daide'], curdaide)
+        self.assertIsNone(curresult['error'])
+      hopeless = engine.repair('I would rather not say.')
+      self.assertIsNotNone(hopeless['error'])
+      self.assertLessEqual(hopeless['parses'], 8)
+      self.assertEqual(engine.repair('I would rather not say.')['parses'], 0)
+      report = engine.report()
+      self.assertEqual((report['calls'], report['repaired'], report['unrepaired'], report['remembered']), (len(repairtests) + 2, len(repairtests), 1, 1))
+      # a parser that cannot be set up is an error every time, not a failed parse
+      def unbuildable(daide):
+        raise ImportError('No grammar')
+      engine = REPAIR.RepairEngine(unbuildable)
+      for curiter in range(2):
+        with self.assertRaises(ImportError):
+          engine.check('FRM (ENG) (FRA) (PRP (PCE (ENG FRA)))')
+
+class GrammarTest(unittest.TestCase):
+  """ Tests that the daidepp grammar is built on first use, not on import. """
+  def test(self):
+    imported = subprocess.run([sys.executable, '-c', 'import sys, pressgloss.core; print(sorted(set(sys.modules) & {"daidepp", "bs4", "flask"}))'],
+                              cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))), capture_output=True, text=True)
+    self.assertEqual(imported.stdout.strip(), '[]')
+    cachepath = helpers.getgrammarcachepath(100)
+    if cachepath is not None:
+      self.assertTrue(cachepath.endswith('-grammar-100.pickle'))
+      self.assertTrue('-parsimonious-' + importlib.metadata.version('parsimonious') + '-' in cachepath)
+    if importlib.util.find_spec('daidepp') is not None:
+      self.assertTrue(helpers.getgrammar() is helpers.grammar)
+      self.assertEqual(helpers.error_fetch('FRM (ENG) (FRA) (PRP (PCE (FRA ENG)))')[0], 'No Error')
+
 class BadDAIDETest(unittest.TestCase):
   """ Tests some non-standard DAIDE coast symbols """
   def test(self):
@@ -560,6 +1140,28 @@ class ParseTest(unittest.TestCase):
     for curdaide in parsetests:
       self.assertEqual(len(helpers.daide2lists(curdaide)), 4)
 
+class ParseErrorTest(unittest.TestCase):
+  """ Tests coast normalization and error positions of the DAIDE tokenizer. """
+  def test(self):
+    self.assertEqual(helpers.daide2lists('XDO ((ENG AMY LVP) MTO (SPA NCS))'), ['XDO', [['ENG', 'AMY', 'LVP'], 'MTO', 'SPANCS']])
+    self.assertEqual(helpers.daide2lists('XDO ((ENG AMY LVP) MTO SPA/NC)'), ['XDO', [['ENG', 'AMY', 'LVP'], 'MTO', 'SPANCS']])
+    self.assertEqual(helpers.daide2lists('FRM (ENG) (FRA) (PRP (PCE (FRA ENG)'), [])
+    with self.assertRaises(helpers.DAIDEParseError) as unclosed:
+      helpers.daide2lists('FRM (ENG) (FRA) (PRP (PCE (FRA ENG)', strict=True)
+    self.assertEqual(unclosed.exception.position, 21)
+    with self.assertRaises(helpers.DAIDEParseError) as unbalanced:
+      helpers.daide2lists('FRM (ENG)) (FRA)', strict=True)
+    self.assertEqual(unbalanced.exception.position, 9)
+    with self.assertRaises(helpers.DAIDEParseError) as badtoken:
+      helpers.daide2lists('FRM (ENG) (FRA) (PRP (PCE (FRA-ENG)))', strict=True)
+    self.assertEqual(badtoken.exception.position, 27)
+    # positions count characters of the expression as given, even where uppercasing lengthens it
+    with self.assertRaises(helpers.DAIDEParseError) as lengthened:
+      helpers.daide2lists('FRM (Straße) (FRA)) (PCE)', strict=True)
+    self.assertEqual(lengthened.exception.position, 18)
+    self.assertEqual(helpers.daide2lists('FRM (ENG) (FR,A) (PRP (PCE (ENG, FRA)))'), ['FRM', ['ENG'], ['FR', 'A'], ['PRP', ['PCE', ['ENG', 'FRA']]]])
+    self.assertEqual(helpers.normalizedaide('FRM (ENG) (FRA,ITA)'), helpers.normalizedaide('FRM (ENG) (FRA ITA)'))
+
 class DMZTest(unittest.TestCase):
   """ Tests different DMZ press expressions in Objective tone. """
   def test(self):